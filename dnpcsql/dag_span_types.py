@@ -9,26 +9,30 @@
 # app in parsl)
 
 # facet-equivalence is not directed - even though the table has a left
-# and a right uuid, the meaning is the same either way round.
+# and a right id, the meaning is the same either way round.
 
+import argparse
 import os
-import sqlite3
+
+from dnpcsql.db import add_db_argument, add_run_id_argument, connect_read_only
 
 if __name__ == "__main__":
 
-    db_name = "dnpc.sqlite3"
-    db = sqlite3.connect(db_name,
-                         detect_types=sqlite3.PARSE_DECLTYPES |
-                         sqlite3.PARSE_COLNAMES)
+    parser = argparse.ArgumentParser()
+    add_db_argument(parser)
+    add_run_id_argument(parser)
+    args = parser.parse_args()
+
+    db = connect_read_only(args.db, args.run_ids)
     cursor = db.cursor()
 
     get_spans_query = "SELECT DISTINCT type FROM span;"
     span_type_rows = list(cursor.execute(get_spans_query))
 
-    get_subspans_query = "select distinct a.type, b.type from subspan, span as a, span as b where subspan.superspan_uuid = a.uuid and subspan.subspan_uuid = b.uuid"
+    get_subspans_query = "select distinct a.type, b.type from subspan, span as a, span as b where subspan.superspan_id = a.id and subspan.subspan_id = b.id"
     subspan_relation_rows = list(cursor.execute(get_subspans_query))
 
-    get_facet_query = "select distinct a.type, b.type from facet, span as a, span as b where facet.left_uuid = a.uuid and facet.right_uuid = b.uuid"
+    get_facet_query = "select distinct a.type, b.type from facet, span as a, span as b where facet.left_id = a.id and facet.right_id = b.id"
     facet_relation_rows = list(cursor.execute(get_facet_query))
 
     with open("tmp.dot","w") as f:
@@ -0,0 +1,82 @@
+"""Opening dnpcsql databases.
+
+The database path is taken, in order of preference, from a --db command
+line option, from the DNPCSQL_DB environment variable, or is dnpc.sqlite3
+in the current directory. It can be either an ordinary dnpcsql database,
+or a catalog of per-run shard databases (see dnpcsql.shards).
+"""
+
+import argparse
+import os
+import pathlib
+import sqlite3
+
+from typing import Iterable, Optional
+
+from dnpcsql.shards import attach_shards, is_catalog
+
+DEFAULT_DB = "dnpc.sqlite3"
+
+DB_ENV_VAR = "DNPCSQL_DB"
+
+# Settings for the read-only analysis profile. Analysis queries scan large
+# parts of the span and event tables, so each database file is memory mapped
+# (up to 1GiB) and given a larger page cache (256MiB; a negative cache_size
+# is in KiB) than sqlite's defaults.
+_READ_ONLY_SCHEMA_PRAGMAS = {"mmap_size": 1024 * 1024 * 1024,
+                             "cache_size": -262144}
+
+
+def db_path(path: Optional[str] = None) -> str:
+    if path is not None:
+        return path
+    return os.environ.get(DB_ENV_VAR, DEFAULT_DB)
+
+
+def add_db_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--db", default=None,
+                        help=f"dnpcsql database file (default: ${DB_ENV_VAR}, or {DEFAULT_DB})")
+
+
+def add_run_id_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--run-id", dest="run_ids", action="append", default=None,
+                        help="when the database is a shard catalog, only query the shard of this run "
+                             "(can be given more than once; default: all shards)")
+
+
+def connect(path: Optional[str] = None) -> sqlite3.Connection:
+    """Opens a database for importing, creating it if it does not exist."""
+    return sqlite3.connect(db_path(path))
+
+
+def connect_read_only(path: Optional[str] = None, run_ids: Optional[Iterable[str]] = None) -> sqlite3.Connection:
+    """Opens an existing database for analysis.
+
+    The database is opened read-only at the sqlite level, so several
+    analyses can run against it at once, alongside each other and without
+    risk of modifying it; and, unlike sqlite3.connect, this fails rather
+    than creating an empty database if there is no file at path.
+
+    No detect_types conversion is done: the dnpcsql tables only hold
+    integers, reals and text, which sqlite returns as Python values
+    directly.
+
+    If path is a shard catalog, the shards (or only those for run_ids) are
+    attached, and views of the span, event and other tables combine them.
+    run_ids cannot be given for an ordinary database.
+    """
+    path = db_path(path)
+    uri = pathlib.Path(path).resolve().as_uri() + "?mode=ro"
+    db = sqlite3.connect(uri, uri=True)
+
+    schemas = ["main"]
+    if is_catalog(db):
+        schemas += attach_shards(db, path, set(run_ids) if run_ids is not None else None)
+    elif run_ids is not None:
+        raise RuntimeError(f"Database {path} is not a shard catalog, so runs cannot be chosen with --run-id")
+
+    for schema in schemas:
+        for (pragma, value) in _READ_ONLY_SCHEMA_PRAGMAS.items():
+            db.execute(f"PRAGMA {schema}.{pragma} = {value}")
+    db.execute("PRAGMA query_only = ON")
+    return db
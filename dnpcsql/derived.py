@@ -0,0 +1,282 @@
+"""Derived tables, which are computed from the span / event / subspan /
+facet tables after an import, to make common analysis queries cheaper.
+
+These tables are optional: query helpers check whether they exist, and
+fall back to computing the same results from the base tables if they do
+not. Once a derived table exists, a BatchWriter keeps it up to date as it
+writes new rows.
+
+Running this module builds (or rebuilds) all of the derived tables in
+a database (see dnpcsql.db for how the database is chosen).
+"""
+
+import argparse
+import sqlite3
+
+from typing import Dict
+
+from dnpcsql.db import add_db_argument, connect
+
+
+def has_table(db: sqlite3.Connection, name: str) -> bool:
+    rows = list(db.execute("SELECT name FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)))
+    if rows != []:
+        return True
+
+    # On a shard catalog, the tables are TEMP views combining the shards,
+    # and the view for a table which is missing from some shards cannot be
+    # read (see dnpcsql.shards.attach_shards), so it counts as missing too.
+    rows = list(db.execute("SELECT name FROM sqlite_temp_master WHERE type = 'view' AND name = ?", (name,)))
+    if rows == []:
+        return False
+    try:
+        db.execute(f"SELECT 1 FROM {name} LIMIT 0")
+    except sqlite3.OperationalError:
+        return False
+    return True
+
+
+def build_span_closure(db: sqlite3.Connection) -> None:
+    """Builds span_closure, which contains a row (root_id, descendant_id,
+    depth) for every pair of spans where descendant_id can be reached from
+    root_id by following subspan relations downwards and facet relations in
+    either direction - the same spans that queries.events_for_root_span_type
+    finds with a recursive query. Every span is its own descendant, at depth
+    0. depth is the length of the shortest path from root to descendant.
+    """
+    cursor = db.cursor()
+
+    cursor.execute("DROP TABLE IF EXISTS span_closure")
+    _create_span_closure_table(cursor)
+
+    cursor.execute("CREATE TEMP TABLE closure_edge (from_id INTEGER, to_id INTEGER)")
+    cursor.execute("INSERT INTO closure_edge SELECT superspan_id, subspan_id FROM subspan")
+    cursor.execute("INSERT INTO closure_edge SELECT left_id, right_id FROM facet")
+    cursor.execute("INSERT INTO closure_edge SELECT right_id, left_id FROM facet")
+    cursor.execute("CREATE INDEX temp.closure_edge_from ON closure_edge (from_id)")
+
+    cursor.execute("INSERT INTO span_closure (root_id, descendant_id, depth) SELECT id, id, 0 FROM span_data")
+
+    # The facet relation runs in both directions, so the graph has cycles
+    # and a recursive query that tracks depth would not terminate. Instead,
+    # the closure is expanded one level at a time, breadth first, from the
+    # frontier of pairs found at the previous level; a pair that is already
+    # in the closure was found at a smaller depth, and is not expanded again.
+    cursor.execute("CREATE TEMP TABLE closure_frontier (root_id INTEGER, descendant_id INTEGER)")
+    cursor.execute("CREATE TEMP TABLE closure_next (root_id INTEGER, descendant_id INTEGER, PRIMARY KEY (root_id, descendant_id)) WITHOUT ROWID")
+    cursor.execute("INSERT INTO closure_frontier SELECT id, id FROM span_data")
+
+    depth = 0
+    while True:
+        cursor.execute("DELETE FROM closure_next")
+        cursor.execute("INSERT OR IGNORE INTO closure_next (root_id, descendant_id) "
+                       "SELECT f.root_id, e.to_id "
+                       "FROM closure_frontier AS f JOIN closure_edge AS e ON e.from_id = f.descendant_id "
+                       "WHERE NOT EXISTS (SELECT 1 FROM span_closure AS c "
+                       "                   WHERE c.root_id = f.root_id AND c.descendant_id = e.to_id)")
+        if cursor.rowcount == 0:
+            break
+        depth += 1
+        cursor.execute("INSERT INTO span_closure (root_id, descendant_id, depth) "
+                       "SELECT root_id, descendant_id, ? FROM closure_next", (depth,))
+        cursor.execute("DELETE FROM closure_frontier")
+        cursor.execute("INSERT INTO closure_frontier SELECT root_id, descendant_id FROM closure_next")
+
+    cursor.execute("DROP TABLE closure_edge")
+    cursor.execute("DROP TABLE closure_frontier")
+    cursor.execute("DROP TABLE closure_next")
+
+    db.commit()
+
+
+def _create_span_closure_table(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("CREATE TABLE IF NOT EXISTS span_closure ("
+                   "root_id INTEGER NOT NULL REFERENCES span_data (id),"
+                   "descendant_id INTEGER NOT NULL REFERENCES span_data (id),"
+                   "depth INTEGER NOT NULL,"
+                   "PRIMARY KEY (root_id, descendant_id)"
+                   ") WITHOUT ROWID")
+    # for finding the ancestors of a span, when a new subspan or facet
+    # relation is added below it.
+    cursor.execute("CREATE INDEX IF NOT EXISTS span_closure_descendant ON span_closure (descendant_id, root_id)")
+
+
+def update_span_closure(cursor: sqlite3.Cursor, new_span_ids, new_edges) -> None:
+    """Adds newly written spans and relations to an existing span_closure.
+    new_edges are directed (from, to) pairs: a subspan relation gives one
+    edge from superspan to subspan, and a facet relation gives an edge in
+    each direction.
+
+    Adding an edge from u to v connects every ancestor of u (including u) to
+    every descendant of v (including v); depths are kept as the shortest
+    path, so a pair which is already connected keeps the smaller of its
+    old and new depths.
+    """
+    cursor.executemany("INSERT OR IGNORE INTO span_closure (root_id, descendant_id, depth) VALUES (?, ?, 0)",
+                       [(span_id, span_id) for span_id in new_span_ids])
+    cursor.executemany("INSERT INTO span_closure (root_id, descendant_id, depth) "
+                       "SELECT a.root_id, b.descendant_id, a.depth + 1 + b.depth "
+                       "FROM span_closure AS a, span_closure AS b "
+                       "WHERE a.descendant_id = ? AND b.root_id = ? "
+                       "ON CONFLICT (root_id, descendant_id) DO UPDATE SET depth = min(depth, excluded.depth)",
+                       new_edges)
+
+
+def build_span_summary(db: sqlite3.Connection) -> None:
+    """Builds span_summary, which contains one row per span with the times
+    and types of its first and last events, its duration (last event time
+    minus first event time) and its number of events. A span with no events
+    has a count of 0 and nulls in the other columns. Events with the same
+    time are ordered by id.
+    """
+    cursor = db.cursor()
+
+    cursor.execute("DROP TABLE IF EXISTS span_summary")
+    _create_span_summary_table(cursor)
+
+    cursor.execute(_SPAN_SUMMARY_INSERT + " GROUP BY s.id")
+
+    db.commit()
+
+
+def _create_span_summary_table(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("CREATE TABLE IF NOT EXISTS span_summary ("
+                   "span_id INTEGER PRIMARY KEY REFERENCES span_data (id),"
+                   "type_id INTEGER NOT NULL REFERENCES span_type (id),"
+                   "first_time REAL,"
+                   "last_time REAL,"
+                   "duration REAL,"
+                   "event_count INTEGER NOT NULL,"
+                   "first_event_type_id INTEGER REFERENCES event_type (id),"
+                   "last_event_type_id INTEGER REFERENCES event_type (id)"
+                   ")")
+    # so that the durations of spans of one type, in order, can be read
+    # with a single index scan.
+    cursor.execute("CREATE INDEX IF NOT EXISTS span_summary_type_duration ON span_summary (type_id, duration)")
+
+
+# The first and last event types come from correlated subqueries, which use
+# the event_span_time index rather than aggregating over every event.
+_SPAN_SUMMARY_INSERT = """
+    INSERT OR REPLACE INTO span_summary
+           (span_id, type_id, first_time, last_time, duration, event_count,
+            first_event_type_id, last_event_type_id)
+    SELECT s.id, s.type_id, min(e.time), max(e.time), max(e.time) - min(e.time), count(e.id),
+           (SELECT type_id FROM event_data WHERE span_id = s.id ORDER BY time, id LIMIT 1),
+           (SELECT type_id FROM event_data WHERE span_id = s.id ORDER BY time DESC, id DESC LIMIT 1)
+      FROM span_data AS s LEFT JOIN event_data AS e ON e.span_id = s.id
+"""
+
+
+def update_span_summary(cursor: sqlite3.Cursor, span_ids) -> None:
+    """Recomputes the span_summary rows of the given spans, which are new
+    or have had events added to them."""
+    cursor.executemany(_SPAN_SUMMARY_INSERT + " WHERE s.id = ? GROUP BY s.id",
+                       [(span_id,) for span_id in span_ids])
+
+
+class UnionFind:
+    """Disjoint sets of span ids, with path halving and union by size. The
+    canonical member of each set is its smallest id, so that the result
+    does not depend on the order in which relations were added."""
+
+    def __init__(self) -> None:
+        self.parent: Dict[int, int] = {}
+        self.size: Dict[int, int] = {}
+        self.smallest: Dict[int, int] = {}
+
+    def find(self, x: int) -> int:
+        if x not in self.parent:
+            self.parent[x] = x
+            self.size[x] = 1
+            self.smallest[x] = x
+            return x
+        while self.parent[x] != x:
+            self.parent[x] = self.parent[self.parent[x]]
+            x = self.parent[x]
+        return x
+
+    def union(self, x: int, y: int) -> None:
+        x = self.find(x)
+        y = self.find(y)
+        if x == y:
+            return
+        if self.size[x] < self.size[y]:
+            (x, y) = (y, x)
+        self.parent[y] = x
+        self.size[x] += self.size[y]
+        self.smallest[x] = min(self.smallest[x], self.smallest[y])
+
+    def canonical(self, x: int) -> int:
+        return self.smallest[self.find(x)]
+
+
+def build_span_entity(db: sqlite3.Connection) -> None:
+    """Builds span_entity, which gives every span an entity_id: spans which
+    are connected through facet relations, in either direction, are views
+    of the same entity and have the same entity_id, which is the smallest
+    span id among them. A span with no facets is an entity on its own.
+    """
+    cursor = db.cursor()
+
+    cursor.execute("DROP TABLE IF EXISTS span_entity")
+    _create_span_entity_table(cursor)
+
+    entities = UnionFind()
+    for (left_id, right_id) in cursor.execute("SELECT left_id, right_id FROM facet"):
+        entities.union(left_id, right_id)
+
+    span_ids = [span_id for (span_id,) in cursor.execute("SELECT id FROM span_data")]
+    cursor.executemany("INSERT INTO span_entity (span_id, entity_id) VALUES (?, ?)",
+                       [(span_id, entities.canonical(span_id)) for span_id in span_ids])
+
+    db.commit()
+
+
+def _create_span_entity_table(cursor: sqlite3.Cursor) -> None:
+    cursor.execute("CREATE TABLE IF NOT EXISTS span_entity ("
+                   "span_id INTEGER PRIMARY KEY REFERENCES span_data (id),"
+                   "entity_id INTEGER NOT NULL REFERENCES span_data (id)"
+                   ")")
+    # for finding all of the spans of an entity, and for relabelling an
+    # entity when it is merged into another.
+    cursor.execute("CREATE INDEX IF NOT EXISTS span_entity_entity ON span_entity (entity_id, span_id)")
+
+
+def update_span_entity(cursor: sqlite3.Cursor, new_span_ids, new_facets) -> None:
+    """Adds newly written spans and facet relations to an existing
+    span_entity table. new_facets are (left_id, right_id) pairs. The
+    entities joined by the new facets are merged with a UnionFind, and
+    each merged entity is relabelled with the smallest entity id of its
+    parts, which is also the smallest span id among all of their spans.
+    """
+    cursor.executemany("INSERT OR IGNORE INTO span_entity (span_id, entity_id) VALUES (?, ?)",
+                       [(span_id, span_id) for span_id in new_span_ids])
+
+    entities = UnionFind()
+    for (left_id, right_id) in new_facets:
+        (left_entity,) = cursor.execute("SELECT entity_id FROM span_entity WHERE span_id = ?", (left_id,)).fetchone()
+        (right_entity,) = cursor.execute("SELECT entity_id FROM span_entity WHERE span_id = ?", (right_id,)).fetchone()
+        entities.union(left_entity, right_entity)
+
+    cursor.executemany("UPDATE span_entity SET entity_id = ? WHERE entity_id = ?",
+                       [(entities.canonical(entity_id), entity_id)
+                        for entity_id in entities.parent
+                        if entities.canonical(entity_id) != entity_id])
+
+
+if __name__ == "__main__":
+    print("dnpcsql derived table builder")
+
+    parser = argparse.ArgumentParser()
+    add_db_argument(parser)
+    args = parser.parse_args()
+
+    connection = connect(args.db)
+    print("Building span_closure")
+    build_span_closure(connection)
+    print("Building span_summary")
+    build_span_summary(connection)
+    print("Building span_entity")
+    build_span_entity(connection)
+    connection.close()
@@ -1,13 +1,29 @@
+import contextlib
+import functools
 import os
 import re
 
-from typing import Dict
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Set, Tuple
 
-from dnpcsql.importerlib import local_key_to_span_uuid, logfile_time_to_unix, store_event
+from dnpcsql.importerlib import BatchWriter, local_key_to_span_id, logfile_time_to_unix, lookup_span_id, store_event, store_subspan
+from dnpcsql.logscan import LogOffsets, LogPattern, TimeWindow, logfile_time_prefix, map_in_order, scan_log
 
 def import_htex(*,
-                cursor,
-                rundir: str):
+                writer: BatchWriter,
+                rundir: str,
+                jobs: int = 1,
+                time_window: Optional[TimeWindow] = None,
+                task_ids: Optional[Set[int]] = None,
+                offsets: Optional[LogOffsets] = None):
+    """Imports the htex logs in rundir. If jobs is more than 1, the
+    manager directories are read by that many worker processes. If
+    time_window is given, only the lines of the logs in it are imported.
+    If task_ids is given, only the htex tasks with those ids are imported,
+    though every manager and worker is. If offsets is given, only the lines
+    appended since each log was last read are imported (see
+    dnpcsql.logscan.LogOffsets)."""
 
     # look for htex logs
     # right now using a hard-coded executor name
@@ -20,9 +36,9 @@ def import_htex(*,
     # That doesn't need to happen inside the parsl importer, but suggests
     # that the htex importer should be a separate module.
 
-    htex_interchange_task_to_uuid: Dict[int, str] = {}
-    htex_manager_task_to_uuid: Dict[int, str] = {}
-    htex_worker_task_to_uuid: Dict[int, str] = {}
+    htex_interchange_task_to_span_id: Dict[int, int] = {}
+    htex_manager_task_to_span_id: Dict[int, int] = {}
+    htex_worker_task_to_span_id: Dict[int, int] = {}
 
     executor_label = "htex_Local"
 
@@ -35,51 +51,52 @@ def import_htex(*,
         re_interchange_task_to_manager = re.compile('(.*) interchange:.* Sent tasks: \[(.*)\] to manager.*$')
         # 2023-03-06 11:20:08.040 interchange:533 HTEX-Interchange(18277) MainThread process_results_incoming [DEBUG]  Removing task 3 from manager record b'4bf9bf8c1848'
         re_interchange_removing_task = re.compile('(.*) interchange:.* Removing task ([0-9]+) .*$')
-        with open(htex_interchange_filename, "r") as f:
-            for log_line in f.readlines():
-                m = re_interchange_task_to_manager.match(log_line)
-                if m:
-                    event_time = logfile_time_to_unix(m[1])
-                    tasklist = m[2]
-                    tasks = tasklist.split(", ")
-                    for task in tasks:
-                        task_id = int(task)
-
-                        htex_task_span_uuid = local_key_to_span_uuid(
-                            cursor = cursor,
-                            local_key = task_id,
-                            namespace = htex_interchange_task_to_uuid,
-                            span_type = 'parsl.executor.htex.interchange.task',
-                            description = 'from interchange.log')
-
-                        store_event(cursor=cursor,
-                                    span_uuid=htex_task_span_uuid,
-                                    event_time=event_time,
-                                    event_type='interchange_to_manager',
-                                    description='from interchange.log')
-
-                m = re_interchange_removing_task.match(log_line)
-                if m:
-                    event_time = logfile_time_to_unix(m[1])
-                    task_id = int(m[2])
-
-                    htex_task_span_uuid = local_key_to_span_uuid(
-                        cursor = cursor,
+        interchange_patterns = [LogPattern("task_to_manager", " Sent tasks: [", [re_interchange_task_to_manager]),
+                                LogPattern("removing_task", " Removing task ", [re_interchange_removing_task])]
+        for (kind, m) in scan_log(htex_interchange_filename, interchange_patterns, jobs=jobs,
+                                  time_window=time_window, line_time=logfile_time_prefix, offsets=offsets):
+            if kind == "task_to_manager":
+                event_time = logfile_time_to_unix(m[0])
+                tasklist = m[1]
+                tasks = tasklist.split(", ")
+                for task in tasks:
+                    task_id = int(task)
+                    if task_ids is not None and task_id not in task_ids:
+                        continue
+
+                    htex_task_span_id = local_key_to_span_id(
+                        writer = writer,
                         local_key = task_id,
-                        namespace = htex_interchange_task_to_uuid,
+                        namespace = htex_interchange_task_to_span_id,
                         span_type = 'parsl.executor.htex.interchange.task',
                         description = 'from interchange.log')
 
-                    store_event(cursor=cursor,
-                                span_uuid=htex_task_span_uuid,
+                    store_event(writer=writer,
+                                span_id=htex_task_span_id,
                                 event_time=event_time,
-                                event_type='interchange_removing_task',
+                                event_type='interchange_to_manager',
                                 description='from interchange.log')
 
+            elif kind == "removing_task":
+                event_time = logfile_time_to_unix(m[0])
+                task_id = int(m[1])
+                if task_ids is not None and task_id not in task_ids:
+                    continue
+
+                htex_task_span_id = local_key_to_span_id(
+                    writer = writer,
+                    local_key = task_id,
+                    namespace = htex_interchange_task_to_span_id,
+                    span_type = 'parsl.executor.htex.interchange.task',
+                    description = 'from interchange.log')
+
+                store_event(writer=writer,
+                            span_id=htex_task_span_id,
+                            event_time=event_time,
+                            event_type='interchange_removing_task',
+                            description='from interchange.log')
+
     # next, manager logs
-    # 2023-03-06 11:20:07.190 parsl:304 18294 Task-Puller [DEBUG]  Got executor tasks: [1], cumulative count of tasks: 1
-    re_manager_got_tasks = re.compile('(.*) parsl:.* Got executor tasks: \[(.+)\].*$')
-    # manager does not log the identity of task results - because it never unpacks them? not sure why that's different than the task send path?
 
     # manager logs appear under a block ID then a manager ID in the path,
     # e.g. runinfo/000/htex_Local/block-0/4bf9bf8c1848/manager.log
@@ -89,162 +106,236 @@ def import_htex(*,
 
     manager_dirs = [d for (d,df,ff) in os.walk(f"{rundir}/{executor_label}") if "manager.log" in ff]
 
-    manager_id_to_uuid: Dict[str, str] = {}
-
-    for manager_dir in manager_dirs:
-        print(f"Processing manager directory {manager_dir}")
-
-        manager_id = os.path.basename(manager_dir)
-
-        manager_span_uuid = local_key_to_span_uuid(
-            cursor = cursor,
-            local_key = manager_id,
-            namespace = manager_id_to_uuid,
-            span_type = 'parsl.executor.htex.manager',
-            description = 'from manager directory')
-
-        manager_filename = f"{manager_dir}/manager.log"
-        print(f"looking for: {manager_filename}")
-        if os.path.exists(manager_filename):
-            with open(manager_filename, "r") as f:
-                for log_line in f.readlines():
-                    m = re_manager_got_tasks.match(log_line)
-                    if m:
-                        event_time = logfile_time_to_unix(m[1])
-                        task_ids = m[2]
-                        for t in task_ids.split(", "):
-                            task_id = int(t)
-
-                            htex_task_span_uuid = local_key_to_span_uuid(
-                                cursor = cursor,
-                                local_key = task_id,
-                                namespace = htex_manager_task_to_uuid,
-                                span_type = 'parsl.executor.htex.manager.task',
-                                description = 'from manager.log')
-
-                            store_event(cursor=cursor,
-                                        span_uuid=htex_task_span_uuid,
-                                        event_time=event_time,
-                                        event_type='manager_got_task',
-                                        description='from manager.log')
-                            cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)",
-                                (manager_span_uuid,
-                                htex_task_span_uuid, task_id))
-
+    manager_id_to_span_id: Dict[str, int] = {}
+
+    # A large htex deployment can have thousands of manager directories,
+    # which are independent of each other, so reading and parsing their
+    # logs can be spread across processes (see read_manager_dir). Only
+    # this process writes: it stores each manager's spans and events in
+    # manager_dirs order, as they arrive, so that spans are allocated in
+    # the same order as they would be without the pool.
+    #
+    # If only appended lines are read, each manager directory is read with
+    # offsets of its own, holding only its own logs, which go to the
+    # worker process and come back with what it read.
+    manager_offsets: List[Optional[LogOffsets]] = [None] * len(manager_dirs)
+    if offsets is not None:
+        offsets_by_dir: Dict[str, Dict[str, Tuple[int, int]]] = {}
+        for (path, offset) in offsets.previous.items():
+            offsets_by_dir.setdefault(os.path.dirname(path), {})[path] = offset
+        manager_offsets = [LogOffsets(previous=offsets_by_dir.get(os.path.abspath(d), {})) for d in manager_dirs]
+
+    read = functools.partial(_read_manager_dir, time_window=time_window)
+    with ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else contextlib.nullcontext() as pool:
+        if pool is not None:
+            all_manager_logs: Iterable[ManagerLogs] = map_in_order(pool, read, list(zip(manager_dirs, manager_offsets)),
+                                                                   window=4 * jobs)
         else:
-            raise RuntimeError("manager log was not found in manager directory")
-
-        # next, worker logs
-        # 2023-03-06 11:20:17.249 worker_log:597 18304 MainThread [INFO]  Received executor task 41
-        re_worker_received_task = re.compile('(.*) worker_log:.* Received executor task ([^ ]+).*$')
-        # 2023-03-06 11:20:17.282 worker_log:615 18304 MainThread [INFO]  Completed executor task 41
-        re_worker_completed_task = re.compile('(.*) worker_log:.* Completed executor task ([^ ]+).*$')
-        # 2023-03-06 11:20:17.282 worker_log:626 18304 MainThread [INFO]  All processing finished for executor task 41
-        re_worker_all_finished_task = re.compile('(.*) worker_log:.* All processing finished for executor task ([^ ]+).*$')
-
-        # worker log files are in the manager directory and are named like this:
-        # runinfo/000/htex_Local/block-0/4bf9bf8c1848/worker_6.log
-
-        worker_logs = [f for f in os.listdir(manager_dir) if f.startswith("worker_")]
-
-        # this namespace is per-manager, because workers are identified by
-        # integers which are only unique within a manager.
-        worker_id_to_uuid: Dict[str, str] = {}
-
-        for worker_filename in worker_logs:
-
-            # TODO:
-            # lazily using the worker log filename, rather than
-            # pulling out the integer worker number
-            worker_id = os.path.basename(worker_filename)
-
-            worker_span_uuid = local_key_to_span_uuid(
-                cursor = cursor,
-                local_key = worker_id,
-                namespace = worker_id_to_uuid,
-                span_type = 'parsl.executor.htex.worker',
-                description = 'from worker_*.log')
-
-            cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)",
-                (manager_span_uuid,
-                worker_span_uuid, worker_id))
-
-            with open(f"{manager_dir}/{worker_filename}", "r") as f:
-                for log_line in f.readlines():
-                    m = re_worker_received_task.match(log_line)
-                    if m:
-                        event_time = logfile_time_to_unix(m[1])
-                        task_id = int(m[2])
-
-                        htex_task_span_uuid = local_key_to_span_uuid(
-                            cursor = cursor,
-                            local_key = task_id,
-                            namespace = htex_worker_task_to_uuid,
-                            span_type = 'parsl.executor.htex.worker.task',
-                            description = 'from worker_*.log')
-
-                        store_event(cursor=cursor,
-                                    span_uuid=htex_task_span_uuid,
-                                    event_time=event_time,
-                                    event_type='worker_received_task',
-                                    description='from worker_*.log')
-
-                        cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)",
-                            (worker_span_uuid,
-                            htex_task_span_uuid, task_id))
-
-                    m = re_worker_completed_task.match(log_line)
-                    if m:
-                        event_time = logfile_time_to_unix(m[1])
-                        task_id = int(m[2])
-
-                        htex_task_span_uuid = local_key_to_span_uuid(
-                            cursor = cursor,
-                            local_key = task_id,
-                            namespace = htex_worker_task_to_uuid,
-                            span_type = 'parsl.executor.htex.worker.task',
-                            description = 'from interchange.log')
-
-                        store_event(cursor=cursor,
-                                    span_uuid=htex_task_span_uuid,
-                                    event_time=event_time,
-                                    event_type='worker_completed_task',
-                                    description='from worker_*.log'
-                                   )
-
-                    m = re_worker_all_finished_task.match(log_line)
-                    if m:
-                        event_time = logfile_time_to_unix(m[1])
-                        task_id = int(m[2])
-
-                        htex_task_span_uuid = local_key_to_span_uuid(
-                            cursor = cursor,
-                            local_key = task_id,
-                            namespace = htex_worker_task_to_uuid,
-                            span_type = 'parsl.executor.htex.worker.task',
-                            description = 'from worker_*.log')
-
-                        store_event(cursor=cursor,
-                                    span_uuid=htex_task_span_uuid,
-                                    event_time=event_time,
-                                    event_type='worker_all_finished_task',
-                                    description='from worker_*.log')
+            all_manager_logs = map(read, zip(manager_dirs, manager_offsets))
+
+        for manager_logs in all_manager_logs:
+            print(f"Processing manager directory {manager_logs.manager_dir}")
+            if offsets is not None and manager_logs.offsets is not None:
+                offsets.read.update(manager_logs.offsets.read)
+
+            manager_id = manager_logs.manager_id
+
+            manager_span_id = local_key_to_span_id(
+                writer = writer,
+                local_key = manager_id,
+                namespace = manager_id_to_span_id,
+                span_type = 'parsl.executor.htex.manager',
+                description = 'from manager directory')
+
+            for (event_time, task_id) in manager_logs.got_tasks:
+                if task_ids is not None and task_id not in task_ids:
+                    continue
+                htex_task_span_id = local_key_to_span_id(
+                    writer = writer,
+                    local_key = task_id,
+                    namespace = htex_manager_task_to_span_id,
+                    span_type = 'parsl.executor.htex.manager.task',
+                    description = 'from manager.log')
+
+                store_event(writer=writer,
+                            span_id=htex_task_span_id,
+                            event_time=event_time,
+                            event_type='manager_got_task',
+                            description='from manager.log')
+                store_subspan(writer=writer,
+                              superspan_id=manager_span_id,
+                              subspan_id=htex_task_span_id,
+                              key=task_id)
+
+            # this namespace is per-manager, because workers are identified by
+            # integers which are only unique within a manager; for the same
+            # reason, deterministic worker span ids are scoped by manager.
+            worker_id_to_span_id: Dict[str, int] = {}
+
+            for (worker_id, worker_events) in manager_logs.workers:
+
+                with writer.scoped(manager_id):
+                    worker_span_id = local_key_to_span_id(
+                        writer = writer,
+                        local_key = worker_id,
+                        namespace = worker_id_to_span_id,
+                        span_type = 'parsl.executor.htex.worker',
+                        description = 'from worker_*.log')
+
+                store_subspan(writer=writer,
+                              superspan_id=manager_span_id,
+                              subspan_id=worker_span_id,
+                              key=worker_id)
+
+                for (event_type, event_time, task_id) in worker_events:
+                    if task_ids is not None and task_id not in task_ids:
+                        continue
+                    htex_task_span_id = local_key_to_span_id(
+                        writer = writer,
+                        local_key = task_id,
+                        namespace = htex_worker_task_to_span_id,
+                        span_type = 'parsl.executor.htex.worker.task',
+                        description = _worker_task_span_descriptions[event_type])
+
+                    store_event(writer=writer,
+                                span_id=htex_task_span_id,
+                                event_time=event_time,
+                                event_type=event_type,
+                                description='from worker_*.log')
+
+                    if event_type == 'worker_received_task':
+                        store_subspan(writer=writer,
+                                      superspan_id=worker_span_id,
+                                      subspan_id=htex_task_span_id,
+                                      key=task_id)
 
     # now make span bindings: all spans the should be bound together use the
-    # same htex task ID, so scan all of those:
+    # same htex task ID, so scan all of those. The other spans of a task
+    # can have been made by an earlier import, from lines of the logs before
+    # those that this import read, so they are looked up among the spans
+    # that are already there, if the writer binds to existing spans.
 
-    all_task_ids = set(htex_interchange_task_to_uuid.keys())
-    all_task_ids |= htex_manager_task_to_uuid.keys()
-    all_task_ids |= htex_worker_task_to_uuid.keys()
+    all_task_ids = set(htex_interchange_task_to_span_id.keys())
+    all_task_ids |= htex_manager_task_to_span_id.keys()
+    all_task_ids |= htex_worker_task_to_span_id.keys()
 
     for task_id in all_task_ids:
-        if task_id in htex_interchange_task_to_uuid and task_id in htex_manager_task_to_uuid:
-            cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)",
-                (htex_interchange_task_to_uuid[task_id],
-                htex_manager_task_to_uuid[task_id], task_id))
-        if task_id in htex_manager_task_to_uuid and task_id in htex_worker_task_to_uuid:
-            cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)",
-                (htex_manager_task_to_uuid[task_id],
-                htex_worker_task_to_uuid[task_id], task_id))
-
-    return htex_interchange_task_to_uuid
+        interchange_task_span_id = lookup_span_id(writer=writer,
+                                                  local_key=task_id,
+                                                  namespace=htex_interchange_task_to_span_id,
+                                                  span_type='parsl.executor.htex.interchange.task')
+        manager_task_span_id = lookup_span_id(writer=writer,
+                                              local_key=task_id,
+                                              namespace=htex_manager_task_to_span_id,
+                                              span_type='parsl.executor.htex.manager.task')
+        worker_task_span_id = lookup_span_id(writer=writer,
+                                             local_key=task_id,
+                                             namespace=htex_worker_task_to_span_id,
+                                             span_type='parsl.executor.htex.worker.task')
+        if interchange_task_span_id is not None and manager_task_span_id is not None:
+            store_subspan(writer=writer,
+                          superspan_id=interchange_task_span_id,
+                          subspan_id=manager_task_span_id,
+                          key=task_id)
+        if manager_task_span_id is not None and worker_task_span_id is not None:
+            store_subspan(writer=writer,
+                          superspan_id=manager_task_span_id,
+                          subspan_id=worker_task_span_id,
+                          key=task_id)
+
+    return htex_interchange_task_to_span_id
+
+
+@dataclass
+class ManagerLogs:
+    """The parts of one manager directory's logs that import_htex uses."""
+    manager_dir: str
+    manager_id: str
+
+    # (time, task id) for each task the manager got, in log order
+    got_tasks: List[Tuple[float, int]]
+
+    # for each worker log: the worker id, and (event type, time, task id)
+    # for each event in it, in log order
+    workers: List[Tuple[str, List[Tuple[str, float, int]]]]
+
+    # how far the logs were read, if only appended lines were read
+    offsets: Optional[LogOffsets] = None
+
+# manager.log
+# 2023-03-06 11:20:07.190 parsl:304 18294 Task-Puller [DEBUG]  Got executor tasks: [1], cumulative count of tasks: 1
+_manager_patterns = [LogPattern("got_tasks", " Got executor tasks: [",
+                                [re.compile('(.*) parsl:.* Got executor tasks: \\[(.+)\\].*$')])]
+# manager does not log the identity of task results - because it never unpacks them? not sure why that's different than the task send path?
+
+# worker_*.log: the kind of each pattern is the event type
+_worker_patterns = [
+    # 2023-03-06 11:20:17.249 worker_log:597 18304 MainThread [INFO]  Received executor task 41
+    LogPattern('worker_received_task', " Received executor task ",
+               [re.compile('(.*) worker_log:.* Received executor task ([^ ]+).*$')]),
+    # 2023-03-06 11:20:17.282 worker_log:615 18304 MainThread [INFO]  Completed executor task 41
+    LogPattern('worker_completed_task', " Completed executor task ",
+               [re.compile('(.*) worker_log:.* Completed executor task ([^ ]+).*$')]),
+    # 2023-03-06 11:20:17.282 worker_log:626 18304 MainThread [INFO]  All processing finished for executor task 41
+    LogPattern('worker_all_finished_task', " All processing finished for executor task ",
+               [re.compile('(.*) worker_log:.* All processing finished for executor task ([^ ]+).*$')]),
+]
+
+# the description of a worker task span depends on which kind of event
+# first named it.
+_worker_task_span_descriptions = {
+    'worker_received_task': 'from worker_*.log',
+    'worker_completed_task': 'from interchange.log',
+    'worker_all_finished_task': 'from worker_*.log',
+}
+
+def _read_manager_dir(item: Tuple[str, Optional[LogOffsets]], time_window: Optional[TimeWindow]) -> ManagerLogs:
+    (manager_dir, offsets) = item
+    return read_manager_dir(manager_dir, time_window=time_window, offsets=offsets)
+
+def read_manager_dir(manager_dir: str, time_window: Optional[TimeWindow] = None,
+                     offsets: Optional[LogOffsets] = None) -> ManagerLogs:
+    """Reads and parses the manager.log and worker_*.log files in one
+    manager directory. This does not touch the database, so it can run in
+    a worker process. Logs are read in bounded chunks (see dnpcsql.logscan),
+    rather than all at once, so that memory use does not grow with their
+    size. If offsets is given, only the lines appended since each log was
+    last read are read, and the offsets that they are read to are returned
+    in the ManagerLogs."""
+    manager_logs = ManagerLogs(manager_dir=manager_dir,
+                               manager_id=os.path.basename(manager_dir),
+                               got_tasks=[],
+                               workers=[],
+                               offsets=offsets)
+
+    manager_filename = f"{manager_dir}/manager.log"
+    print(f"looking for: {manager_filename}")
+    if os.path.exists(manager_filename):
+        for (_, m) in scan_log(manager_filename, _manager_patterns,
+                               time_window=time_window, line_time=logfile_time_prefix, offsets=offsets):
+            event_time = logfile_time_to_unix(m[0])
+            task_ids = m[1]
+            for t in task_ids.split(", "):
+                manager_logs.got_tasks.append((event_time, int(t)))
+    else:
+        raise RuntimeError("manager log was not found in manager directory")
+
+    # worker log files are in the manager directory and are named like this:
+    # runinfo/000/htex_Local/block-0/4bf9bf8c1848/worker_6.log
+
+    worker_logs = [f for f in os.listdir(manager_dir) if f.startswith("worker_")]
+
+    for worker_filename in worker_logs:
+
+        # TODO:
+        # lazily using the worker log filename, rather than
+        # pulling out the integer worker number
+        worker_id = os.path.basename(worker_filename)
+
+        worker_events = [(event_type, logfile_time_to_unix(m[0]), int(m[1]))
+                         for (event_type, m) in scan_log(f"{manager_dir}/{worker_filename}", _worker_patterns,
+                                                         time_window=time_window, line_time=logfile_time_prefix,
+                                                         offsets=offsets)]
+        manager_logs.workers.append((worker_id, worker_events))
+
+    return manager_logs
@@ -1,39 +1,333 @@
+import argparse
+import contextlib
+import datetime
 import os
+import pickle
 import sqlite3
 import sys
+import time
+import traceback
+
+from typing import Dict, Optional, Set
+
 import dnpcsql.parsl
 import dnpcsql.workqueue
 import dnpcsql.twoevents as twoev
-from dnpcsql.schema import create_tables
+from dnpcsql.db import add_db_argument, connect, db_path
+from dnpcsql.derived import build_span_closure, build_span_entity, build_span_summary, has_table
+from dnpcsql.importerlib import BatchWriter
+from dnpcsql.logscan import LogOffsets, TimeWindow
+from dnpcsql.manifest import (changed_run_ids, create_manifest_table, read_manifest, read_offsets, record_sources,
+                              with_read_offsets)
+from dnpcsql.sampling import TaskSample, record_sample_rate
+from dnpcsql.schema import bulk_load, create_tables
+from dnpcsql.shards import create_catalog, register_shard, shard_first_id
 
 def main() -> None:
     print("dnpcsql parsl runinfo importer")
 
-    runinfo=sys.argv[1]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("runinfo", help="parsl runinfo directory to import")
+    parser.add_argument("--batch-size", type=int, default=10000,
+                        help="number of rows to buffer before writing to the database")
+    parser.add_argument("--uuids", action="store_true",
+                        help="give each span and event a UUID as well as its integer id")
+    parser.add_argument("--deterministic", action="store_true",
+                        help="derive span and event ids from what they describe, and import into the existing "
+                             "database, ignoring spans and events which are already there, rather than replacing it")
+    parser.add_argument("--run-id", action="append", dest="run_ids",
+                        help="import only the workflow with this run id (may be given more than once)")
+    parser.add_argument("--shard", action="store_true",
+                        help="import each workflow run into its own shard database, listed in a "
+                             "catalog at the database path, replacing only the shards of the imported runs")
+    parser.add_argument("--incremental", action="store_true",
+                        help="import only the workflow runs whose source files are new or have changed since "
+                             "the last import, into the existing database (implies --deterministic)")
+    parser.add_argument("--follow", action="store_true",
+                        help="keep running, and import what has been appended to the logs of workflow runs "
+                             "every --interval seconds (implies --incremental)")
+    parser.add_argument("--interval", type=float, default=10,
+                        help="seconds between imports in --follow mode (default 10)")
+    parser.add_argument("--passes", type=int, default=None,
+                        help="in --follow mode, stop after this many imports (default: keep following until "
+                             "interrupted)")
+    parser.add_argument("--since", type=parse_time,
+                        help="import only log lines from this time on: a unix time, or a local time "
+                             "like 2023-03-06T11:20:00")
+    parser.add_argument("--until", type=parse_time,
+                        help="import only log lines up to this time (see --since)")
+    parser.add_argument("--sample-rate", type=float, default=1.0,
+                        help="import only about this fraction (between 0 and 1) of the tasks of each workflow, "
+                             "chosen by a hash of their run and task ids (default 1, every task)")
+    parser.add_argument("--add-source", action="append", dest="add_sources", choices=dnpcsql.parsl.RUNDIR_SOURCES,
+                        help="import only this source of each rundir (may be given more than once) into the existing "
+                             "database, binding it to the spans of the workflow which are already there")
+    parser.add_argument("--jobs", type=int, default=1,
+                        help="number of processes to read rundirs (or, for a single rundir, htex manager "
+                             "directories) with, in parallel")
+    add_db_argument(parser)
+    args = parser.parse_args()
+
+    runinfo = args.runinfo
     print(f"Will import from runinfo: {runinfo}")
 
-    if os.path.exists("dnpc.sqlite3"):
-        print("Removing previous dnpcsql database")
-        os.remove("dnpc.sqlite3")
+    run_ids = set(args.run_ids) if args.run_ids else None
+
+    path = db_path(args.db)
+
+    if args.since is not None or args.until is not None:
+        args.time_window = TimeWindow(since=args.since, until=args.until)
+        if args.follow or args.incremental:
+            parser.error("--since and --until cannot be used with --incremental or --follow: "
+                         "a time window imports only part of each source")
+    else:
+        args.time_window = None
+
+    if not 0 < args.sample_rate <= 1:
+        parser.error("--sample-rate must be more than 0 and at most 1")
+    args.sample = TaskSample(rate=args.sample_rate) if args.sample_rate < 1 else None
+
+    if args.add_sources and (args.follow or args.incremental):
+        parser.error("--add-source cannot be used with --incremental or --follow")
+
+    if args.passes is not None and not args.follow:
+        parser.error("--passes can only be used with --follow")
+
+    if args.follow:
+        args.incremental = True
+
+    if args.incremental:
+        args.deterministic = True
+
+    if args.add_sources:
+        add_sources(path, args, runinfo, run_ids)
+        return
+
+    if not args.follow:
+        import_runinfo(path, args, runinfo, run_ids)
+        return
+
+    # Follow mode imports a running workflow again and again. Each pass
+    # reads only the lines which have been appended to each log since the
+    # last pass, from the (inode, offset) that the manifest recorded for it,
+    # and binds them to the spans which earlier passes made from the rest
+    # of the log, which it finds by their local keys (see
+    # dnpcsql.logscan.LogOffsets and BatchWriter.bind_existing). A log which
+    # has been rotated (which has a new inode) or truncated (which is
+    # shorter than its offset) is read again from the start, and
+    # deterministic ids mean that only the spans and events which are new
+    # are added.
+    #
+    # The database is switched to WAL mode so that analysis tools can read
+    # it while it is being imported into.
+    connection = connect(path)
+    connection.execute("PRAGMA journal_mode = WAL")
+    connection.close()
+
+    passes = 0
+    try:
+        while True:
+            try:
+                import_runinfo(path, args, runinfo, run_ids)
+            except (EOFError, pickle.UnpicklingError, sqlite3.OperationalError) as e:
+                if not is_transient_error(e):
+                    raise
+                # nothing of a failed pass is recorded in the manifest, so
+                # the next pass reads the same lines again, and more.
+                print("Import failed, will try again:", file=sys.stderr)
+                traceback.print_exc()
+            passes += 1
+            if args.passes is not None and passes >= args.passes:
+                break
+            time.sleep(args.interval)
+    except KeyboardInterrupt:
+        print("Stopped following")
+
+
+def is_transient_error(e: BaseException) -> bool:
+    """Returns whether a follow pass may have failed with e only because a
+    file was caught while it was being written, or a database while another
+    connection had it locked: a pickle which is only partly written, or a
+    monitoring.db or dnpcsql database which is locked or busy. Anything else,
+    including an sqlite error such as a missing table or an SQL syntax
+    error, is a bug or a problem which will not go away by itself, so it
+    stops the importer."""
+    if isinstance(e, (EOFError, pickle.UnpicklingError)):
+        return True
+    if isinstance(e, sqlite3.OperationalError):
+        message = str(e)
+        return "locked" in message or "busy" in message
+    return False
+
+
+def import_runinfo(path: str, args: argparse.Namespace, runinfo: str, run_ids: Optional[Set[str]]) -> None:
+    # The manifest of imported sources is only kept for deterministic
+    # imports: a source can only be imported again on top of an earlier
+    # import of it if the same spans get the same ids both times. An import
+    # of a time window reads only part of each source, so it is not
+    # recorded.
+    #
+    # When following, only what has been appended to each log since it was
+    # last read is imported, from the offsets in the manifest.
+    sources = None
+    offsets = None
+    rundir_run_ids = None
+    if args.deterministic and args.time_window is None:
+        manifest_db = connect(path)
+        create_manifest_table(manifest_db)
+        manifest = read_manifest(manifest_db)
+        manifest_db.close()
+
+        print("Checking source files against the import manifest")
+        sources = dnpcsql.parsl.runinfo_sources(runinfo, manifest, appended=args.follow)
+        if args.follow:
+            offsets = LogOffsets(previous=read_offsets(manifest))
+            rundir_run_ids = dnpcsql.parsl.source_rundir_run_ids(sources)
+
+        if args.incremental:
+            changed = changed_run_ids(manifest, sources)
+            if run_ids is not None:
+                changed &= run_ids
+            if not changed:
+                print("No new or changed workflow runs to import")
+                return
+            print(f"New or changed workflow runs: {sorted(changed)}")
+            run_ids = changed
+
+    if args.shard:
+        catalog = connect(path)
+        create_catalog(catalog)
+
+        for run_id in sorted(run_ids) if run_ids else dnpcsql.parsl.list_run_ids(runinfo):
+            (shard_id, shard_path) = register_shard(catalog, path, run_id)
+            print(f"Importing run {run_id} into shard {shard_id}: {shard_path}")
+            if os.path.exists(shard_path) and not args.deterministic:
+                print("Removing previous shard database")
+                os.remove(shard_path)
+            import_into(shard_path, args, runinfo, {run_id}, shard_first_id(shard_id), offsets, rundir_run_ids)
 
+        # the analysis tools read the sample rate from the database that
+        # they are pointed at, which is the catalog
+        record_sample_rate(catalog, args.sample_rate)
+        catalog.close()
+    else:
+        if os.path.exists(path) and not args.deterministic:
+            print("Removing previous dnpcsql database")
+            os.remove(path)
 
-    connection = init_sql()
+        import_into(path, args, runinfo, run_ids, 1, offsets, rundir_run_ids)
+
+    if sources is not None:
+        imported = [s for s in sources if run_ids is None or s.run_id in run_ids]
+        if offsets is not None:
+            imported = with_read_offsets(manifest, imported, offsets.read)
+        manifest_db = connect(path)
+        record_sources(manifest_db, imported)
+        manifest_db.close()
+
+
+def import_into(path: str, args: argparse.Namespace, runinfo: str, run_ids: Optional[Set[str]], first_id: int,
+                offsets: Optional[LogOffsets] = None, rundir_run_ids: Optional[Dict[str, str]] = None) -> None:
+    connection = init_sql(path)
+
+    create_tables(connection)
+    record_sample_rate(connection, args.sample_rate)
+
+    # An incremental import adds a few runs to what may be a large
+    # database, so rebuilding all of its indexes, as bulk_load does at the
+    # end, would cost much more than maintaining them as rows are added;
+    # and the derived tables, if they already exist, are kept up to date by
+    # the writer rather than rebuilt. Any other import rebuilds the derived
+    # tables once at the end, so the writer does not maintain them as well,
+    # even if they are left over from an earlier import.
+    incremental = args.incremental and has_table(connection, "span_closure")
+
+    with contextlib.nullcontext() if incremental else bulk_load(connection):
+        # what is appended to a log binds to the spans which were imported
+        # from the rest of it before
+        writer = BatchWriter(connection, batch_size=args.batch_size, store_uuids=args.uuids, first_id=first_id,
+                             deterministic=args.deterministic, bind_existing=offsets is not None,
+                             maintain_derived_tables=incremental)
+
+        dnpcsql.parsl.import_rundir_root(writer=writer, runinfo=runinfo, run_ids=run_ids, jobs=args.jobs,
+                                         time_window=args.time_window, sample=args.sample,
+                                         offsets=offsets, known_run_ids=rundir_run_ids)
+
+        writer.commit()
+
+    if not incremental:
+        print("Building span closure")
+        build_span_closure(connection)
+
+    if not (incremental and has_table(connection, "span_summary")):
+        print("Building span summary")
+        build_span_summary(connection)
+
+    if not (incremental and has_table(connection, "span_entity")):
+        print("Building span entities")
+        build_span_entity(connection)
+
+    connection.close()
+
+
+def add_sources(path: str, args: argparse.Namespace, runinfo: str, run_ids: Optional[Set[str]]) -> None:
+    # Sources are added to the databases which the rest of their workflows
+    # were imported into: in shard mode, to the shard of each run.
+    if args.shard:
+        catalog = connect(path)
+        create_catalog(catalog)
+        for run_id in sorted(run_ids) if run_ids else dnpcsql.parsl.list_run_ids(runinfo):
+            (shard_id, shard_path) = register_shard(catalog, path, run_id)
+            print(f"Adding sources of run {run_id} to shard {shard_id}: {shard_path}")
+            add_sources_into(shard_path, args, runinfo, {run_id}, shard_first_id(shard_id))
+        catalog.close()
+    else:
+        add_sources_into(path, args, runinfo, run_ids, 1)
+
+
+def add_sources_into(path: str, args: argparse.Namespace, runinfo: str, run_ids: Optional[Set[str]],
+                     first_id: int) -> None:
+    connection = init_sql(path)
 
     create_tables(connection)
+    record_sample_rate(connection, args.sample_rate)
+
+    # Like an incremental import, this adds to what may be a large
+    # database, so indexes are maintained rather than rebuilt, and so are
+    # any derived tables.
+    writer = BatchWriter(connection, batch_size=args.batch_size, store_uuids=args.uuids, first_id=first_id,
+                         deterministic=args.deterministic, bind_existing=True)
+
+    dnpcsql.parsl.import_rundir_sources(writer=writer, runinfo=runinfo, sources=set(args.add_sources), run_ids=run_ids,
+                                        jobs=args.jobs, time_window=args.time_window, sample=args.sample)
 
-    dnpcsql.parsl.import_rundir_root(db=connection, runinfo=runinfo)
+    writer.commit()
+
+    for (table, build) in [("span_closure", build_span_closure),
+                           ("span_summary", build_span_summary),
+                           ("span_entity", build_span_entity)]:
+        if not has_table(connection, table):
+            print(f"Building {table}")
+            build(connection)
 
-    connection.commit()
     connection.close()
 
 
-def init_sql() -> sqlite3.Connection:
-    db_name = "dnpc.sqlite3"
-    db = sqlite3.connect(db_name,
-                         detect_types=sqlite3.PARSE_DECLTYPES |
-                         sqlite3.PARSE_COLNAMES)
+def parse_time(s: str) -> float:
+    """Parses a --since or --until time: a unix time, or an ISO 8601
+    date and time, in local time unless it gives a timezone."""
+    try:
+        return float(s)
+    except ValueError:
+        pass
+    try:
+        return datetime.datetime.fromisoformat(s).timestamp()
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"not a unix time or an ISO 8601 time: {s}")
+
 
-    return db
+def init_sql(path: Optional[str] = None) -> sqlite3.Connection:
+    return connect(path)
 
 if __name__ == "__main__":
     main()
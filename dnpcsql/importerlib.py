@@ -1,51 +1,475 @@
+import contextlib
 import datetime
 import sqlite3
 import uuid
 
-from typing import Dict, TypeVar
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, TypeVar
+
+from dnpcsql.derived import has_table, update_span_closure, update_span_entity, update_span_summary
 
 X = TypeVar('X')
 
-def local_key_to_span_uuid(*,
-                           cursor: sqlite3.Cursor,
-                           local_key: X,
-                           namespace: Dict[X, str],
-                           span_type: str,
-                           description: str) -> str:
+# uuid5 namespaces for deterministic span and event identities.
+_SPAN_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "dnpcsql:span")
+_EVENT_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "dnpcsql:event")
+
+
+def _uuid_to_id(u: uuid.UUID) -> int:
+    # the top 63 bits of the uuid, so that the id is a positive sqlite
+    # integer. 0 is avoided, as no rowid is ever 0 otherwise.
+    return (u.int >> 65) or 1
+
+
+class BatchWriter:
+    """Collects span, event, event attribute, subspan, facet and local key
+    rows in memory and writes them to the database with executemany, rather
+    than with one statement per row.
+
+    Buffered rows are written out whenever batch_size rows have been
+    collected, and on flush or commit. Rows are always written in the order
+    spans, events, event attributes, subspans, facets, local keys, so that a
+    flushed batch never refers to a span or event that has not been written
+    yet.
+
+    Span and event ids are allocated by the writer, so that importers can
+    refer to a span before it has been written. This assumes that only one
+    writer is adding spans to a database at once. Ids are allocated upwards
+    from first_id, or from above the largest id already in the database if
+    that is higher: a database which will be combined with others (see
+    dnpcsql.shards) can be given its own range of ids this way.
+
+    If store_uuids is False (the default), spans and events are stored
+    with only their integer ids; otherwise each is also given a random
+    UUID as an external identity.
+
+    In deterministic mode, ids are not allocated in sequence: a span's id
+    is derived from a uuid5 of the writer's current scope (see scoped), its
+    span type and its local key, and an event's id from its span id, time,
+    type and description; if UUIDs are stored, they are those uuid5s.
+    Spans and events which already exist are ignored rather than inserted
+    again, so re-running an import, or running several importers which
+    name the same spans in separate processes, converges on one copy of
+    each span instead of making duplicates. first_id is not used in this
+    mode.
+
+    Span types, event types and descriptions are buffered as strings, and
+    resolved to the ids of their interned rows in the span_type,
+    event_type and source tables when the buffer is flushed. Resolved ids
+    are cached for the lifetime of the writer, so each distinct string
+    is only looked up in the database once.
+
+    If the database already has span_closure, span_summary or span_entity
+    tables (see dnpcsql.derived), each flush also brings them up to date with the rows
+    that it writes, unless maintain_derived_tables is False because the
+    caller is going to rebuild them once at the end.
+
+    The local key of each span made by local_key_to_span_id is recorded in
+    the local_key table. If bind_existing is True, local_key_to_span_id
+    looks keys which are not in its namespace up in that table before
+    making a new span, so that a source can be imported into a database
+    which already holds the rest of its workflow, and bind to the spans
+    that are already there (see existing_span_id).
+    """
+
+    def __init__(self, db: sqlite3.Connection, batch_size: int = 10000, store_uuids: bool = False, first_id: int = 1,
+                 deterministic: bool = False, bind_existing: bool = False, maintain_derived_tables: bool = True):
+        self.db = db
+        self.batch_size = batch_size
+        self.store_uuids = store_uuids
+        self.deterministic = deterministic
+        self.bind_existing = bind_existing
+
+        self.scope: List[str] = []
+        # span id -> the (time, type, description) of the last event made
+        # in that span by event_identity, and how many times in a row it
+        # has been made
+        self.event_occurrences: Dict[int, Tuple[Tuple[float, str, str], int]] = {}
+
+        self.next_span_id = max(first_id, db.execute("SELECT coalesce(max(id), 0) + 1 FROM span_data").fetchone()[0])
+        self.next_event_id = max(first_id, db.execute("SELECT coalesce(max(id), 0) + 1 FROM event_data").fetchone()[0])
+
+        self.spans: List[Tuple[int, Optional[str], str, str]] = []
+        self.events: List[Tuple[int, Optional[str], int, float, str, str]] = []
+        self.event_attributes: List[Tuple[int, str, Any]] = []
+        self.subspans: List[Tuple[int, int, Any]] = []
+        self.facets: List[Tuple[int, int, str]] = []
+        self.local_keys: List[Tuple[str, str, str, int]] = []
+
+        # (scope, namespace) -> the keys recorded in local_key in that
+        # namespace, loaded when bind_existing first needs them
+        self.existing_local_keys: Dict[Tuple[str, str], Dict[str, int]] = {}
+
+        self.span_type_ids: Dict[str, int] = {}
+        self.event_type_ids: Dict[str, int] = {}
+        self.source_ids: Dict[str, int] = {}
+
+        self.maintain_span_closure = maintain_derived_tables and has_table(db, "span_closure")
+        self.maintain_span_summary = maintain_derived_tables and has_table(db, "span_summary")
+        self.maintain_span_entity = maintain_derived_tables and has_table(db, "span_entity")
+
+    def allocate_span_id(self) -> int:
+        span_id = self.next_span_id
+        self.next_span_id += 1
+        return span_id
+
+    def allocate_event_id(self) -> int:
+        event_id = self.next_event_id
+        self.next_event_id += 1
+        return event_id
+
+    def new_uuid(self) -> Optional[str]:
+        if self.store_uuids:
+            return str(uuid.uuid4())
+        else:
+            return None
+
+    @contextlib.contextmanager
+    def scoped(self, key: str) -> Iterator[None]:
+        """Within this context, deterministic span ids are derived within
+        the scope named by key (for example, a workflow run id), nested
+        inside any enclosing scopes, so that the same local keys used in
+        different scopes name different spans."""
+        self.scope.append(key)
+        try:
+            yield
+        finally:
+            self.scope.pop()
+
+    def span_identity(self, span_type: str, local_key: Any) -> Tuple[int, Optional[str]]:
+        """Returns the id and uuid for a new span."""
+        if not self.deterministic:
+            return (self.allocate_span_id(), self.new_uuid())
+        u = uuid.uuid5(_SPAN_NAMESPACE, repr((tuple(self.scope), span_type, local_key)))
+        return (_uuid_to_id(u), str(u) if self.store_uuids else None)
+
+    def scope_name(self) -> str:
+        """The current scope, as it is recorded in the local_key table."""
+        return "/".join(self.scope)
+
+    def existing_span_id(self, span_type: str, local_key: Any) -> Optional[int]:
+        """Returns the id of the span of span_type which was recorded with
+        local_key in the current scope, by this or an earlier import, or
+        None if there is none. The keys of each namespace are read from the
+        database once."""
+        k = (self.scope_name(), span_type)
+        if k not in self.existing_local_keys:
+            self.flush()
+            self.existing_local_keys[k] = dict(self.db.execute(
+                "SELECT key, span_id FROM local_key WHERE scope = ? AND namespace = ?", k))
+        return self.existing_local_keys[k].get(repr(local_key))
+
+    def event_identity(self, span_id: int, event_time: float, event_type: str, description: str) -> Tuple[int, Optional[str]]:
+        """Returns the id and uuid for a new event."""
+        if not self.deterministic:
+            return (self.allocate_event_id(), self.new_uuid())
+        # identical events in the same span are numbered in the order that
+        # they are stored, so that they are all kept. Only a run of
+        # identical events is counted, rather than every event ever made,
+        # so this keeps one entry per span: the importers store the events
+        # of each span in time order, and identical events have the same
+        # time, so they arrive one after another.
+        k = (event_time, event_type, description)
+        (last, occurrence) = self.event_occurrences.get(span_id, (None, -1))
+        occurrence = occurrence + 1 if last == k else 0
+        self.event_occurrences[span_id] = (k, occurrence)
+        u = uuid.uuid5(_EVENT_NAMESPACE, repr((span_id, event_time, event_type, description, occurrence)))
+        return (_uuid_to_id(u), str(u) if self.store_uuids else None)
+
+    def add_span(self, row: Tuple[int, Optional[str], str, str]) -> None:
+        self.spans.append(row)
+        self._maybe_flush()
+
+    def add_event(self, row: Tuple[int, Optional[str], int, float, str, str]) -> None:
+        self.events.append(row)
+        self._maybe_flush()
+
+    def add_event_attributes(self, rows: List[Tuple[int, str, Any]]) -> None:
+        self.event_attributes.extend(rows)
+        self._maybe_flush()
+
+    def add_subspan(self, row: Tuple[int, int, Any]) -> None:
+        self.subspans.append(row)
+        self._maybe_flush()
+
+    def add_facet(self, row: Tuple[int, int, str]) -> None:
+        self.facets.append(row)
+        self._maybe_flush()
+
+    def add_local_key(self, span_type: str, local_key: Any, span_id: int) -> None:
+        """Records that span_id is named by local_key among the spans of
+        span_type in the current scope."""
+        scope = self.scope_name()
+        key = repr(local_key)
+        self.local_keys.append((scope, span_type, key, span_id))
+        if (scope, span_type) in self.existing_local_keys:
+            self.existing_local_keys[(scope, span_type)][key] = span_id
+        self._maybe_flush()
+
+    def buffered(self) -> int:
+        return (len(self.spans) + len(self.events) + len(self.event_attributes) + len(self.subspans) + len(self.facets) +
+                len(self.local_keys))
+
+    def _maybe_flush(self) -> None:
+        if self.buffered() >= self.batch_size:
+            self.flush()
+
+    def _intern(self, cache: Dict[str, int], table: str, column: str, value: str) -> int:
+        if value not in cache:
+            cursor = self.db.cursor()
+            cursor.execute(f"INSERT OR IGNORE INTO {table} ({column}) VALUES (?)", (value,))
+            cache[value] = cursor.execute(f"SELECT id FROM {table} WHERE {column} = ?", (value,)).fetchone()[0]
+        return cache[value]
+
+    def span_type_id(self, span_type: str) -> int:
+        return self._intern(self.span_type_ids, "span_type", "name", span_type)
+
+    def event_type_id(self, event_type: str) -> int:
+        return self._intern(self.event_type_ids, "event_type", "name", event_type)
+
+    def source_id(self, description: Optional[str]) -> Optional[int]:
+        if description is None:
+            return None
+        return self._intern(self.source_ids, "source", "description", description)
+
+    def insert_verb(self) -> str:
+        """The statement to insert spans and events with: in deterministic
+        mode, spans and events which already exist are ignored."""
+        return "INSERT OR IGNORE" if self.deterministic else "INSERT"
+
+    def flush(self) -> None:
+        """Writes all buffered rows into the database, without committing."""
+        cursor = self.db.cursor()
+        new_span_ids = [row[0] for row in self.spans]
+        new_facets = [(left_id, right_id) for (left_id, right_id, _) in self.facets]
+        new_edges = [(superspan_id, subspan_id) for (superspan_id, subspan_id, _) in self.subspans]
+        for (left_id, right_id) in new_facets:
+            new_edges.append((left_id, right_id))
+            new_edges.append((right_id, left_id))
+        touched_span_ids = set(new_span_ids)
+        touched_span_ids.update(row[2] for row in self.events)
+
+        insert = self.insert_verb()
+        if self.spans:
+            cursor.executemany(f"{insert} INTO span_data (id, uuid, type_id, source_id) VALUES (?, ?, ?, ?)",
+                               [(span_id, span_uuid, self.span_type_id(span_type), self.source_id(note))
+                                for (span_id, span_uuid, span_type, note) in self.spans])
+            self.spans = []
+        if self.events:
+            cursor.executemany(f"{insert} INTO event_data (id, uuid, span_id, time, type_id, source_id) VALUES (?, ?, ?, ?, ?, ?)",
+                               [(event_id, event_uuid, span_id, event_time, self.event_type_id(event_type), self.source_id(note))
+                                for (event_id, event_uuid, span_id, event_time, event_type, note) in self.events])
+            self.events = []
+        if self.event_attributes:
+            cursor.executemany(f"{insert} INTO event_attribute (event_id, name, value) VALUES (?, ?, ?)",
+                               self.event_attributes)
+            self.event_attributes = []
+        if self.subspans:
+            cursor.executemany("INSERT OR IGNORE INTO subspan (superspan_id, subspan_id, key) VALUES (?, ?, ?)", self.subspans)
+            self.subspans = []
+        if self.facets:
+            cursor.executemany("INSERT OR IGNORE INTO facet (left_id, right_id, note) VALUES (?, ?, ?)", self.facets)
+            self.facets = []
+        if self.local_keys:
+            cursor.executemany("INSERT OR IGNORE INTO local_key (scope, namespace, key, span_id) VALUES (?, ?, ?, ?)",
+                               self.local_keys)
+            self.local_keys = []
+        self.update_derived_tables(new_span_ids, new_edges, new_facets, touched_span_ids)
+
+    def update_derived_tables(self, new_span_ids: List[int], new_edges: List[Tuple[int, int]],
+                              new_facets: List[Tuple[int, int]], touched_span_ids: Set[int]) -> None:
+        """Brings any derived tables up to date with rows which have been
+        written: by flush, or by an importer which writes rows directly
+        with set-based statements. new_edges are the directed edges of the
+        new subspans and (in both directions) facets, and touched_span_ids
+        are the new spans and the spans with new events."""
+        cursor = self.db.cursor()
+        if self.maintain_span_closure and (new_span_ids or new_edges):
+            update_span_closure(cursor, new_span_ids, new_edges)
+        if self.maintain_span_summary and touched_span_ids:
+            update_span_summary(cursor, sorted(touched_span_ids))
+        if self.maintain_span_entity and (new_span_ids or new_facets):
+            update_span_entity(cursor, new_span_ids, new_facets)
+
+    def commit(self) -> None:
+        """Flushes buffered rows and commits the database transaction."""
+        self.flush()
+        self.db.commit()
+
+    def merge_database(self, path: str) -> int:
+        """Copies all of the spans, events, event attributes, subspans,
+        facets, task and try keys and local keys of another dnpcsql database
+        into this writer's database, and commits.
+
+        This lets an import be split across processes: each process imports
+        into a database of its own with its own writer, and one writer then
+        merges them. Span and event ids in the merged database are moved up
+        into this writer's next ids, as if this writer had allocated them,
+        and the offset that was added to span ids is returned so that the
+        caller can translate any span ids it was given by the other
+        process. In deterministic mode ids are kept as they are (and the
+        offset is 0), and rows which already exist are ignored.
+        """
+        # ATTACH cannot happen inside a transaction
+        self.commit()
+
+        cursor = self.db.cursor()
+        cursor.execute("ATTACH DATABASE ? AS merged", (path,))
+
+        if self.deterministic:
+            span_offset = 0
+            event_offset = 0
+        else:
+            (min_span_id, max_span_id) = cursor.execute("SELECT min(id), max(id) FROM merged.span_data").fetchone()
+            (min_event_id, max_event_id) = cursor.execute("SELECT min(id), max(id) FROM merged.event_data").fetchone()
+            span_offset = self.next_span_id - min_span_id if min_span_id is not None else 0
+            event_offset = self.next_event_id - min_event_id if min_event_id is not None else 0
+            if max_span_id is not None:
+                self.next_span_id = max_span_id + span_offset + 1
+            if max_event_id is not None:
+                self.next_event_id = max_event_id + event_offset + 1
+
+        for (table, column) in [("span_type", "name"), ("event_type", "name"), ("source", "description")]:
+            cursor.execute(f"INSERT OR IGNORE INTO main.{table} ({column}) SELECT {column} FROM merged.{table} ORDER BY id")
+
+        insert = self.insert_verb()
+        cursor.execute(f"{insert} INTO main.span_data (id, uuid, type_id, source_id) "
+                       "SELECT s.id + ?, s.uuid, t.id, source.id "
+                       "FROM merged.span_data AS s "
+                       "JOIN merged.span_type AS mt ON mt.id = s.type_id "
+                       "JOIN main.span_type AS t ON t.name = mt.name "
+                       "LEFT JOIN merged.source AS ms ON ms.id = s.source_id "
+                       "LEFT JOIN main.source AS source ON source.description = ms.description "
+                       "ORDER BY s.id",
+                       (span_offset,))
+        cursor.execute(f"{insert} INTO main.event_data (id, uuid, span_id, time, type_id, source_id) "
+                       "SELECT e.id + ?, e.uuid, e.span_id + ?, e.time, t.id, source.id "
+                       "FROM merged.event_data AS e "
+                       "JOIN merged.event_type AS mt ON mt.id = e.type_id "
+                       "JOIN main.event_type AS t ON t.name = mt.name "
+                       "LEFT JOIN merged.source AS ms ON ms.id = e.source_id "
+                       "LEFT JOIN main.source AS source ON source.description = ms.description "
+                       "ORDER BY e.id",
+                       (event_offset, span_offset))
+        cursor.execute(f"{insert} INTO main.event_attribute (event_id, name, value) "
+                       "SELECT event_id + ?, name, value FROM merged.event_attribute ORDER BY event_id, name",
+                       (event_offset,))
+        cursor.execute("INSERT OR IGNORE INTO main.subspan (superspan_id, subspan_id, key, note) "
+                       "SELECT superspan_id + ?, subspan_id + ?, key, note FROM merged.subspan ORDER BY rowid",
+                       (span_offset, span_offset))
+        cursor.execute("INSERT OR IGNORE INTO main.facet (left_id, right_id, note) "
+                       "SELECT left_id + ?, right_id + ?, note FROM merged.facet ORDER BY rowid",
+                       (span_offset, span_offset))
+
+        cursor.execute(f"{insert} INTO main.task_key (run_id, task_id, source, span_id) "
+                       "SELECT run_id, task_id, source, span_id + ? FROM merged.task_key",
+                       (span_offset,))
+        cursor.execute(f"{insert} INTO main.try_key (run_id, task_id, try_id, source, span_id) "
+                       "SELECT run_id, task_id, try_id, source, span_id + ? FROM merged.try_key",
+                       (span_offset,))
+        cursor.execute("INSERT OR IGNORE INTO main.local_key (scope, namespace, key, span_id) "
+                       "SELECT scope, namespace, key, span_id + ? FROM merged.local_key",
+                       (span_offset,))
+
+        if self.maintain_span_closure or self.maintain_span_summary or self.maintain_span_entity:
+            new_span_ids = [span_id for (span_id,) in cursor.execute("SELECT id + ? FROM merged.span_data", (span_offset,))]
+            new_facets = list(cursor.execute("SELECT left_id + ?, right_id + ? FROM merged.facet", (span_offset, span_offset)))
+            new_edges = list(cursor.execute("SELECT superspan_id + ?, subspan_id + ? FROM merged.subspan", (span_offset, span_offset)))
+            for (left_id, right_id) in new_facets:
+                new_edges.append((left_id, right_id))
+                new_edges.append((right_id, left_id))
+            touched_span_ids = set(new_span_ids)
+            touched_span_ids.update(span_id for (span_id,) in cursor.execute("SELECT DISTINCT span_id + ? FROM merged.event_data", (span_offset,)))
+            self.update_derived_tables(new_span_ids, new_edges, new_facets, touched_span_ids)
+
+        self.db.commit()
+        cursor.execute("DETACH DATABASE merged")
+
+        return span_offset
+
+
+def _add_span(writer: BatchWriter, span_type: str, description: str, local_key: Any) -> int:
+    (span_id, span_uuid) = writer.span_identity(span_type, local_key)
+    writer.add_span((span_id, span_uuid, span_type, description))
+    return span_id
+
+def local_key_to_span_id(*,
+                         writer: BatchWriter,
+                         local_key: X,
+                         namespace: Dict[X, int],
+                         span_type: str,
+                         description: str) -> int:
     """Makes sure a span exists for given key. If the key is in namespace
-    already, the span uuid is returned, like a regular dictionary lookup in
+    already, the span id is returned, like a regular dictionary lookup in
     the namespace. If it is not in the namespace, a new span is generated and
-    inserted into the database.
-    Repeatedly calling local_key_to_span_uuid with the same local_key and
-    namespace will always return the same span uuid, which will be present in
-    the span table of the database.
+    inserted into the database - unless the writer binds to existing spans,
+    and an earlier import recorded a span of span_type for the key.
+    Repeatedly calling local_key_to_span_id with the same local_key and
+    namespace will always return the same span id, which will be present in
+    the span table of the database (once the writer has been flushed).
     """
 
     if local_key not in namespace:
-        span_uuid = str(uuid.uuid4())
-        namespace[local_key] = span_uuid
-        cursor.execute("INSERT INTO span (uuid, type, note) VALUES (?, ?, ?)", (span_uuid, span_type, description))
+        existing_span_id = writer.existing_span_id(span_type, local_key) if writer.bind_existing else None
+        if existing_span_id is not None:
+            span_id = existing_span_id
+        else:
+            span_id = _add_span(writer, span_type, description, local_key)
+            writer.add_local_key(span_type, local_key, span_id)
+        namespace[local_key] = span_id
     else:
-        span_uuid = namespace[local_key]
+        span_id = namespace[local_key]
 
-    return span_uuid
+    return span_id
+
+def lookup_span_id(*,
+                   writer: BatchWriter,
+                   local_key: X,
+                   namespace: Dict[X, int],
+                   span_type: str) -> Optional[int]:
+    """Like local_key_to_span_id, but returns None rather than making a
+    span when there is none for the key."""
+    if local_key not in namespace:
+        existing_span_id = writer.existing_span_id(span_type, local_key) if writer.bind_existing else None
+        if existing_span_id is None:
+            return None
+        namespace[local_key] = existing_span_id
+    return namespace[local_key]
 
 def store_event(*,
-                cursor,
-                span_uuid: str,
+                writer: BatchWriter,
+                span_id: int,
                 event_time: float,
                 event_type: str,
+                description: str,
+                attributes: Optional[Dict[str, Any]] = None):
+    """writes an event into the database, with any attributes (whose
+    values should be numbers or strings)"""
+
+    (event_id, event_uuid) = writer.event_identity(span_id, event_time, event_type, description)
+    writer.add_event((event_id,
+                      event_uuid,
+                      span_id,
+                      event_time,
+                      event_type,
+                      description))
+    if attributes:
+        writer.add_event_attributes([(event_id, name, value) for (name, value) in attributes.items()])
+
+def store_subspan(*,
+                  writer: BatchWriter,
+                  superspan_id: int,
+                  subspan_id: int,
+                  key: Any):
+    """records that subspan_id is contained within superspan_id"""
+    writer.add_subspan((superspan_id, subspan_id, key))
+
+def store_facet(*,
+                writer: BatchWriter,
+                left_id: int,
+                right_id: int,
                 description: str):
-    """writes an event into the database"""
-
-    event_uuid = str(uuid.uuid4())
-    cursor.execute("INSERT INTO event (uuid, span_uuid, time, type, note) VALUES (?, ?, ?, ?, ?)",
-                   (event_uuid,
-                    span_uuid,
-                    str(event_time),  # rather than sqlite3 doing it?
-                    event_type,
-                    description)
-                   )
+    """records that two spans are facets of the same entity"""
+    writer.add_facet((left_id, right_id, description))
 
 
 def logfile_time_to_unix(s: str) -> float:
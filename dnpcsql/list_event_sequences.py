@@ -2,15 +2,18 @@
 # (recursive) subspans
 # Maybe list them in mean-order-since-start-of-task?
 
+import argparse
 import itertools
 import math
-import sqlite3
 import sys
 
 from dataclasses import dataclass
 from typing import Any, List, Dict
 
 import dnpcsql.queries as queries
+from dnpcsql.db import add_db_argument, add_run_id_argument, connect_read_only
+from dnpcsql.derived import has_table
+from dnpcsql.sampling import read_sample_rate
 
 
 @dataclass
@@ -21,21 +24,35 @@ class EventStats:
 
 if __name__ == "__main__":
 
-    if len(sys.argv) == 2:
-        root_span_type = sys.argv[1]
+    parser = argparse.ArgumentParser()
+    parser.add_argument("root_span_type", nargs="?", default="parsl.monitoring.task",
+                        help="type of the root spans to collect events under")
+    parser.add_argument("--by-entity", action="store_true",
+                        help="collect the events of each entity which has a span of the root type - "
+                             "the spans joined to it by facets, without following subspans - "
+                             "using the span_entity table")
+    add_db_argument(parser)
+    add_run_id_argument(parser)
+    args = parser.parse_args()
+
+    root_span_type = args.root_span_type
+
+    if args.by_entity:
+        print(f"Looking for events of entities with span type {root_span_type}")
     else:
-        root_span_type = "parsl.monitoring.task"
-
-    print(f"Looking for events rooted in span type {root_span_type}")
-    query = queries.events_for_root_span_type(root_span_type)
-
-    db_name = "dnpc.sqlite3"
-    db = sqlite3.connect(db_name,
-                         detect_types=sqlite3.PARSE_DECLTYPES |
-                         sqlite3.PARSE_COLNAMES)
+        print(f"Looking for events rooted in span type {root_span_type}")
+    db = connect_read_only(args.db, args.run_ids)
 
     cursor = db.cursor()
 
+    if args.by_entity:
+        if not has_table(db, "span_entity"):
+            sys.exit("The database has no span_entity table: run python3 -m dnpcsql.derived to build it")
+        query = queries.events_for_entities_of_span_type(root_span_type)
+    else:
+        query = queries.events_for_root_span_type(root_span_type,
+                                                  use_closure=has_table(db, "span_closure"))
+
     rows = list(cursor.execute(query))
 
     groups = itertools.groupby(rows, lambda r: r[0])
@@ -43,7 +60,7 @@ if __name__ == "__main__":
     hash_counts = {}
     hash_sequences: Dict[int, List[Any]] = {}
 
-    for (root_span_uuid, events_iterator) in groups:
+    for (root_span_id, events_iterator) in groups:
       events = list(events_iterator)
       hash_material = ""
       for e in events:
@@ -59,6 +76,11 @@ if __name__ == "__main__":
       hash_sequences[h].append(events)
     print(f"There were {len(hash_counts)} different orderings of events")
 
+    sample_rate = read_sample_rate(db)
+    if sample_rate < 1:
+        print(f"Tasks were imported with a sample rate of {sample_rate}: "
+              f"multiply counts by {1 / sample_rate:.6g} to estimate counts for the whole workflow")
+
     most_common_count = max(hash_counts.values())
     print(f"Most common count: {most_common_count}")
 
@@ -75,16 +97,16 @@ if __name__ == "__main__":
       event_time=e[1]
       span_type=e[2]
       event_type=e[3]
-      event_uuid=e[4]
+      event_id=e[4]
       template_events.append(EventStats())
 
     for s in hash_sequences[most_common_hash]:
-      last_time = float(s[0][1])
+      last_time = s[0][1]
       n = 0
       for e in s:
         if example_events[n][3] != e[3]:
             raise RuntimeError(f"Implementation error: this event is not in template sequence: template event type at this position: {example_events[n][3]}, this event type {e[3]}")
-        event_time = float(e[1])
+        event_time = e[1]
         time_since_last = event_time - last_time
         template_events[n].cumulative += time_since_last
         template_events[n].minimum = min(time_since_last, template_events[n].minimum)
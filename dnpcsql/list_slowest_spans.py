@@ -0,0 +1,40 @@
+# lists the longest running spans of a given type, using the span_summary
+# table - run python3 -m dnpcsql.derived first if the database does not
+# have one.
+
+import argparse
+import sys
+
+import dnpcsql.queries as queries
+from dnpcsql.db import add_db_argument, add_run_id_argument, connect_read_only
+from dnpcsql.derived import has_table
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("span_type", nargs="?", default="parsl.monitoring.task",
+                        help="type of spans to list")
+    parser.add_argument("limit", nargs="?", type=int, default=10,
+                        help="number of spans to list")
+    add_db_argument(parser)
+    add_run_id_argument(parser)
+    args = parser.parse_args()
+
+    span_type = args.span_type
+    limit = args.limit
+
+    print(f"Looking for the {limit} longest spans of type {span_type}")
+
+    db = connect_read_only(args.db, args.run_ids)
+
+    # a database from an older schema, or one whose derived tables have
+    # not been built, has no span_summary
+    if not has_table(db, "span_summary"):
+        sys.exit("The database has no span_summary table: run python3 -m dnpcsql.derived to build it")
+
+    cursor = db.cursor()
+
+    rows = list(cursor.execute(queries.slowest_spans(span_type, limit)))
+
+    for (span_id, first_time, duration, event_count, first_event_type, last_event_type) in rows:
+        print(f"span {span_id}: {duration:.3f}s, {event_count} events, {first_event_type} -> {last_event_type}")
@@ -1,12 +1,16 @@
 # lists span types in the database
 
-import sqlite3
+import argparse
+
+from dnpcsql.db import add_db_argument, add_run_id_argument, connect_read_only
 
 if __name__ == "__main__":
-    db_name = "dnpc.sqlite3"
-    db = sqlite3.connect(db_name,
-                         detect_types=sqlite3.PARSE_DECLTYPES |
-                         sqlite3.PARSE_COLNAMES)
+    parser = argparse.ArgumentParser()
+    add_db_argument(parser)
+    add_run_id_argument(parser)
+    args = parser.parse_args()
+
+    db = connect_read_only(args.db, args.run_ids)
 
     query = "SELECT DISTINCT type FROM span;"
 
@@ -2,31 +2,35 @@
 # (recursive) subspans
 # Maybe list them in mean-order-since-start-of-task?
 
+import argparse
 import itertools
-import sqlite3
 import sys
 
 from typing import Any, List, Dict
 
 import dnpcsql.queries as queries
+from dnpcsql.db import add_db_argument, add_run_id_argument, connect_read_only
+from dnpcsql.derived import has_table
 
 if __name__ == "__main__":
 
-    if len(sys.argv) == 2:
-        root_span_type = sys.argv[1]
-    else:
-        root_span_type = "parsl.monitoring.task"
+    parser = argparse.ArgumentParser()
+    parser.add_argument("root_span_type", nargs="?", default="parsl.monitoring.task",
+                        help="type of the root spans to collect events under")
+    add_db_argument(parser)
+    add_run_id_argument(parser)
+    args = parser.parse_args()
 
-    print(f"Looking for events rooted in span type {root_span_type}")
-    query = queries.events_for_root_span_type(root_span_type)
+    root_span_type = args.root_span_type
 
-    db_name = "dnpc.sqlite3"
-    db = sqlite3.connect(db_name,
-                         detect_types=sqlite3.PARSE_DECLTYPES |
-                         sqlite3.PARSE_COLNAMES)
+    print(f"Looking for events rooted in span type {root_span_type}")
+    db = connect_read_only(args.db, args.run_ids)
 
     cursor = db.cursor()
 
+    query = queries.events_for_root_span_type(root_span_type,
+                                              use_closure=has_table(db, "span_closure"))
+
     rows = list(cursor.execute(query))
 
     groups = itertools.groupby(rows, lambda r: r[0])
@@ -34,9 +38,9 @@ if __name__ == "__main__":
     skip_count = 0
     groups_count = 0
 
-    for (root_span_uuid, events_iterator) in groups:
+    for (root_span_id, events_iterator) in groups:
         groups_count += 1
-        # print(f"Processing root span {root_span_uuid}")
+        # print(f"Processing root span {root_span_id}")
         events = list(events_iterator)
         # print(f"This span has {len(events)} events")
         #parsl.tracing.PACKAPPLY/SERIALIZE_PACK_APPLY_FUNC
@@ -56,8 +60,8 @@ if __name__ == "__main__":
 
         start_event = start_events[0]
         end_event = end_events[0]
-        start_t = float(start_event[1])
-        end_t = float(end_event[1])
+        start_t = start_event[1]
+        end_t = end_event[1]
 
         delta_t = end_t - start_t
         print(f"{start_t} {delta_t}")
@@ -69,7 +73,7 @@ if __name__ == "__main__":
     hash_counts = {}
     hash_sequences: Dict[int, List[Any]] = {}
 
-    for (root_span_uuid, events_iterator) in groups:
+    for (root_span_id, events_iterator) in groups:
       events = list(events_iterator)
       hash_material = ""
       for e in events:
@@ -101,16 +105,16 @@ if __name__ == "__main__":
       event_time=e[1]
       span_type=e[2]
       event_type=e[3]
-      event_uuid=e[4]
+      event_id=e[4]
       template_events.append(0)
 
     for s in hash_sequences[most_common_hash]:
-      last_time = float(s[0][1])
+      last_time = s[0][1]
       n = 0
       for e in s:
         if example_events[n][3] != e[3]:
             raise RuntimeError(f"Implementation error: this event is not in template sequence: template event type at this position: {example_events[n][3]}, this event type {e[3]}")
-        event_time = float(e[1])
+        event_time = e[1]
         time_since_last = event_time - last_time
         template_events[n] += time_since_last
         last_time = event_time
@@ -0,0 +1,305 @@
+"""Scanning large log files for lines that match regexes, in parallel.
+
+A log file is memory mapped and split into byte ranges which end on line
+boundaries. Each range is scanned for lines which match a list of
+LogPatterns - by worker processes, if jobs is more than 1 - and the matches
+are returned in file order, as if the file had been read a line at a time.
+
+Importers describe the lines that they are interested in as LogPatterns,
+and then do the importing (span allocation, and so on, which must happen
+in order and in one process) with the matches that scan_log returns.
+
+For logs whose lines are in time order, scan_log can be restricted to a
+TimeWindow: the first and last lines of the window are found by bisecting
+on byte offsets, and nothing outside them is read.
+
+A log which is still being written can be read a part at a time with
+LogOffsets, which records how far each file has been read, so that the
+next read starts where the last one stopped.
+"""
+
+import collections
+import functools
+import mmap
+import os
+import re
+
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import BinaryIO, Callable, Deque, Dict, Iterator, List, Optional, Tuple, TypeVar
+
+from dnpcsql.importerlib import logfile_time_to_unix
+
+X = TypeVar('X')
+Y = TypeVar('Y')
+
+# Ranges are at most this long, so that each worker holds a bounded amount
+# of a file, and a file is split into enough ranges to keep all workers
+# busy.
+DEFAULT_CHUNK_SIZE = 64 * 1024 * 1024
+
+
+@dataclass
+class LogPattern:
+    """A kind of log line. A line is of this kind if it contains prefilter
+    (which is much cheaper to check than a regex match) and matches one of
+    the regexes, which are tried in order. A line can be of several kinds.
+    """
+    kind: str
+    prefilter: str
+    regexes: List[re.Pattern]
+
+
+# the kind of a matched line, and the groups of the regex that matched it
+LogMatch = Tuple[str, Tuple[str, ...]]
+
+
+@dataclass
+class TimeWindow:
+    """The lines of a log from since to until (unix times), inclusive.
+    Either end can be None, to leave it open."""
+    since: Optional[float] = None
+    until: Optional[float] = None
+
+    def contains(self, t: float) -> bool:
+        return (self.since is None or t >= self.since) and (self.until is None or t <= self.until)
+
+
+@dataclass
+class LogOffsets:
+    """How far each file has been read, as (inode, byte offset) by absolute
+    path, for reading files which are still being appended to a part at a
+    time. previous is where the last reads stopped, and read records where
+    the reads since then have stopped, to be previous next time.
+
+    A file is read from its previous offset, unless it has a different
+    inode (it has been rotated: replaced by a new file at the same path) or
+    is shorter than the offset (it has been truncated), when it is read
+    from the start. Reads stop at the end of the last complete line, so
+    that a line which is still being written is read whole next time.
+    """
+    previous: Dict[str, Tuple[int, int]]
+    read: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+    def appended_range(self, f: BinaryIO, path: str) -> Tuple[int, int]:
+        """Returns the (start, end) byte range of the complete lines of the
+        open file f, at path, which have not been read before, and records
+        them as read."""
+        path = os.path.abspath(path)
+        st = os.fstat(f.fileno())
+        start = 0
+        previous = self.previous.get(path)
+        if previous is not None and previous[0] == st.st_ino and previous[1] <= st.st_size:
+            start = previous[1]
+        end = start
+        if st.st_size > start:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                end = mm.rfind(b"\n", start) + 1
+                end = max(start, end)
+        self.read[path] = (st.st_ino, end)
+        return (start, end)
+
+    def unchanged(self, path: str) -> bool:
+        """Returns True if the file at path is the same file, with the same
+        size, as when it was last read whole (see read_whole)."""
+        st = os.stat(path)
+        return self.previous.get(os.path.abspath(path)) == (st.st_ino, st.st_size)
+
+    def read_whole(self, path: str) -> None:
+        """Records that the file at path, which is not read by lines, has
+        been read whole."""
+        st = os.stat(path)
+        self.read[os.path.abspath(path)] = (st.st_ino, st.st_size)
+
+
+def scan_log(path: str, patterns: List[LogPattern], jobs: int = 1,
+             chunk_size: int = DEFAULT_CHUNK_SIZE,
+             time_window: Optional[TimeWindow] = None,
+             line_time: Optional[Callable[[str], Optional[float]]] = None,
+             offsets: Optional[LogOffsets] = None) -> Iterator[LogMatch]:
+    """Yields a match for each line of the file at path which is of the
+    kind of one of patterns, in file order (and, for a line of more than
+    one kind, in the order of patterns). If jobs is more than 1, the file
+    is scanned by that many worker processes.
+
+    If time_window is given, only the lines in it are scanned.
+    line_time gives the time of a line, or None for a line without one
+    (such as a continuation line), which is treated as having the time of
+    the line before it; the timed lines of the file must be in time order.
+
+    If offsets is given, only the complete lines after the offset that the
+    file was last read to are scanned (see LogOffsets).
+
+    Lines are split on "\\n" only, and include it, as when iterating over
+    a file opened in text mode on a unix system.
+    """
+    if time_window is not None:
+        assert line_time is not None, "scanning a time window needs line_time"
+        ranges = line_ranges(path, chunk_size, window_range(path, time_window, line_time))
+    elif offsets is not None:
+        with open(path, "rb") as f:
+            ranges = line_ranges(path, chunk_size, offsets.appended_range(f, path))
+    else:
+        ranges = line_ranges(path, chunk_size)
+    if jobs > 1 and len(ranges) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for matches in map_in_order(pool, functools.partial(_scan_range, path, patterns), ranges, window=2 * jobs):
+                yield from matches
+    else:
+        for r in ranges:
+            yield from _scan_range(path, patterns, r)
+
+
+def line_ranges(path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                within: Optional[Tuple[int, int]] = None) -> List[Tuple[int, int]]:
+    """Splits the file at path (or the line-aligned byte range within it)
+    into (start, end) byte ranges of about chunk_size bytes, each ending
+    just after a newline (or at the end of the file)."""
+    size = os.path.getsize(path)
+    (start, limit) = within if within is not None else (0, size)
+    if start >= limit:
+        return []
+
+    ranges = []
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        while start < limit:
+            end = mm.find(b"\n", min(start + chunk_size, limit) - 1, limit)
+            end = limit if end == -1 else end + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def window_range(path: str, window: TimeWindow, line_time: Callable[[str], Optional[float]]) -> Tuple[int, int]:
+    """Returns the line-aligned (start, end) byte range of the lines of the
+    file at path which are in window, found by bisection."""
+    size = os.path.getsize(path)
+    if size == 0:
+        return (0, 0)
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = 0
+        if window.since is not None:
+            since = window.since
+            start = _bisect(mm, size, line_time, lambda t: t >= since)
+        end = size
+        if window.until is not None:
+            until = window.until
+            end = _bisect(mm, size, line_time, lambda t: t > until)
+    return (start, max(start, end))
+
+
+def _bisect(mm: mmap.mmap, size: int, line_time: Callable[[str], Optional[float]],
+            after: Callable[[float], bool]) -> int:
+    """Returns the offset of the first line whose time is after, or size
+    if there is none. Lines without a time are skipped over when probing,
+    so they go with the timed line before them."""
+    lo = 0
+    hi = size
+    while lo < hi:
+        mid = (lo + hi) // 2
+        (line_start, t) = _next_timed_line(mm, size, _line_start(mm, size, mid), line_time)
+        if t is None or after(t):
+            hi = mid
+        else:
+            lo = line_start + 1
+    # lo is in or just after the last line which is not after: untimed
+    # lines which follow that line go with it.
+    (line_start, _) = _next_timed_line(mm, size, _line_start(mm, size, lo), line_time)
+    return line_start
+
+
+def _line_start(mm: mmap.mmap, size: int, offset: int) -> int:
+    """Returns offset if a line starts there, or otherwise the start of the
+    next line (or size)."""
+    if offset == 0 or offset >= size or mm[offset - 1:offset] == b"\n":
+        return min(offset, size)
+    end = mm.find(b"\n", offset)
+    return size if end == -1 else end + 1
+
+
+def _next_timed_line(mm: mmap.mmap, size: int, offset: int,
+                     line_time: Callable[[str], Optional[float]]) -> Tuple[int, Optional[float]]:
+    """Returns the offset and time of the first line with a time starting
+    at or after offset (which is the start of a line), or (size, None)."""
+    while offset < size:
+        end = mm.find(b"\n", offset)
+        end = size if end == -1 else end + 1
+        t = line_time(mm[offset:end].decode("utf-8", errors="replace"))
+        if t is not None:
+            return (offset, t)
+        offset = end
+    return (size, None)
+
+
+# line_time functions for the logs which dnpcsql imports
+
+def microsecond_time_prefix(line: str) -> Optional[float]:
+    """The time of a Work Queue transaction_log line, which starts with a
+    unix time in microseconds. Comment lines have no time."""
+    try:
+        return int(line.split(" ", 1)[0]) / 1000000.0
+    except ValueError:
+        return None
+
+
+def logfile_time_prefix(line: str) -> Optional[float]:
+    """The time of an htex log line, which starts like
+    2023-03-06 11:20:07.190 interchange:485 ..."""
+    try:
+        return logfile_time_to_unix(line[:23])
+    except ValueError:
+        return None
+
+
+def _scan_range(path: str, patterns: List[LogPattern], byte_range: Tuple[int, int]) -> List[LogMatch]:
+    (start, end) = byte_range
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        text = mm[start:end].decode("utf-8", errors="replace")
+
+    # a pattern whose prefilter does not appear anywhere in the range
+    # cannot match any line in it.
+    patterns = [p for p in patterns if p.prefilter in text]
+
+    matches: List[LogMatch] = []
+    if not patterns:
+        return matches
+
+    for line in _split_lines(text):
+        for pattern in patterns:
+            if pattern.prefilter in line:
+                m = _first_match(pattern.regexes, line)
+                if m:
+                    matches.append((pattern.kind, m.groups()))
+    return matches
+
+
+def _split_lines(text: str) -> List[str]:
+    # str.splitlines would also split on characters other than "\n"
+    lines = [line + "\n" for line in text.split("\n")]
+    # the last line either had no newline, or is the empty string after
+    # the final newline
+    last = lines.pop()[:-1]
+    if last:
+        lines.append(last)
+    return lines
+
+
+def _first_match(regexes: List[re.Pattern], line: str) -> Optional[re.Match]:
+    for regex in regexes:
+        m = regex.match(line)
+        if m:
+            return m
+    return None
+
+
+def map_in_order(pool: Executor, fn: Callable[[X], Y], items: List[X], window: int) -> Iterator[Y]:
+    """Like pool.map, but with at most window items submitted and not yet
+    consumed at once, so that results which are produced faster than the
+    caller uses them do not pile up in memory."""
+    futures: Deque = collections.deque()
+    for item in items:
+        futures.append(pool.submit(fn, item))
+        if len(futures) >= window:
+            yield futures.popleft().result()
+    while futures:
+        yield futures.popleft().result()
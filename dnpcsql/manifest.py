@@ -0,0 +1,162 @@
+"""The import manifest records the source files which have been imported
+into a database, so that a later import can skip the workflow runs whose
+sources have not changed since.
+
+Each row is one source: a file, and the run id of the workflow that it was
+imported for, with the file's size and mtime at the time, and a hash of
+its content. A file which holds several workflows (such as parsl's
+monitoring.db) has a row for each run id, and its hash covers only that
+run's part of the file, so that adding a new run to it does not make every
+other run look changed.
+
+Size and mtime are compared first, and a content hash is only computed
+again when one of them has changed: an unchanged source costs a stat, not
+a read.
+
+The logs of a workflow which is being followed as it runs grow all of the
+time, so they are not hashed: they are compared by inode and size instead.
+For each log, the manifest also records how far the importers have read it
+by lines, so that the next import can read only what has been appended
+since (see dnpcsql.logscan.LogOffsets).
+"""
+
+import hashlib
+import os
+import sqlite3
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+# The content hash of a source which is compared by inode and size instead
+# of by content.
+UNHASHED = ""
+
+
+@dataclass
+class Source:
+    path: str
+    run_id: str
+    size: int
+    mtime: float
+    content_hash: str
+
+    # the inode of the file, and how far the importers have read it by
+    # lines, or 0 if they have not
+    inode: int = 0
+    read_offset: int = 0
+
+
+def create_manifest_table(db: sqlite3.Connection) -> None:
+    db.execute("CREATE TABLE IF NOT EXISTS import_manifest ("
+               "path TEXT NOT NULL,"
+               "run_id TEXT NOT NULL,"
+               "size INTEGER NOT NULL,"
+               "mtime REAL NOT NULL,"
+               "content_hash TEXT NOT NULL,"
+               "inode INTEGER NOT NULL DEFAULT 0,"
+               "read_offset INTEGER NOT NULL DEFAULT 0,"
+               "PRIMARY KEY (path, run_id)"
+               ")")
+
+    # manifests from before inodes and offsets were recorded
+    columns = [row[1] for row in db.execute("PRAGMA table_info(import_manifest)")]
+    for column in ["inode", "read_offset"]:
+        if column not in columns:
+            db.execute(f"ALTER TABLE import_manifest ADD COLUMN {column} INTEGER NOT NULL DEFAULT 0")
+    db.commit()
+
+
+def read_manifest(db: sqlite3.Connection) -> Dict[str, List[Source]]:
+    """Returns the recorded sources, by path."""
+    manifest: Dict[str, List[Source]] = {}
+    for row in db.execute("SELECT path, run_id, size, mtime, content_hash, inode, read_offset FROM import_manifest"):
+        source = Source(*row)
+        manifest.setdefault(source.path, []).append(source)
+    return manifest
+
+
+def record_sources(db: sqlite3.Connection, sources: List[Source]) -> None:
+    db.executemany("INSERT OR REPLACE INTO import_manifest (path, run_id, size, mtime, content_hash, inode, read_offset) "
+                   "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                   [(s.path, s.run_id, s.size, s.mtime, s.content_hash, s.inode, s.read_offset) for s in sources])
+    db.commit()
+
+
+def unchanged(manifest: Dict[str, List[Source]], path: str) -> Optional[List[Source]]:
+    """Returns the recorded sources for path if the file has the same size
+    and mtime as when they were recorded, or None otherwise."""
+    previous = manifest.get(path)
+    if not previous:
+        return None
+    st = os.stat(path)
+    if all(s.size == st.st_size and s.mtime == st.st_mtime for s in previous):
+        return previous
+    return None
+
+
+def file_source(manifest: Dict[str, List[Source]], path: str, run_id: str, hashed: bool = True) -> Source:
+    """Returns the source for a file which belongs to a single run,
+    hashing its content only if it may have changed - or not at all, if
+    hashed is False."""
+    st = os.stat(path)
+    previous = unchanged(manifest, path)
+    if not hashed:
+        content_hash = UNHASHED
+    elif previous is not None:
+        content_hash = previous[0].content_hash
+    else:
+        content_hash = file_hash(path)
+    return Source(path=path, run_id=run_id, size=st.st_size, mtime=st.st_mtime, content_hash=content_hash,
+                  inode=st.st_ino)
+
+
+def file_hash(path: str) -> str:
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(1024 * 1024):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def changed_run_ids(manifest: Dict[str, List[Source]], sources: List[Source]) -> Set[str]:
+    """Returns the run ids which have a source that is not in the manifest,
+    or whose content has changed since it was recorded. A source whose
+    mtime has changed but whose content has not does not count. A source
+    which is not hashed has changed if it is a different file (with a
+    different inode) or a different size."""
+    recorded = {(s.path, s.run_id): s
+                for previous in manifest.values()
+                for s in previous}
+    return {s.run_id for s in sources
+            if _changed(recorded.get((s.path, s.run_id)), s)}
+
+
+def _changed(previous: Optional[Source], source: Source) -> bool:
+    if previous is None:
+        return True
+    if source.content_hash == UNHASHED:
+        return (previous.inode, previous.size) != (source.inode, source.size)
+    return previous.content_hash != source.content_hash
+
+
+def read_offsets(manifest: Dict[str, List[Source]]) -> Dict[str, Tuple[int, int]]:
+    """Returns (inode, offset) for each file which the importers have read
+    by lines, by path, for dnpcsql.logscan.LogOffsets.previous."""
+    return {s.path: (s.inode, s.read_offset)
+            for previous in manifest.values()
+            for s in previous
+            if s.read_offset > 0}
+
+
+def with_read_offsets(manifest: Dict[str, List[Source]], sources: List[Source],
+                      read: Dict[str, Tuple[int, int]]) -> List[Source]:
+    """Returns sources with how far each has been read by lines: as far as
+    read (dnpcsql.logscan.LogOffsets.read) says, for a file which was read
+    by this import, or as far as the manifest says, for one which was not
+    but is still the same file."""
+    previous = read_offsets(manifest)
+    for s in sources:
+        (inode, offset) = read.get(s.path, previous.get(s.path, (s.inode, 0)))
+        if inode == s.inode:
+            s.read_offset = offset
+    return sources
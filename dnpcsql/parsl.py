@@ -1,17 +1,27 @@
+import ast
 import datetime
+import functools
+import hashlib
 import os
 import pickle
 import re
 import sqlite3
+import tempfile
 import time
 import uuid
 
 import dnpcsql.workqueue
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dnpcsql.db import connect
 from dnpcsql.htex import import_htex
-from dnpcsql.importerlib import local_key_to_span_uuid, logfile_time_to_unix, store_event
+from dnpcsql.logscan import LogOffsets, LogPattern, TimeWindow, map_in_order, scan_log
+from dnpcsql.manifest import Source, file_source, unchanged
+from dnpcsql.importerlib import BatchWriter, local_key_to_span_id, logfile_time_to_unix, store_event, store_facet, store_subspan
+from dnpcsql.sampling import TaskSample
+from dnpcsql.schema import bulk_load, create_tables
 
 from dataclasses import dataclass
-from typing import Dict, List, Optional, Tuple, TypeVar
+from typing import Any, Dict, List, Optional, Set, Tuple, TypeVar
 
 # There are multiple parsl data sources.
 # The big ones are:
@@ -39,30 +49,62 @@ from typing import Dict, List, Optional, Tuple, TypeVar
 # multiple DFKs in a single parsl.log? which is actually
 # perhaps an LSST/DESC requirement)
 
-def import_rundir_root(*, db: sqlite3.Connection, runinfo: str):
+def import_rundir_root(*, writer: BatchWriter, runinfo: str, run_ids: Optional[Set[str]] = None, jobs: int = 1,
+                       time_window: Optional[TimeWindow] = None, sample: Optional[TaskSample] = None,
+                       offsets: Optional[LogOffsets] = None, known_run_ids: Optional[Dict[str, str]] = None):
+    """Imports the monitoring.db and rundirs in runinfo. If run_ids is
+    given, only workflows with those run ids are imported. If jobs is more
+    than 1, the rundirs are imported by that many worker processes (see
+    import_rundirs_in_parallel) - or if there is only one rundir, its htex
+    manager directories are read by that many processes. If time_window is
+    given, only the parts of the rundir logs in that window are imported;
+    monitoring.db is imported whole. If sample is given, only the tasks
+    that it keeps are imported, from every source (see dnpcsql.sampling).
+
+    If offsets is given, only the parts of the rundir logs which were
+    appended since they were last read are imported (see
+    import_individual_rundir). known_run_ids gives the run id of each
+    rundir, by absolute path, where it is already known: a rundir which is
+    not one of run_ids is then skipped without reading its parsl.log, and
+    the run id need not be in the part of parsl.log which is read. If it is
+    given, rundirs which are not in it are skipped too."""
     print("importing from parsl")
 
-    cursor = db.cursor()
-
     # in one rundir root, workflow information exists in two
     # places: inside the root monitoring.db, and in individual
     # runinfo/NNN directories, in various files.
 
     # this can import a hierarchy of workflows/tasks/blocks/etc
     # if it exists
-    monitoring_imports = import_monitoring_db(db, cursor, f"{runinfo}/monitoring.db")
-    # TODO: this should return a dict of workflow runid uuids
-    #        to data useful for facet joining
+    monitoring_imports = import_monitoring_db(writer, f"{runinfo}/monitoring.db", run_ids=run_ids, sample=sample)
     
     # separately, could import each rundir/NNN directory...
 
+    rundirs = [f"{runinfo}/{d}" for d in os.listdir(runinfo) if os.path.isdir(f"{runinfo}/{d}")]
+
     rundir_imports: List[ImportedWorkflow]
-    rundir_imports = []
-    for d in os.listdir(runinfo):
-        run_path = f"{runinfo}/{d}"
-        if os.path.isdir(run_path):
+    # the offsets that worker processes read to would be lost with them, so
+    # appended logs are read in this process
+    if jobs > 1 and len(rundirs) > 1 and offsets is None:
+        rundir_imports = import_rundirs_in_parallel(writer=writer, rundirs=rundirs, run_ids=run_ids, jobs=jobs,
+                                                    time_window=time_window, sample=sample)
+    else:
+        rundir_imports = []
+        for run_path in rundirs:
+            known_run_id = None
+            if known_run_ids is not None:
+                known_run_id = known_run_ids.get(os.path.abspath(run_path))
+                if known_run_id is None or (run_ids is not None and known_run_id not in run_ids):
+                    print(f"Skipping rundir: {run_path}")
+                    continue
+            parsl_log = scan_parsl_log(f"{run_path}/parsl.log", jobs=jobs, time_window=time_window, offsets=offsets,
+                                       run_id=known_run_id)
+            if run_ids is not None and parsl_log.run_id() not in run_ids:
+                print(f"Skipping rundir: {run_path}")
+                continue
             print(f"Processing rundir: {run_path}")
-            res = import_individual_rundir(dnpc_db=db, cursor=cursor, rundir=run_path)
+            res = import_individual_rundir(writer=writer, rundir=run_path, parsl_log=parsl_log, jobs=jobs,
+                                           time_window=time_window, sample=sample, offsets=offsets)
             rundir_imports.append(res)
 
     rundir_run_ids = set([x.run_id for x in rundir_imports])
@@ -78,209 +120,457 @@ def import_rundir_root(*, db: sqlite3.Connection, runinfo: str):
         print(f"Binding monitoring and rundir spans for run id {run_id}")
         monitoring_wf = [x for x in monitoring_imports if x.run_id == run_id][0]
         rundir_wf = [x for x in rundir_imports if x.run_id == run_id][0]
-        bind_workflow_account_tasks(cursor=cursor,
+        bind_workflow_account_tasks(writer=writer,
                                     left=monitoring_wf, 
                                     right=rundir_wf)
+    writer.commit()
 
-    # and then, for workflows which we know to be the same,
-    # create facets at each level for every span type that
-    # we know exists in both forms.
-
-    # that would involve both the monitoring and rundir code
-    # returning enough id->span uuid mappings that a third
-    # step could perform that join.
+    # TODO: for workflows which we know to be the same, create facets at
+    # each level for every span type that we know exists in both forms -
+    # so far only workflows, tasks and tries are bound, the last two by
+    # the keys that each importer records in task_key and try_key.
 
     print("done importing from parsl")
 
+
+def import_rundir_sources(*, writer: BatchWriter, runinfo: str, sources: Set[str], run_ids: Optional[Set[str]] = None,
+                          jobs: int = 1, time_window: Optional[TimeWindow] = None,
+                          sample: Optional[TaskSample] = None) -> None:
+    """Imports only sources (some of RUNDIR_SOURCES) of the rundirs in
+    runinfo, into a database which already holds the rest of their
+    workflows: for example, Work Queue logs which were copied back from a
+    cluster after the rest of the rundir was imported.
+
+    writer should bind to existing spans (see BatchWriter.bind_existing),
+    so that the spans which the importers name by the same keys as an
+    earlier import - such as rundir workflows, tasks and tries, which are
+    named by their run, task and try ids - are the spans that are already
+    there, and the new spans are bound to them. Tasks and tries are then
+    bound to those of the other sources in the database, such as
+    monitoring.db, by bind_tasks_and_tries. parsl.log is read again for the
+    ids which tie executor tasks to parsl tries, but nothing that was
+    imported from it before is imported again.
+
+    A source which is already in the database is imported again, with
+    duplicate events unless the writer is deterministic."""
+    if not writer.bind_existing:
+        raise ValueError("Importing rundir sources into an existing database needs a writer which binds to existing spans")
+    unknown = sources - set(RUNDIR_SOURCES)
+    if unknown:
+        raise ValueError(f"Unknown rundir sources {sorted(unknown)}: sources are {RUNDIR_SOURCES}")
+
+    for run_path in [f"{runinfo}/{d}" for d in os.listdir(runinfo) if os.path.isdir(f"{runinfo}/{d}")]:
+        parsl_log = scan_parsl_log(f"{run_path}/parsl.log", jobs=jobs, time_window=time_window)
+        if run_ids is not None and parsl_log.run_id() not in run_ids:
+            print(f"Skipping rundir: {run_path}")
+            continue
+        print(f"Importing {sorted(sources)} from rundir: {run_path}")
+        import_individual_rundir(writer=writer, rundir=run_path, parsl_log=parsl_log, jobs=jobs,
+                                 time_window=time_window, sample=sample, sources=sources)
+    writer.commit()
+
+
+def list_run_ids(runinfo: str) -> List[str]:
+    """Returns the run ids of all of the workflows in runinfo, from both
+    monitoring.db and the individual rundirs."""
+    run_ids: Set[str] = set()
+
+    monitoring_db_name = f"{runinfo}/monitoring.db"
+    if os.path.exists(monitoring_db_name):
+        monitoring_db = sqlite3.connect(monitoring_db_name)
+        run_ids.update(row[0] for row in monitoring_db.execute("SELECT run_id FROM workflow"))
+        monitoring_db.close()
+
+    for d in os.listdir(runinfo):
+        run_path = f"{runinfo}/{d}"
+        if os.path.isdir(run_path):
+            run_ids.add(rundir_run_id(run_path))
+
+    return sorted(run_ids)
+
+def runinfo_sources(runinfo: str, manifest: Dict[str, List[Source]], appended: bool = False) -> List[Source]:
+    """Returns the sources (see dnpcsql.manifest) that an import of runinfo
+    would read: monitoring.db, with one source per run, and every file in
+    each rundir. manifest gives the sources recorded by a previous import,
+    whose hashes and run ids are reused for files which have not changed.
+
+    If appended is True, only the appended parts of the rundir files are
+    going to be read, so they are not hashed, and the run id of a rundir is
+    the one recorded for its parsl.log, even if it has grown since. A
+    rundir whose parsl.log does not have a run id yet is left out.
+    """
+    sources: List[Source] = []
+
+    monitoring_db_name = os.path.abspath(f"{runinfo}/monitoring.db")
+    if os.path.exists(monitoring_db_name):
+        previous = unchanged(manifest, monitoring_db_name)
+        if previous is not None:
+            sources += previous
+        else:
+            st = os.stat(monitoring_db_name)
+            for (run_id, content_hash) in monitoring_run_hashes(monitoring_db_name).items():
+                sources.append(Source(path=monitoring_db_name, run_id=run_id,
+                                      size=st.st_size, mtime=st.st_mtime, content_hash=content_hash))
+
+    for d in sorted(os.listdir(runinfo)):
+        rundir = os.path.abspath(f"{runinfo}/{d}")
+        if not os.path.isdir(rundir):
+            continue
+
+        # finding the run id means reading all of parsl.log, so it is
+        # only done when parsl.log has changed.
+        parsl_log_name = f"{rundir}/parsl.log"
+        previous = manifest.get(parsl_log_name) if appended else unchanged(manifest, parsl_log_name)
+        if previous:
+            run_id = previous[0].run_id
+        else:
+            parsl_log = scan_parsl_log(parsl_log_name)
+            if appended and parsl_log.run_ids == []:
+                print(f"Skipping rundir, which has no run id in parsl.log yet: {rundir}")
+                continue
+            run_id = parsl_log.run_id()
+
+        for (dirpath, dirnames, filenames) in os.walk(rundir):
+            dirnames.sort()
+            for filename in sorted(filenames):
+                sources.append(file_source(manifest, f"{dirpath}/{filename}", run_id, hashed=not appended))
+
+    return sources
+
+def source_rundir_run_ids(sources: List[Source]) -> Dict[str, str]:
+    """Returns the run id of each rundir in sources (from runinfo_sources),
+    by the absolute path of the rundir."""
+    return {os.path.dirname(s.path): s.run_id for s in sources if os.path.basename(s.path) == "parsl.log"}
+
+def monitoring_run_hashes(monitoring_db_name: str) -> Dict[str, str]:
+    """Returns a hash, for each run id in monitoring.db, of the rows that
+    import_monitoring_db would import for that run."""
+    hashes: Dict[str, "hashlib._Hash"] = {}
+    monitoring_db = sqlite3.connect(monitoring_db_name)
+    for table in ["workflow", "task", "try", "status"]:
+        for row in monitoring_db.execute(f"SELECT run_id, * FROM {table} ORDER BY run_id, rowid"):
+            if row[0] not in hashes:
+                hashes[row[0]] = hashlib.sha256()
+            hashes[row[0]].update(repr((table, row[1:])).encode())
+    monitoring_db.close()
+    return {run_id: h.hexdigest() for (run_id, h) in hashes.items()}
+
 @dataclass
 class ImportedWorkflow:
+    """A workflow imported from one source. Its tasks and tries are
+    recorded in the task_key and try_key tables (see store_task_keys),
+    rather than held here for the rest of the import."""
     run_id: Optional[str]
-    workflow_span_uuid: str
-    task_to_uuid: Dict[int, str]
-    task_try_to_uuid: Dict[Tuple[int, int], str]
-
-def import_monitoring_db(dnpc_db, dnpc_cursor, monitoring_db_name) -> List[ImportedWorkflow]:
+    workflow_span_id: int
+
+    def offset_span_ids(self, offset: int) -> "ImportedWorkflow":
+        """Returns this workflow with offset added to every span id, for
+        when its spans have been merged from another database by
+        BatchWriter.merge_database."""
+        return ImportedWorkflow(run_id = self.run_id,
+                                workflow_span_id = self.workflow_span_id + offset)
+
+# The sources of the spans of parsl tasks and tries, as recorded in task_key
+# and try_key. When the spans of a task are bound together, each is bound
+# to the span from the nearest source before it in _TASK_BIND_ORDER which
+# has that task too: monitoring.db to tracing and tracing to the rundir, or
+# monitoring.db straight to the rundir if there is no tracing. Spans from
+# any other source come last.
+MONITORING_SOURCE = "parsl.monitoring"
+TRACING_SOURCE = "parsl.tracing"
+RUNDIR_SOURCE = "parsl.rundir"
+_TASK_BIND_ORDER = [MONITORING_SOURCE, TRACING_SOURCE, RUNDIR_SOURCE]
+
+# The sources within a rundir which can be imported on their own, into a
+# database which already holds the rest of the workflow.
+RUNDIR_SOURCES = ["workqueue", "htex", "tracing"]
+
+def store_task_keys(*, writer: BatchWriter, source: str, run_id: str, task_to_span_id: Dict[int, int],
+                    task_try_to_span_id: Dict[Tuple[int, int], int]) -> None:
+    """Records the spans which source imported for the tasks and tries of
+    workflow run_id, so that bind_tasks_and_tries can find them."""
+    cursor = writer.db.cursor()
+    cursor.executemany("INSERT OR IGNORE INTO task_key (run_id, task_id, source, span_id) VALUES (?, ?, ?, ?)",
+                       [(run_id, task_id, source, span_id) for (task_id, span_id) in task_to_span_id.items()])
+    cursor.executemany("INSERT OR IGNORE INTO try_key (run_id, task_id, try_id, source, span_id) VALUES (?, ?, ?, ?, ?)",
+                       [(run_id, task_id, try_id, source, span_id)
+                        for ((task_id, try_id), span_id) in task_try_to_span_id.items()])
+
+def bind_tasks_and_tries(*, writer: BatchWriter, run_id: str) -> None:
+    """Binds together, with facets, the spans which different sources
+    imported for the same task or try of workflow run_id. This is one
+    join of task_key (and one of try_key) with itself, in order of source
+    (see _TASK_BIND_ORDER), so no tasks are held in memory unless the
+    writer has derived tables to update."""
+    writer.flush()
+    cursor = writer.db.cursor()
+    rank = " ".join(f"WHEN '{source}' THEN {n}" for (n, source) in enumerate(_TASK_BIND_ORDER))
+    rank = f"CASE source {rank} ELSE {len(_TASK_BIND_ORDER)} END"
+    for (table, key) in [("task_key", "task_id"), ("try_key", "task_id, try_id")]:
+        facets = ("SELECT left_id, right_id FROM "
+                  f"(SELECT lag(span_id) OVER (PARTITION BY {key} ORDER BY {rank}) AS left_id, span_id AS right_id "
+                  f"FROM {table} WHERE run_id = ?) "
+                  "WHERE left_id IS NOT NULL")
+        if writer.maintain_span_closure or writer.maintain_span_entity:
+            # only the pairs which are not already facets are passed on to
+            # the derived tables: a re-import, or a source added later,
+            # finds most of its tasks already bound.
+            new_facets = list(cursor.execute(
+                f"SELECT left_id, right_id FROM ({facets}) AS f "
+                "WHERE NOT EXISTS (SELECT 1 FROM facet WHERE facet.left_id = f.left_id AND facet.right_id = f.right_id)",
+                (run_id,)))
+            cursor.executemany("INSERT OR IGNORE INTO facet (left_id, right_id, note) VALUES (?, ?, ?)",
+                               [(left_id, right_id, "joined by importer") for (left_id, right_id) in new_facets])
+            new_edges = [edge for (left_id, right_id) in new_facets for edge in [(left_id, right_id), (right_id, left_id)]]
+            writer.update_derived_tables([], new_edges, new_facets, set())
+        else:
+            cursor.execute(f"INSERT OR IGNORE INTO facet (left_id, right_id, note) SELECT left_id, right_id, ? FROM ({facets})",
+                           ("joined by importer", run_id))
+
+def import_rundirs_in_parallel(*, writer: BatchWriter, rundirs: List[str], run_ids: Optional[Set[str]], jobs: int,
+                               time_window: Optional[TimeWindow] = None,
+                               sample: Optional[TaskSample] = None) -> List[ImportedWorkflow]:
+    """Imports rundirs in a pool of jobs worker processes.
+
+    The rundirs are independent of each other until their workflows are
+    bound to the monitoring.db workflows, so each worker reads all of the
+    logs of one rundir (parsl.log, htex logs, the Work Queue
+    transaction_log, the tracing pickle) and imports them into a scratch
+    database of its own. This process is the only writer of the real
+    database: it merges the scratch databases into it, in rundir order, as
+    they are finished, so that spans are numbered as they would be by a
+    serial import.
+    """
+    rundir_imports: List[ImportedWorkflow] = []
+    with tempfile.TemporaryDirectory() as scratch_dir, ProcessPoolExecutor(max_workers=jobs) as pool:
+        scratch_paths = [f"{scratch_dir}/{n}.sqlite3" for n in range(len(rundirs))]
+        futures = [pool.submit(_import_rundir_in_worker, rundir, scratch_path, run_ids,
+                               writer.batch_size, writer.store_uuids, writer.deterministic, time_window, sample)
+                   for (rundir, scratch_path) in zip(rundirs, scratch_paths)]
+
+        for (rundir, scratch_path, future) in zip(rundirs, scratch_paths, futures):
+            res = future.result()
+            if res is None:
+                print(f"Skipping rundir: {rundir}")
+                continue
+            print(f"Merging rundir: {rundir}")
+            offset = writer.merge_database(scratch_path)
+            os.remove(scratch_path)
+            rundir_imports.append(res.offset_span_ids(offset))
+
+    return rundir_imports
+
+def _import_rundir_in_worker(rundir: str, scratch_path: str, run_ids: Optional[Set[str]],
+                             batch_size: int, store_uuids: bool, deterministic: bool,
+                             time_window: Optional[TimeWindow], sample: Optional[TaskSample]) -> Optional[ImportedWorkflow]:
+    parsl_log = scan_parsl_log(f"{rundir}/parsl.log", time_window=time_window)
+    if run_ids is not None and parsl_log.run_id() not in run_ids:
+        return None
+
+    print(f"Processing rundir: {rundir}")
+    connection = connect(scratch_path)
+    create_tables(connection)
+    with bulk_load(connection):
+        writer = BatchWriter(connection, batch_size=batch_size, store_uuids=store_uuids, deterministic=deterministic,
+                             maintain_derived_tables=False)
+        res = import_individual_rundir(writer=writer, rundir=rundir, parsl_log=parsl_log, time_window=time_window,
+                                       sample=sample)
+        writer.commit()
+    connection.close()
+    return res
+
+def import_monitoring_db(writer: BatchWriter, monitoring_db_name, run_ids: Optional[Set[str]] = None,
+                         sample: Optional[TaskSample] = None) -> List[ImportedWorkflow]:
 
     print(f"importing from monitoring db: {monitoring_db_name}")
 
     if not os.path.exists(monitoring_db_name):
         print("monitoring.db does not exist - skipping monitoring.db import")
         return []
- 
-    imported_workflows: List[ImportedWorkflow]
-    imported_workflows = []
-
-    monitoring_db = sqlite3.connect(monitoring_db_name,
-                                    detect_types=sqlite3.PARSE_DECLTYPES |
-                                    sqlite3.PARSE_COLNAMES)
 
-    monitoring_cursor = monitoring_db.cursor()
+    # This imports all of the selected workflows in monitoring.db at once,
+    # rather than querying workflow by workflow, task by task and try by try:
+    # monitoring.db is attached to the dnpcsql database, and spans, events
+    # and subspans are copied out of it with a few INSERT ... SELECT
+    # statements. Only span and event identities are made in Python, by the
+    # writer in the same way as for any other importer: span ids are kept in
+    # temporary tables which those statements join against, and event ids
+    # come from an SQL function.
+
+    # this should result in, for each workflow:
+    # a span for the workflow, with up to two events, the beginning and
+    # the end.  The end time is optional: a crashed or still running
+    # workflow will not have that (and I'm unclear how to tell the
+    # difference between a gone-away workflow and a workflow that
+    # hasn't reported any activity for a while)
+
+    # under a workflow there are multiple hierarchies:
+    # task -> try
+    #    and there are multiple state transition representations here:
+    #    the status table, and the several task/try table timestamp columns
+    #    What's the best way to reconcile this?
+    # executor -> task (-> try)
+    # executor -> block -> try  # note that tasks aren't assigned to a block -- tries are.
+
+    # the one most obviously represented by the key structure of the parsl
+    # monitoring db is task->try
+
+    # ATTACH cannot happen inside a transaction
+    writer.commit()
+
+    db = writer.db
+    db.execute("ATTACH DATABASE ? AS monitoring", (monitoring_db_name,))
+
+    event_uuids: Dict[int, str] = {}
+
+    def event_id(span_id: int, event_time: float, event_type: str, description: str) -> int:
+        (new_event_id, event_uuid) = writer.event_identity(span_id, event_time, event_type, description)
+        if event_uuid is not None:
+            event_uuids[new_event_id] = event_uuid
+        return new_event_id
+
+    db.create_function("dnpc_db_time_to_unix", 1, db_time_to_unix, deterministic=True)
+    db.create_function("dnpc_event_id", 4, event_id)
+
+    # tasks which are not in the sample are left out here, and so are their
+    # tries and events, which are all joined to the tasks that are kept.
+    if sample is not None:
+        db.create_function("dnpc_sample_keeps", 2, sample.keeps, deterministic=True)
 
-    rows = list(monitoring_cursor.execute("SELECT run_id, time_began, time_completed FROM workflow"))
-
-    monitoring_workflow_to_uuid: Dict[str, str] = {}
+    cursor = db.cursor()
 
-    for row in rows:
-        run_id = row[0]
+    cursor.execute("CREATE TEMP TABLE monitoring_workflow_span ("
+                   "run_id TEXT PRIMARY KEY, span_id INTEGER, uuid TEXT)")
+    cursor.execute("CREATE TEMP TABLE monitoring_task_span ("
+                   "run_id TEXT, task_id INTEGER, span_id INTEGER, uuid TEXT, "
+                   "PRIMARY KEY (run_id, task_id))")
+    cursor.execute("CREATE TEMP TABLE monitoring_try_span ("
+                   "run_id TEXT, task_id INTEGER, try_id INTEGER, span_id INTEGER, uuid TEXT, "
+                   "PRIMARY KEY (run_id, task_id, try_id))")
+
+    workflows: Dict[str, ImportedWorkflow] = {}
+
+    for (run_id,) in list(cursor.execute("SELECT run_id FROM monitoring.workflow")):
+        if run_ids is not None and run_id not in run_ids:
+            print(f"Skipping workflow run id {run_id} in monitoring database")
+            continue
         print(f"Found workflow run id {run_id} in monitoring database")
 
-        # this should result in:
-        # a span for the workflow, with up to two events, the beginning and
-        # the end.  The end time is optional: a crashed or still running
-        # workflow will not have that (and I'm unclear how to tell the
-        # difference between a gone-away workflow and a workflow that
-        # hasn't reported any activity for a while)
-
-        workflow_span_uuid = local_key_to_span_uuid(
-            cursor = dnpc_cursor,
-            local_key = run_id,
-            namespace = monitoring_workflow_to_uuid,
-            span_type = 'parsl.monitoring.workflow',
-            description = "Workflow from parsl monitoring.db")
-
-        start_time = db_time_to_unix(row[1])
-
-        store_event(cursor=dnpc_cursor,
-                    span_uuid=workflow_span_uuid,
-                    event_time=start_time,
-                    event_type='began',
-                    description='Start of workflow from parsl monitoring.db'
-                   )
-
-        if row[2]:  # non-null end time
-            end_time = db_time_to_unix(row[2])
-
-            store_event(cursor=dnpc_cursor,
-                        span_uuid=workflow_span_uuid,
-                        event_time=end_time,
-                        event_type='completed',
-                        description='End of workflow from parsl monitoring.db'
-                       )
-
-        dnpc_db.commit()
-
-        # under a workflow there are multiple hierarchies:
-        # task -> try
-        #    and there are multiple state transition representations here:
-        #    the status table, and the several task/try table timestamp columns
-        #    What's the best way to reconcile this?
-        # executor -> task (-> try)
-        # executor -> block -> try  # note that tasks aren't assigned to a block -- tries are.
-
-        # the one most obviously represented by the key structure of the parsl
-        # monitoring db is task->try
-
-        monitoring_task_to_uuid: Dict[int, str] = {}
-        task_try_to_uuid = {}
-        
-        task_rows = list(monitoring_cursor.execute("SELECT task_id, task_time_invoked, task_time_returned FROM task WHERE run_id = ?", (run_id,)))
-        for task_row in task_rows:
-            task_id = task_row[0]
-            print(f"  Importing task {task_id}")
-
-            task_uuid = local_key_to_span_uuid(
-                cursor = dnpc_cursor,
-                local_key = int(task_id),
-                namespace = monitoring_task_to_uuid,
-                span_type = 'parsl.monitoring.task',
-                description = "Task from parsl monitoring.db")
-
-            dnpc_cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)", (workflow_span_uuid, task_uuid, task_id))
-
-            invoked_time = db_time_to_unix(task_row[1])
-
-            store_event(cursor=dnpc_cursor,
-                        span_uuid=task_uuid,
-                        event_time=invoked_time,
-                        event_type='invoked',
-                        description='Task invoked in parsl monitoring.db'
-                       )
-
-            if task_row[2]:
-                returned_time = db_time_to_unix(task_row[2])
-
-                store_event(cursor=dnpc_cursor,
-                            span_uuid=task_uuid,
-                            event_time=returned_time,
-                            event_type='returned',
-                            description='Task returned in parsl monitoring.db'
-                           )
-            
-            try_rows = list(monitoring_cursor.execute("SELECT try_id FROM try WHERE run_id = ? AND task_id = ?", (run_id, task_row[0])))
-            for try_row in try_rows:
-                print(f"    Importing try {try_row[0]}")
-                try_uuid = str(uuid.uuid4())
-                dnpc_cursor.execute("INSERT INTO span (uuid, type, note) VALUES (?, ?, ?)", (try_uuid, 'parsl.monitoring.try', 'Try from parsl monitoring.db'))
-
-                dnpc_cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)", (task_uuid, try_uuid, try_row[0]))
-
-                status_rows = list(monitoring_cursor.execute("SELECT task_status_name, timestamp FROM status WHERE run_id = ? AND task_id = ? AND try_id = ?", (run_id, task_row[0], try_row[0])))
-                for status_row in status_rows:
-                    print(f"      Importing status {status_row[0]} at {status_row[1]}")
-                    status_time = db_time_to_unix(status_row[1])
-
-                    store_event(cursor=dnpc_cursor,
-                                span_uuid=try_uuid,
-                                event_time=status_time,
-                                event_type=status_row[0],
-                                description='Status in parsl monitoring.db'
-                               )
-
-                # store (task,try) -> try span uuid mapping for use later
-                task_try_to_uuid[(task_row[0], try_row[0])] = try_uuid
-
-            # try table has timings, status table also has relevant timings... how to represent?
-
-        # trying out commit at end of everything for potentially large speedup
-        dnpc_db.commit()
-
-        print(f"(task,try)->uuid mappings are: {task_try_to_uuid}")
-
-        dnpc_db.commit()
-
-        imported_workflows.append(ImportedWorkflow(run_id = run_id,
-                                                   workflow_span_uuid = workflow_span_uuid,
-                                                   task_to_uuid = monitoring_task_to_uuid,
-                                                   task_try_to_uuid = task_try_to_uuid))
-
-    return imported_workflows
-
-def bind_workflow_account_tasks(*, cursor, left: ImportedWorkflow, right: ImportedWorkflow) -> ImportedWorkflow:
+        with writer.scoped(run_id):
+            (span_id, span_uuid) = writer.span_identity('parsl.monitoring.workflow', run_id)
+            writer.add_local_key('parsl.monitoring.workflow', run_id, span_id)
+        cursor.execute("INSERT INTO monitoring_workflow_span (run_id, span_id, uuid) VALUES (?, ?, ?)",
+                       (run_id, span_id, span_uuid))
+        workflows[run_id] = ImportedWorkflow(run_id = run_id,
+                                             workflow_span_id = span_id)
+
+    task_spans = []
+    sampled = "WHERE dnpc_sample_keeps(t.run_id, t.task_id)" if sample is not None else ""
+    for (run_id, task_id) in list(cursor.execute("SELECT t.run_id, t.task_id "
+                                                 "FROM monitoring.task AS t "
+                                                 f"JOIN monitoring_workflow_span AS w ON w.run_id = t.run_id {sampled}")):
+        with writer.scoped(run_id):
+            (span_id, span_uuid) = writer.span_identity('parsl.monitoring.task', int(task_id))
+            writer.add_local_key('parsl.monitoring.task', int(task_id), span_id)
+        task_spans.append((run_id, task_id, span_id, span_uuid))
+    cursor.executemany("INSERT INTO monitoring_task_span (run_id, task_id, span_id, uuid) VALUES (?, ?, ?, ?)",
+                       task_spans)
+
+    try_spans = []
+    for (run_id, task_id, try_id) in list(cursor.execute("SELECT r.run_id, r.task_id, r.try_id "
+                                                         "FROM monitoring.try AS r "
+                                                         "JOIN monitoring_task_span AS t "
+                                                         "ON t.run_id = r.run_id AND t.task_id = r.task_id")):
+        with writer.scoped(run_id):
+            (span_id, span_uuid) = writer.span_identity('parsl.monitoring.try', (task_id, try_id))
+            writer.add_local_key('parsl.monitoring.try', (task_id, try_id), span_id)
+        try_spans.append((run_id, task_id, try_id, span_id, span_uuid))
+    cursor.executemany("INSERT INTO monitoring_try_span (run_id, task_id, try_id, span_id, uuid) VALUES (?, ?, ?, ?, ?)",
+                       try_spans)
+
+    print(f"Importing {len(workflows)} workflows, {len(task_spans)} tasks and {len(try_spans)} tries from monitoring database")
+
+    for (table, span_type, description) in [("monitoring_workflow_span", 'parsl.monitoring.workflow', "Workflow from parsl monitoring.db"),
+                                            ("monitoring_task_span", 'parsl.monitoring.task', "Task from parsl monitoring.db"),
+                                            ("monitoring_try_span", 'parsl.monitoring.try', 'Try from parsl monitoring.db')]:
+        cursor.execute(f"{writer.insert_verb()} INTO span_data (id, uuid, type_id, source_id) "
+                       f"SELECT span_id, uuid, ?, ? FROM {table} ORDER BY rowid",
+                       (writer.span_type_id(span_type), writer.source_id(description)))
+
+    task_subspans = "SELECT w.span_id, t.span_id, t.task_id " \
+                    "FROM monitoring_task_span AS t JOIN monitoring_workflow_span AS w ON w.run_id = t.run_id"
+    try_subspans = "SELECT t.span_id, r.span_id, r.try_id " \
+                   "FROM monitoring_try_span AS r JOIN monitoring_task_span AS t " \
+                   "ON t.run_id = r.run_id AND t.task_id = r.task_id"
+    for subspans in [task_subspans, try_subspans]:
+        cursor.execute(f"INSERT OR IGNORE INTO subspan (superspan_id, subspan_id, key) {subspans}")
+
+    cursor.execute("INSERT OR IGNORE INTO task_key (run_id, task_id, source, span_id) "
+                   "SELECT run_id, task_id, ?, span_id FROM monitoring_task_span",
+                   (MONITORING_SOURCE,))
+    cursor.execute("INSERT OR IGNORE INTO try_key (run_id, task_id, try_id, source, span_id) "
+                   "SELECT run_id, task_id, try_id, ?, span_id FROM monitoring_try_span",
+                   (MONITORING_SOURCE,))
+
+    # Each of these selects the span id, time and type of one kind of event.
+    # Empty end times are skipped, as well as nulls, as the row-by-row
+    # importer that this replaced did.
+    _import_monitoring_events(writer, 'Start of workflow from parsl monitoring.db',
+                              "SELECT w.span_id, dnpc_db_time_to_unix(m.time_began) AS time, 'began' AS event_type "
+                              "FROM monitoring.workflow AS m JOIN monitoring_workflow_span AS w ON w.run_id = m.run_id")
+    _import_monitoring_events(writer, 'End of workflow from parsl monitoring.db',
+                              "SELECT w.span_id, dnpc_db_time_to_unix(m.time_completed) AS time, 'completed' AS event_type "
+                              "FROM monitoring.workflow AS m JOIN monitoring_workflow_span AS w ON w.run_id = m.run_id "
+                              "WHERE m.time_completed IS NOT NULL AND m.time_completed != ''")
+    _import_monitoring_events(writer, 'Task invoked in parsl monitoring.db',
+                              "SELECT t.span_id, dnpc_db_time_to_unix(m.task_time_invoked) AS time, 'invoked' AS event_type "
+                              "FROM monitoring.task AS m JOIN monitoring_task_span AS t "
+                              "ON t.run_id = m.run_id AND t.task_id = m.task_id")
+    _import_monitoring_events(writer, 'Task returned in parsl monitoring.db',
+                              "SELECT t.span_id, dnpc_db_time_to_unix(m.task_time_returned) AS time, 'returned' AS event_type "
+                              "FROM monitoring.task AS m JOIN monitoring_task_span AS t "
+                              "ON t.run_id = m.run_id AND t.task_id = m.task_id "
+                              "WHERE m.task_time_returned IS NOT NULL AND m.task_time_returned != ''")
+    _import_monitoring_events(writer, 'Status in parsl monitoring.db',
+                              "SELECT r.span_id, dnpc_db_time_to_unix(m.timestamp) AS time, m.task_status_name AS event_type "
+                              "FROM monitoring.status AS m JOIN monitoring_try_span AS r "
+                              "ON r.run_id = m.run_id AND r.task_id = m.task_id AND r.try_id = m.try_id")
+
+    cursor.executemany("UPDATE event_data SET uuid = ? WHERE id = ?",
+                       [(event_uuid, event_id) for (event_id, event_uuid) in event_uuids.items()])
+
+    new_span_ids = [span_id for (_, _, span_id, _) in task_spans] + [span_id for (_, _, _, span_id, _) in try_spans]
+    new_span_ids += [w.workflow_span_id for w in workflows.values()]
+    new_edges = list(cursor.execute(f"SELECT * FROM ({task_subspans}) UNION ALL SELECT * FROM ({try_subspans})"))
+    writer.update_derived_tables(new_span_ids,
+                                 [(superspan_id, subspan_id) for (superspan_id, subspan_id, _) in new_edges],
+                                 [],
+                                 set(new_span_ids))
+
+    for table in ["monitoring_workflow_span", "monitoring_task_span", "monitoring_try_span"]:
+        cursor.execute(f"DROP TABLE {table}")
+    db.commit()
+    db.execute("DETACH DATABASE monitoring")
+
+    return list(workflows.values())
+
+def _import_monitoring_events(writer: BatchWriter, description: str, select: str) -> None:
+    """Inserts the events chosen by select, which returns rows with span_id,
+    time and event_type columns, with the given description."""
+    cursor = writer.db.cursor()
+    cursor.execute("INSERT OR IGNORE INTO event_type (name) "
+                   f"SELECT DISTINCT event_type FROM ({select}) AS e")
+    cursor.execute(f"{writer.insert_verb()} INTO event_data (id, span_id, time, type_id, source_id) "
+                   "SELECT dnpc_event_id(e.span_id, e.time, e.event_type, ?), e.span_id, e.time, event_type.id, ? "
+                   f"FROM ({select}) AS e "
+                   "JOIN event_type ON event_type.name = e.event_type",
+                   (description, writer.source_id(description)))
+
+def bind_workflow_account_tasks(*, writer: BatchWriter, left: ImportedWorkflow, right: ImportedWorkflow) -> ImportedWorkflow:
         # now tie together facets of the same entity from tracing and monitoring:
-        # tasks
-        # tries
-        # for a top level tasks-based analysis, it probably suffices to only tie
-        # together at the task level, but if working with tries individually,
-        # then it's probably interesting to consider tying together tries too,
-        # so that the relationship is directly expressed in the database rather
-        # than via try id numbers.
-        # I wonder if there's a more modular identifier based way of doing this,
-        # rather than collecting in-memory references? so that a SELECT->INSERT
-        # could make the entity links (i.e. the DB would already contain the
-        # relevant data in a different form?)
-
-        left_task_to_uuid = left.task_to_uuid
-        right_task_to_uuid = right.task_to_uuid
-
-        known_task_ids = set(list(left_task_to_uuid.keys()) + list(right_task_to_uuid.keys()))
-        combined_task_to_uuid = {}
-        print(f"There are {len(known_task_ids)} known tasks, between two workflow accounts") 
-        for task_id in known_task_ids:
-            if task_id in left_task_to_uuid and task_id in right_task_to_uuid:
-                print(f"joining spans for task {task_id}")
-                cursor.execute("INSERT INTO facet (left_uuid, right_uuid, note) VALUES (?, ?, ?)", (left_task_to_uuid[task_id], right_task_to_uuid[task_id], "joined by importer"))
-                combined_task_to_uuid[task_id] = left_task_to_uuid[task_id]
-            elif task_id in left_task_to_uuid and task_id not in right_task_to_uuid:
-                print(f"keeping left span for task {task_id}")
-                combined_task_to_uuid[task_id] = left_task_to_uuid[task_id]
-            elif task_id not in left_task_to_uuid and task_id in right_task_to_uuid:
-                print(f"keeping right span for task {task_id}")
-                combined_task_to_uuid[task_id] = right_task_to_uuid[task_id]
-            else:
-                # this path should never be reached, because the above three cases
-                # should cover all cases
-                raise RuntimeError("Unexpected code path")
-
+        # the workflows here, and the tasks and tries, which each source has
+        # recorded in task_key and try_key, with a join in
+        # bind_tasks_and_tries.
         if left.run_id is None and right.run_id is not None:
             run_id = right.run_id
         elif left.run_id is not None and right.run_id is None:
@@ -294,49 +584,149 @@ def bind_workflow_account_tasks(*, cursor, left: ImportedWorkflow, right: Import
 
         # this code assumes there will always be a workflow span in an ImportedWorkflow
         # which right now is kinda suspicious wrt parsl.tracing
-        cursor.execute("INSERT INTO facet (left_uuid, right_uuid, note) VALUES (?, ?, ?)", (left.workflow_span_uuid, right.workflow_span_uuid, "joined by importer"))
-
-        return ImportedWorkflow(run_id = run_id, workflow_span_uuid = left.workflow_span_uuid, task_to_uuid = combined_task_to_uuid, task_try_to_uuid = {})
-
-def import_individual_rundir(*, dnpc_db, cursor, rundir: str) -> ImportedWorkflow:
-
-        task_to_uuid: Dict[int, str]
-        task_to_uuid = {}
-
-        task_try_to_uuid: Dict[Tuple[int, int], str]
-        task_try_to_uuid = {}
-
-        parsl_log_filename = f"{rundir}/parsl.log"
-
-        # look for a run id UUID, and check there is only one,
-        # because parsl.log can contain multiple workflows,
-        # without disambiguating tasks/tries/blocks/... with the
-        # same sequential ID.
-        # 1680018839.952707 2023-03-28 08:53:59 MainProcess-60832 MainThread-23046009736064 parsl.dataflow.dflow:121 __init__ INFO: Run id is: 88f840fd-dc4a-45e4-9956-2ef5d4aad63a
-        re_run_id = re.compile('.* Run id is: ([^ ]*)\n$')
-
-        potential_run_ids = []
-        with open(parsl_log_filename, "r") as parsl_log:
-            for parsl_log_line in parsl_log:
-                m = re_run_id.match(parsl_log_line)
-                if m:
-                    potential_run_ids.append(m[1])
-        assert len(potential_run_ids) == 1, "parsl.log must contain exactly one run ID"
-        run_id = potential_run_ids[0]
-        print(f"parsl.log run ID is {run_id}")
-
-        # this doesn't need to live in any parent namespace, but local_key_to_span_uuid
+        store_facet(writer=writer,
+                    left_id=left.workflow_span_id,
+                    right_id=right.workflow_span_id,
+                    description="joined by importer")
+
+        if run_id is not None:
+            bind_tasks_and_tries(writer=writer, run_id=run_id)
+
+        return ImportedWorkflow(run_id = run_id, workflow_span_id = left.workflow_span_id)
+
+# The inside-executor loading logs of Work Queue executor tasks are read by
+# this many threads, at most FUNCTION_LOG_WINDOW files ahead of the importer.
+FUNCTION_LOG_THREADS = 16
+FUNCTION_LOG_WINDOW = 256
+
+# 1677161346.713548 META_PATH parsl.tests.test_regression.test_2555
+_re_wq_function_log = re.compile(rb'([0-9.]+) (.*)')
+
+
+def read_wq_function_log(path: str, time_window: Optional[TimeWindow] = None,
+                         offsets: Optional[LogOffsets] = None) -> Optional[List[Tuple[float, str]]]:
+    """Returns the (time, event type) events of the inside-executor
+    loading log of one Work Queue executor task, or None if the task has no
+    log. Lines are filtered as bytes, before they are decoded, so that the
+    events which are not imported do not become Python strings. If offsets
+    is given, only the lines appended since the log was last read are
+    returned, or None if there are none."""
+    try:
+        with open(path, "rb") as f:
+            if offsets is None:
+                data = f.read()
+            else:
+                (start, end) = offsets.appended_range(f, path)
+                if start == end:
+                    return None
+                f.seek(start)
+                data = f.read(end - start)
+    except FileNotFoundError:
+        return None
+    events = []
+    for line in data.splitlines():
+        line = line.strip()
+        # META_PATH events are extremely noisy and not so interesting, so
+        # avoid importing them - without needing to match them.
+        # TODO: perhaps avoiding these should be done at the query level?
+        if line.partition(b" ")[2].startswith(b"META_PATH "):
+            continue
+        m = _re_wq_function_log.fullmatch(line)
+        if m:
+            event_time = float(m[1])
+            if time_window is not None and not time_window.contains(event_time):
+                continue
+            events.append((event_time, m[2].decode(errors="replace")))
+    return events
+
+def import_individual_rundir(*, writer: BatchWriter, rundir: str, parsl_log: Optional["ParslLog"] = None, jobs: int = 1,
+                             time_window: Optional[TimeWindow] = None,
+                             sample: Optional[TaskSample] = None,
+                             sources: Optional[Set[str]] = None,
+                             offsets: Optional[LogOffsets] = None) -> ImportedWorkflow:
+    """Imports one rundir. parsl_log is the result of scan_parsl_log on
+    rundir/parsl.log, if the caller has already scanned it. jobs is the
+    number of processes that the importers of each kind of log can use. If
+    time_window is given, only the parts of the logs in it are imported,
+    and relations to spans outside of it are left out. If sample is given,
+    only the tasks that it keeps are imported. If sources is given, only
+    those of RUNDIR_SOURCES are imported (see import_rundir_sources).
+
+    If offsets is given, only the lines appended to each log since it was
+    last read are imported, and the tracing pickle only if it has changed
+    (see dnpcsql.logscan.LogOffsets). The writer should bind to existing
+    spans, as for import_rundir_sources, so that what is appended binds to
+    the spans that earlier imports made from the rest of the logs."""
+    if parsl_log is None:
+        parsl_log = scan_parsl_log(f"{rundir}/parsl.log", jobs=jobs, time_window=time_window, offsets=offsets)
+    run_id = parsl_log.run_id()
+    print(f"parsl.log run ID is {run_id}")
+
+    # the executor and Work Queue task ids of the tasks which are not in
+    # the sample are dropped from what was read from parsl.log, and the
+    # executor importers are given the ids that are left to import.
+    if sample is not None:
+        parsl_log = parsl_log.sampled(sample)
+
+    with writer.scoped(run_id):
+        return _import_individual_rundir(writer=writer, rundir=rundir, run_id=run_id, parsl_log=parsl_log, jobs=jobs,
+                                         time_window=time_window, sample=sample,
+                                         sources=set(RUNDIR_SOURCES) if sources is None else sources,
+                                         offsets=offsets)
+
+def _import_individual_rundir(*, writer: BatchWriter, rundir: str, run_id: str, parsl_log: "ParslLog", jobs: int,
+                              time_window: Optional[TimeWindow], sample: Optional[TaskSample],
+                              sources: Set[str], offsets: Optional[LogOffsets]) -> ImportedWorkflow:
+
+        task_to_span_id: Dict[int, int]
+        task_to_span_id = {}
+
+        task_try_to_span_id: Dict[Tuple[int, int], int]
+        task_try_to_span_id = {}
+
+        # this doesn't need to live in any parent namespace, but local_key_to_span_id
         # would like a namespace for it...
-        workflow_namespace: Dict[str, str]
+        workflow_namespace: Dict[str, int]
         workflow_namespace = {} 
-        workflow_span_uuid = local_key_to_span_uuid(
-            cursor = cursor,
+        workflow_span_id = local_key_to_span_id(
+            writer = writer,
             local_key = run_id,
             namespace = workflow_namespace,
             span_type = 'parsl.rundir.workflow',
             description = "Workflow from parsl rundir")
 
-        re_parsl_log_bind_task = re.compile('.* Parsl task (.*) try (.*) launched on executor (.*) with executor id (.*)')
+        def try_span(task_try_id: Tuple[int, int]) -> int:
+            """Makes the span of a parsl try that parsl.log says was
+            launched on an executor, or finds it if it is already there,
+            and binds it under its task, and the task under the workflow."""
+            (task_id, _) = task_try_id
+            task_span_id = local_key_to_span_id(
+                writer = writer,
+                local_key = task_id,
+                namespace = task_to_span_id,
+                span_type = 'parsl.rundir.task',
+                description = "Parsl task from rundir import")
+
+            try_span_id = local_key_to_span_id(
+                writer = writer,
+                local_key = task_try_id,
+                namespace = task_try_to_span_id,
+                span_type = 'parsl.rundir.try',
+                description = "Parsl try from rundir import")
+
+            # TODO: here and when creating subspans elsewhere: this doesn't need to be done repeatedly
+            # perhaps could happen as part of the local_to_span_id call? (passing in parent span?)
+            # which wouldn't cover all cases, but would cover some?
+            # or a helper which de-dupes.
+            store_subspan(writer=writer,
+                          superspan_id=task_span_id,
+                          subspan_id=try_span_id,
+                          key="rundir task try bind")
+            store_subspan(writer=writer,
+                          superspan_id=workflow_span_id,
+                          subspan_id=task_span_id,
+                          key="rundir task try bind")
+            return try_span_id
 
         print(f"Checking for Work Queue logs in rundir {rundir}")
 
@@ -349,25 +739,10 @@ def import_individual_rundir(*, dnpc_db, cursor, rundir: str) -> ImportedWorkflo
 
         wq_tl_filename = f"{rundir}/{executor_label}/transaction_log"
         print(f"looking for: {wq_tl_filename}")
-        if os.path.exists(wq_tl_filename):
-            # 140737354053440 parsl.executors.workqueue.executor:994 _work_queue_submit_wait INFO: Executor task 20362 submitted to Work Queue with Work Queue task id 20363
-            # -            logger.info("Task {} submitted to WorkQueue with id {}".format(task.id, wq_id))
-            #  logger.info("Executor task {} submitted to Work Queue with Work Queue task id {}".format(task.id, wq_id))
-            # this log line has two styles... style 1 is what is in master at time of writing, style 2 is from changes in desc branch to be clearer about the meaning of the word "task" as not referring to a parsl task
-            re_wqe_to_wq_1 = re.compile('.* Task ([0-9]+) submitted to WorkQueue with id ([0-9]+).*')
-            re_wqe_to_wq_2 = re.compile('.* Executor task ([0-9]+) submitted to Work Queue with Work Queue task id ([0-9]+).*')
-            #  Executor task 0 submitted as Work Queue task 1 -- where is this coming from?
-            re_wqe_to_wq_3 = re.compile('.* Executor task ([0-9]+) submitted as Work Queue task ([0-9]+).*')
-
-
-
-            # 1668431173.633931 2022-11-14 05:06:13 WorkQueue-Submit-Process-60316 MainThread-140737354053440 parsl.executors.workqueue.executor:1007 _work_queue_submit_wait DEBUG: Completed WorkQueue task 3047, parsl executor task 3046
-            # .* here before task because log message changed to add the word executor for clarity
-            # but that isn't in master at time of writing.
-            re_wq_compl = re.compile('([^ ]+) .* _work_queue_submit_wait .* Completed Work.*Queue task [0-9]+, parsl .*task ([0-9]+).*$')
-            re_wq_compl2 = re.compile('([^ ]+) .* _work_queue_submit_wait .* Completed Work.*Queue task [0-9]+, executor task ([0-9]+).*$')
-
-            wq_task_to_uuid = dnpcsql.workqueue.import_all(dnpc_db, wq_tl_filename)
+        if "workqueue" in sources and os.path.exists(wq_tl_filename):
+            wq_task_ids = set(parsl_log.wqe_to_wq.values()) if sample is not None else None
+            wq_task_to_span_id = dnpcsql.workqueue.import_all(writer, wq_tl_filename, jobs=jobs, time_window=time_window,
+                                                              task_ids=wq_task_ids, offsets=offsets)
 
             # now (via the wq executor task id) bind these together.
             # perhaps it would simplify things to make the in-parsl
@@ -379,200 +754,400 @@ def import_individual_rundir(*, dnpc_db, cursor, rundir: str) -> ImportedWorkflo
             # to specify the other end of the subspan relationship - eg by
             # collecting that information as we go along above.
 
-            task_try_to_wqe = {}
-            wqe_to_wq = {}
-            wqe_task_to_uuid: Dict[str, str] = {}
-            with open(parsl_log_filename, "r") as parsl_log:
-                for parsl_log_line in parsl_log:
-
-                    # this section binds an executor task to its containing
-                    # parsl task.
-                    m = re_parsl_log_bind_task.match(parsl_log_line)
-                    if m and m[3] == executor_label:
-                        task_try_id = (int(m[1]), int(m[2]))
-                        wqe_id = m[4]
-                        task_try_to_wqe[task_try_id] = wqe_id
-
-                    # this section binds a work queue task to its containing
-                    # executor task
-
-                    # try first form of log line, and if that doesn't match
-                    # fall through to the second style (in the form of an
-                    # alternative / OR operator)
-                    m = re_wqe_to_wq_1.match(parsl_log_line)
-                    if not m:
-                        m = re_wqe_to_wq_2.match(parsl_log_line)
-                    if not m:
-                        m = re_wqe_to_wq_3.match(parsl_log_line)
-
-                    if m:
-                        wqe_id = m[1]
-                        wq_id = m[2]
-                        wqe_to_wq[wqe_id] = wq_id
-
-                    m = re_wq_compl.match(parsl_log_line)
-                    if not m:
-                        m = re_wq_compl2.match(parsl_log_line)
-
-                    if m:
-                        e_time = float(m[1])
-                        wqe_id = m[2]
-                        print(f"wq executor level event for wqe id {wqe_id}")
-                        wqe_span_uuid = local_key_to_span_uuid(
-                            cursor = cursor,
-                            local_key = wqe_id,
-                            namespace = wqe_task_to_uuid,
-                            span_type = 'parsl.executors.workqueue.executor_task',
-                            description = "WorkQueueExecutor task from parsl.log")
-
-                        store_event(cursor=cursor,
-                                    span_uuid=wqe_span_uuid,
-                                    event_time=e_time,
-                                    event_type='executor_completed',
-                                    description='parsl.log entry for WQ Executor submit thread observing completion')
+            task_try_to_wqe = {task_try_id: wqe_id
+                               for (task_try_id, wqe_id) in parsl_log.executor_binds.get(executor_label, [])}
+            wqe_to_wq = parsl_log.wqe_to_wq
+
+            wqe_task_to_span_id: Dict[str, int] = {}
+            for (e_time, wqe_id) in parsl_log.wq_completions:
+                print(f"wq executor level event for wqe id {wqe_id}")
+                wqe_span_id = local_key_to_span_id(
+                    writer = writer,
+                    local_key = wqe_id,
+                    namespace = wqe_task_to_span_id,
+                    span_type = 'parsl.executors.workqueue.executor_task',
+                    description = "WorkQueueExecutor task from parsl.log")
+
+                store_event(writer=writer,
+                            span_id=wqe_span_id,
+                            event_time=e_time,
+                            event_type='executor_completed',
+                            description='parsl.log entry for WQ Executor submit thread observing completion')
 
             print(f"task_try_to_wqe: {task_try_to_wqe}")
             print(f"wqe_to_wq: {wqe_to_wq}")
 
-            assert len(wqe_to_wq) == len(task_try_to_wqe)
-            assert len(task_try_to_wqe) == len(wq_task_to_uuid)
-
-            print(f"len wq_task_to_uuid {len(wq_task_to_uuid)}")
-            print(f"len wqe_task_to_uuid {len(wqe_task_to_uuid)}")
-            assert len(wq_task_to_uuid) == len(wqe_task_to_uuid)
-
+            print(f"len wq_task_to_span_id {len(wq_task_to_span_id)}")
+            print(f"len wqe_task_to_span_id {len(wqe_task_to_span_id)}")
+
+            # in a time window, a task can have been launched, submitted
+            # and completed on either side of the window's ends, and when
+            # only the appended parts of the logs are read, in different
+            # imports, so these only line up for whole logs.
+            if time_window is None and offsets is None:
+                assert len(wqe_to_wq) == len(task_try_to_wqe)
+                assert len(task_try_to_wqe) == len(wq_task_to_span_id)
+                assert len(wq_task_to_span_id) == len(wqe_task_to_span_id)
+
+            # When only the appended parts of the logs are read, the two
+            # ends of a bind can be logged on either side of where one
+            # import stopped reading, so the executor task and Work Queue
+            # task spans are made here by their local keys, rather than
+            # only looked up among those that this import read. That makes
+            # the same spans as the importers of their own logs do, in this
+            # import or a later one.
             for (task_try_id, wqe_id) in task_try_to_wqe.items():
+                if (time_window is not None and wqe_id not in wqe_task_to_span_id and
+                        wqe_to_wq.get(wqe_id) not in wq_task_to_span_id):
+                    # the binds of every task are known, but this one did
+                    # nothing inside the time window
+                    continue
+
                 print(f"pairing task_try_id {task_try_id} to Work Queue Executor task id {wqe_id}")
 
-                (task_id, _) = task_try_id
-                task_span_uuid = local_key_to_span_uuid(
-                    cursor = cursor,
-                    local_key = task_id,
-                    namespace = task_to_uuid,
-                    span_type = 'parsl.rundir.task',
-                    description = "Parsl task from rundir import")
-
-                try_span_uuid = local_key_to_span_uuid(
-                    cursor = cursor,
-                    local_key = task_try_id,
-                    namespace = task_try_to_uuid,
-                    span_type = 'parsl.rundir.try',
-                    description = "Parsl try from rundir import")
-
-                # TODO: here and when creating subspans elsewhere: this doesn't need to be done repeatedly
-                # perhaps could happen as part of the local_to_span_uuid call? (passing in parent span?)
-                # which wouldn't cover all cases, but would cover some?
-                # or a helper which de-dupes.
-                cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)", (task_span_uuid, try_span_uuid, "rundir task try bind"))
-                cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)", (workflow_span_uuid, task_span_uuid, "rundir task try bind"))
-
-                wqe_id = task_try_to_wqe[task_try_id]
-                wqe_task_span_uuid = wqe_task_to_uuid[wqe_id]
-                cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)", (try_span_uuid, wqe_task_span_uuid, "parsl.executors.wq.task"))
-
-                wq_id = wqe_to_wq[wqe_id]
-                wq_span_uuid = wq_task_to_uuid[wq_id]
-                print(f"Pairing Work Queue Executor task {wqe_task_span_uuid} to wq task span {wq_span_uuid}")
+                try_span_id = try_span(task_try_id)
+
+                # in a time window, the executor task can have completed
+                # after the window, leaving it without an event, but it is
+                # still needed to link the try to its Work Queue task
+                wqe_task_span_id = local_key_to_span_id(
+                    writer = writer,
+                    local_key = wqe_id,
+                    namespace = wqe_task_to_span_id,
+                    span_type = 'parsl.executors.workqueue.executor_task',
+                    description = "WorkQueueExecutor task from parsl.log")
+                store_subspan(writer=writer,
+                              superspan_id=try_span_id,
+                              subspan_id=wqe_task_span_id,
+                              key="parsl.executors.wq.task")
+
+            for (wqe_id, wq_id) in wqe_to_wq.items():
+                if time_window is not None and (wqe_id not in wqe_task_to_span_id or wq_id not in wq_task_to_span_id):
+                    # one of the tasks is outside of the time window
+                    continue
+
+                wqe_task_span_id = local_key_to_span_id(
+                    writer = writer,
+                    local_key = wqe_id,
+                    namespace = wqe_task_to_span_id,
+                    span_type = 'parsl.executors.workqueue.executor_task',
+                    description = "WorkQueueExecutor task from parsl.log")
+                wq_span_id = local_key_to_span_id(
+                    writer = writer,
+                    local_key = wq_id,
+                    namespace = wq_task_to_span_id,
+                    span_type = 'workqueue.task',
+                    description = 'Work Queue TASK from transaction_log')
+                print(f"Pairing Work Queue Executor task {wqe_task_span_id} to wq task span {wq_span_id}")
 
                 # make a subspan relation that makes the wq task span
                 # a subspan of the try
 
-                cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)", (wqe_task_span_uuid, wq_span_uuid, "parsl.executors.wq.task"))
-            dnpc_db.commit()
-
-            # 1677161346.713548 META_PATH parsl.tests.test_regression.test_2555
-            re_parsl_wq_task_log = re.compile('^([0-9.]+) (.*)$')
-            # now look at importing parsl wq inside-executor loading logs
-            for wqe_id in wqe_to_wq.keys():
-                print(f"Looking for inside-executor loading logs for executor task ID {wqe_id}")
-                task_dir = "{:04d}".format(int(wqe_id))
-
-                function_log_filename = f"{rundir}/{executor_label}/function_data/{task_dir}/log"
-                print(f"Filename: {function_log_filename}")
-                if os.path.exists(function_log_filename):
-                    print("WQ task log file exists")
-
-                    wqe_task_log_span_uuid = str(uuid.uuid4())
-                    cursor.execute("INSERT INTO span (uuid, type, note) VALUES (?, ?, ?)", (wqe_task_log_span_uuid, 'parsl.executors.workqueue.executor_task.remote', 'parsl+wq executor'))
-
-                    with open(function_log_filename, "r") as f:
-                      for log_line in f.readlines():
-                        print(log_line)
-                        m = re_parsl_wq_task_log.match(log_line.strip())
-                        if m:
-                          print("Match")
-                          event_time=float(m[1])
-                          event_type=m[2]
-
-                          # These events are extremely noisy and not so
-                          # interesting so avoid importing them.
-                          # TODO: perhaps avoiding these should be done
-                          # at the query level?
-                          if event_type.startswith("META_PATH "):
-                            continue
-
-                          store_event(cursor=cursor,
-                                      span_uuid=wqe_task_log_span_uuid,
-                                      event_time=event_time,
-                                      event_type=event_type,
-                                      description='parsl wq remote task log entry')
-
-                    wq_id = wqe_to_wq[wqe_id]
-                    wq_span_uuid = wq_task_to_uuid[wq_id]
-                    cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)", (wq_span_uuid, wqe_task_log_span_uuid, "parsl.executors.wq.task.remote"))
-
-            dnpc_db.commit()
-
-        executor_label = "htex_Local"
-        htex_task_to_uuid = import_htex(
-            cursor=cursor,
-            rundir=rundir)
-
-        # now bind htex tasks to parsl tries
-        # this code is related to code in the work queue importing code
-        # that does the same "executor level task ID to parsl level
-        # try ID", but WQ has an extra layer of IDs beyond the executor
-        # task ID that htex does not.
-
-        with open(parsl_log_filename, "r") as parsl_log:
-            for parsl_log_line in parsl_log:
-                m = re_parsl_log_bind_task.match(parsl_log_line)
-                if m and m[3] == executor_label:
-                    task_try_id = (int(m[1]), int(m[2]))
-                    htex_task_id = int(m[4])
-
-                    task_try_uuid = task_try_to_uuid[task_try_id]
-                    htex_task_uuid = htex_task_to_uuid[htex_task_id]
-                    cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)", (task_try_uuid, htex_task_uuid, "htex subtask"))
-
-        dnpc_db.commit()
-
-        # nothing above has anything to do with tasks, only with tries
-        # so for now can get away with using the tracing_task_to_uuid
-        # namespace as the only thing we're returning for task_to_uuid.
-        # TODO: later, I'd like to match up more things from parsl.tracing,
-        # not only tasks (most specifically tries)
-        t: ImportedWorkflow
-        t = import_parsl_tracing(
-            cursor = cursor,
-            rundir = rundir)
+                store_subspan(writer=writer,
+                              superspan_id=wqe_task_span_id,
+                              subspan_id=wq_span_id,
+                              key="parsl.executors.wq.task")
+            writer.commit()
+
+            # now look at importing parsl wq inside-executor loading logs.
+            # There is one small log for each executor task, so reading them
+            # is dominated by the latency of opening each file rather than
+            # by parsing: they are read and parsed by a pool of threads, a
+            # bounded number ahead of this loop, which writes what they
+            # read in executor task order.
+            #
+            # When only the appended parts of the logs are read, the log of
+            # an executor task can grow after the import which read its
+            # submission, so the logs of the executor tasks which earlier
+            # imports paired with Work Queue tasks are read too.
+            function_log_wq_ids = dict(wqe_to_wq)
+            if offsets is not None:
+                function_log_wq_ids = {**existing_wq_task_ids(writer), **wqe_to_wq}
+            wqe_task_log_to_span_id: Dict[str, int] = {}
+            wqe_ids = list(function_log_wq_ids.keys())
+            function_log_filenames = [f"{rundir}/{executor_label}/function_data/{int(wqe_id):04d}/log"
+                                      for wqe_id in wqe_ids]
+            print(f"Reading inside-executor loading logs for {len(wqe_ids)} executor tasks")
+            function_logs_read = 0
+            with ThreadPoolExecutor(max_workers=FUNCTION_LOG_THREADS) as pool:
+                function_logs = map_in_order(pool, functools.partial(read_wq_function_log, time_window=time_window,
+                                                                     offsets=offsets),
+                                             function_log_filenames, window=FUNCTION_LOG_WINDOW)
+                for (wqe_id, function_log_events) in zip(wqe_ids, function_logs):
+                    if function_log_events is None or (time_window is not None and function_log_events == []):
+                        # no log (or nothing appended to it), or (now that
+                        # every submitted executor task is listed) no events
+                        # inside the time window
+                        continue
+                    function_logs_read += 1
+
+                    wqe_task_log_span_id = local_key_to_span_id(
+                        writer = writer,
+                        local_key = wqe_id,
+                        namespace = wqe_task_log_to_span_id,
+                        span_type = 'parsl.executors.workqueue.executor_task.remote',
+                        description = 'parsl+wq executor')
+
+                    for (event_time, event_type) in function_log_events:
+                        store_event(writer=writer,
+                                    span_id=wqe_task_log_span_id,
+                                    event_time=event_time,
+                                    event_type=event_type,
+                                    description='parsl wq remote task log entry')
+
+                    wq_id = function_log_wq_ids[wqe_id]
+                    if time_window is not None and wq_id not in wq_task_to_span_id:
+                        continue
+                    wq_span_id = local_key_to_span_id(
+                        writer = writer,
+                        local_key = wq_id,
+                        namespace = wq_task_to_span_id,
+                        span_type = 'workqueue.task',
+                        description = 'Work Queue TASK from transaction_log')
+                    store_subspan(writer=writer,
+                                  superspan_id=wq_span_id,
+                                  subspan_id=wqe_task_log_span_id,
+                                  key="parsl.executors.wq.task.remote")
+            print(f"Read {function_logs_read} inside-executor loading logs")
+
+            writer.commit()
+
+        if "htex" in sources:
+            executor_label = "htex_Local"
+            htex_task_ids = None
+            if sample is not None:
+                htex_task_ids = {int(executor_task_id)
+                                 for (_, executor_task_id) in parsl_log.executor_binds.get(executor_label, [])}
+            htex_task_to_span_id = import_htex(
+                writer=writer,
+                rundir=rundir,
+                jobs=jobs,
+                time_window=time_window,
+                task_ids=htex_task_ids,
+                offsets=offsets)
+
+            # now bind htex tasks to parsl tries
+            # this code is related to code in the work queue importing code
+            # that does the same "executor level task ID to parsl level
+            # try ID", but WQ has an extra layer of IDs beyond the executor
+            # task ID that htex does not.
+
+            for (task_try_id, executor_task_id) in parsl_log.executor_binds.get(executor_label, []):
+                htex_task_id = int(executor_task_id)
+
+                if offsets is None and htex_task_id not in htex_task_to_span_id:
+                    # the htex task is outside of the time window
+                    continue
+
+                # as for Work Queue tasks above, the try span is made here
+                # if no other source has made it
+                task_try_span_id = try_span(task_try_id)
+
+                # when only appended lines are read, the interchange can
+                # log the task after this import stops reading, so its span
+                # is made by its local key, as for Work Queue tasks above
+                htex_task_span_id = local_key_to_span_id(
+                    writer = writer,
+                    local_key = htex_task_id,
+                    namespace = htex_task_to_span_id,
+                    span_type = 'parsl.executor.htex.interchange.task',
+                    description = 'from interchange.log')
+                store_subspan(writer=writer,
+                              superspan_id=task_try_span_id,
+                              subspan_id=htex_task_span_id,
+                              key="htex subtask")
+
+        writer.commit()
+
+        store_task_keys(writer=writer,
+                        source=RUNDIR_SOURCE,
+                        run_id=run_id,
+                        task_to_span_id=task_to_span_id,
+                        task_try_to_span_id=task_try_to_span_id)
 
-        dnpc_db.commit()
+        w = ImportedWorkflow(run_id = run_id,
+                             workflow_span_id = workflow_span_id)
+
+        # the tracing pickle is written whole, at the end of a workflow, so
+        # when only appended lines are read, it is imported again only if
+        # it has changed
+        tracing_filename = f"{rundir}/parsl_tracing.pickle"
+        if offsets is not None and "tracing" in sources and os.path.exists(tracing_filename):
+            if offsets.unchanged(tracing_filename):
+                sources = sources - {"tracing"}
+            else:
+                offsets.read_whole(tracing_filename)
 
+        if "tracing" not in sources:
+            # the tasks and tries of the rundir are still bound to those of
+            # any other sources which are already in the database
+            bind_tasks_and_tries(writer=writer, run_id=run_id)
+            return w
 
-        w = ImportedWorkflow(run_id = run_id,
-                             workflow_span_uuid = workflow_span_uuid,
-                             task_to_uuid = task_to_uuid,
-                             task_try_to_uuid = task_try_to_uuid)
+        t: ImportedWorkflow
+        t = import_parsl_tracing(
+            writer = writer,
+            rundir = rundir,
+            run_id = run_id,
+            sample = sample)
+
+        writer.commit()
 
         print("Binding tracing and rundir tasks")
-        tw = bind_workflow_account_tasks(cursor=cursor,
+        tw = bind_workflow_account_tasks(writer=writer,
                                          left=t, 
                                          right=w)
 
         return tw
 
-def import_parsl_tracing(*, cursor: sqlite3.Cursor, rundir: str) -> ImportedWorkflow:
+def existing_wq_task_ids(writer: BatchWriter) -> Dict[str, str]:
+    """Returns the Work Queue task id of each Work Queue executor task
+    which an earlier import of the rundir in the writer's current scope
+    paired with one, found from the local keys of their spans and the
+    subspan which pairs them."""
+    writer.flush()
+
+    def local_keys(namespace: str) -> Dict[int, Any]:
+        return {span_id: ast.literal_eval(key)
+                for (key, span_id) in writer.db.execute("SELECT key, span_id FROM local_key WHERE scope = ? AND namespace = ?",
+                                                        (writer.scope_name(), namespace))}
+
+    wqe_ids = local_keys('parsl.executors.workqueue.executor_task')
+    wq_ids = local_keys('workqueue.task')
+    wq_task_ids = {}
+    for (wqe_span_id, wqe_id) in wqe_ids.items():
+        for (wq_span_id,) in writer.db.execute("SELECT subspan_id FROM subspan WHERE superspan_id = ?", (wqe_span_id,)):
+            if wq_span_id in wq_ids:
+                wq_task_ids[wqe_id] = wq_ids[wq_span_id]
+    return wq_task_ids
+
+def rundir_run_id(rundir: str) -> str:
+    """Returns the run id of the workflow logged in rundir/parsl.log"""
+    return scan_parsl_log(f"{rundir}/parsl.log").run_id()
+
+# 1680018839.952707 2023-03-28 08:53:59 MainProcess-60832 MainThread-23046009736064 parsl.dataflow.dflow:121 __init__ INFO: Run id is: 88f840fd-dc4a-45e4-9956-2ef5d4aad63a
+_re_run_id = re.compile('.* Run id is: ([^ ]*)\n$')
+
+_re_bind_task = re.compile('.* Parsl task (.*) try (.*) launched on executor (.*) with executor id (.*)')
+
+# 140737354053440 parsl.executors.workqueue.executor:994 _work_queue_submit_wait INFO: Executor task 20362 submitted to Work Queue with Work Queue task id 20363
+# -            logger.info("Task {} submitted to WorkQueue with id {}".format(task.id, wq_id))
+#  logger.info("Executor task {} submitted to Work Queue with Work Queue task id {}".format(task.id, wq_id))
+# this log line has two styles... style 1 is what is in master at time of writing, style 2 is from changes in desc branch to be clearer about the meaning of the word "task" as not referring to a parsl task
+_re_wqe_to_wq_1 = re.compile('.* Task ([0-9]+) submitted to WorkQueue with id ([0-9]+).*')
+_re_wqe_to_wq_2 = re.compile('.* Executor task ([0-9]+) submitted to Work Queue with Work Queue task id ([0-9]+).*')
+#  Executor task 0 submitted as Work Queue task 1 -- where is this coming from?
+_re_wqe_to_wq_3 = re.compile('.* Executor task ([0-9]+) submitted as Work Queue task ([0-9]+).*')
+
+# 1668431173.633931 2022-11-14 05:06:13 WorkQueue-Submit-Process-60316 MainThread-140737354053440 parsl.executors.workqueue.executor:1007 _work_queue_submit_wait DEBUG: Completed WorkQueue task 3047, parsl executor task 3046
+# .* here before task because log message changed to add the word executor for clarity
+# but that isn't in master at time of writing.
+_re_wq_compl = re.compile('([^ ]+) .* _work_queue_submit_wait .* Completed Work.*Queue task [0-9]+, parsl .*task ([0-9]+).*$')
+_re_wq_compl2 = re.compile('([^ ]+) .* _work_queue_submit_wait .* Completed Work.*Queue task [0-9]+, executor task ([0-9]+).*$')
+
+@dataclass
+class ParslLog:
+    """What the rundir importers need from one parsl.log."""
+    path: str
+
+    # every run id logged, which should be exactly one
+    run_ids: List[str]
+
+    # executor label -> ((parsl task id, try id), executor task id) binds,
+    # in log order
+    executor_binds: Dict[str, List[Tuple[Tuple[int, int], str]]]
+
+    # Work Queue executor task id -> Work Queue task id
+    wqe_to_wq: Dict[str, str]
+
+    # (time, Work Queue executor task id) for each completion observed by
+    # the Work Queue executor submit thread, in log order
+    wq_completions: List[Tuple[float, str]]
+
+    def run_id(self) -> str:
+        # look for a run id UUID, and check there is only one,
+        # because parsl.log can contain multiple workflows,
+        # without disambiguating tasks/tries/blocks/... with the
+        # same sequential ID.
+        assert len(self.run_ids) == 1, "parsl.log must contain exactly one run ID"
+        return self.run_ids[0]
+
+    def sampled(self, sample: TaskSample) -> "ParslLog":
+        """Returns this log with only the tasks that sample keeps: their
+        executor binds, and the Work Queue submissions and completions of
+        their executor tasks."""
+        run_id = self.run_id()
+        executor_binds = {label: [(task_try_id, executor_task_id)
+                                  for (task_try_id, executor_task_id) in binds
+                                  if sample.keeps(run_id, task_try_id[0])]
+                          for (label, binds) in self.executor_binds.items()}
+        # the Work Queue executor's label, as in _import_individual_rundir
+        wqe_ids = {wqe_id for (_, wqe_id) in executor_binds.get("WorkQueueExecutor", [])}
+        return ParslLog(path=self.path,
+                        run_ids=self.run_ids,
+                        executor_binds=executor_binds,
+                        wqe_to_wq={wqe_id: wq_id for (wqe_id, wq_id) in self.wqe_to_wq.items() if wqe_id in wqe_ids},
+                        wq_completions=[(t, wqe_id) for (t, wqe_id) in self.wq_completions if wqe_id in wqe_ids])
+
+# Each kind of line is recognised by a fixed substring that every line of
+# that kind contains, before any regex is tried. The Work Queue
+# submissions and completions have several styles of log line, which are
+# tried in order (in the form of an alternative / OR operator).
+_run_id_pattern = LogPattern("run_id", " Run id is: ", [_re_run_id])
+
+_parsl_log_patterns = [
+    _run_id_pattern,
+    # this binds an executor task to its containing parsl try.
+    LogPattern("bind_task", " launched on executor ", [_re_bind_task]),
+    # this binds a work queue task to its containing executor task.
+    LogPattern("wqe_to_wq", " submitted ", [_re_wqe_to_wq_1, _re_wqe_to_wq_2, _re_wqe_to_wq_3]),
+    LogPattern("wq_completion", "_work_queue_submit_wait", [_re_wq_compl, _re_wq_compl2]),
+]
+
+def scan_parsl_log(path: str, jobs: int = 1, time_window: Optional[TimeWindow] = None,
+                   offsets: Optional[LogOffsets] = None, run_id: Optional[str] = None) -> ParslLog:
+    """Reads parsl.log once, collecting the run id, executor binds and Work
+    Queue submissions and completions for the later import stages.
+
+    parsl.log can be many gigabytes, and almost all of its lines are none
+    of these, so each line is first checked for a fixed substring that every
+    line of a kind contains - which is much cheaper than a regex match -
+    and only the regexes for the kinds of line that it might be are tried.
+    If jobs is more than 1, parts of the file are scanned by that many
+    worker processes (see dnpcsql.logscan).
+
+    If time_window is given, only the Work Queue completions in it are
+    kept. The run id, binds and submissions are still collected from the
+    whole file: they are logged when a task is launched, which can be
+    before the window for a task which runs inside it, or just after the
+    window for a Work Queue task whose first events are inside it.
+
+    If offsets is given, only the lines appended since parsl.log was last
+    read are scanned (see dnpcsql.logscan.LogOffsets). Those do not usually
+    include the run id, so run_id gives it, if it is known.
+    """
+    parsl_log = ParslLog(path=path, run_ids=[], executor_binds={}, wqe_to_wq={}, wq_completions=[])
+
+    for (kind, m) in scan_log(path, _parsl_log_patterns, jobs=jobs, offsets=offsets):
+        if kind == "run_id":
+            parsl_log.run_ids.append(m[0])
+        elif kind == "bind_task":
+            task_try_id = (int(m[0]), int(m[1]))
+            parsl_log.executor_binds.setdefault(m[2], []).append((task_try_id, m[3]))
+        elif kind == "wqe_to_wq":
+            parsl_log.wqe_to_wq[m[0]] = m[1]
+        elif kind == "wq_completion":
+            completion_time = float(m[0])
+            if time_window is None or time_window.contains(completion_time):
+                parsl_log.wq_completions.append((completion_time, m[1]))
+
+    if run_id is not None and run_id not in parsl_log.run_ids:
+        parsl_log.run_ids.append(run_id)
+
+    return parsl_log
+
+def import_parsl_tracing(*, writer: BatchWriter, rundir: str, run_id: Optional[str] = None,
+                         sample: Optional[TaskSample] = None) -> ImportedWorkflow:
     # Now import pickled event stats from parsl_tracing.pickle which is
     # a DESC-branch specific development.
     # Right now there isn't enough info to tie such a pickle file into
@@ -582,27 +1157,23 @@ def import_parsl_tracing(*, cursor: sqlite3.Cursor, rundir: str) -> ImportedWork
     # particular DFK.
     # so this code will have to make some assumptions.
 
-    # TODO: this code returns details about tasks as far as the
-    # tracing code is concerned ... but there are also tries in there
-    # which should be tied in to tries in other representations
-    # - so maybe tracing should return an ImportedWorkflow and be
-    # joined in, in the rundir code (or above) in the same way as I
-    # was intending to deep-join rundir and monitoring workflows?
+    # The tasks and tries in the trace are recorded in task_key and try_key,
+    # and tied in to the tasks and tries of other representations by the
+    # rundir code (or above), in the same way as rundir and monitoring
+    # workflows are deep-joined.
 
-    workflow_to_uuid: Dict[None, str]
-    workflow_to_uuid = {}
+    workflow_to_span_id: Dict[None, int]
+    workflow_to_span_id = {}
 
     # TODO: this is a bit weird because there is no workflow level span in the trace...
     # but maybe there should be? or maybe it's fine to infer it here.
     # or maybe we just don't need one at all, because the tracing system doesn't
     # represent one at the moment?
-    workflow_span_uuid = local_key_to_span_uuid(cursor = cursor,
-                                                local_key = None, # no run id, but that's not necessary here for internal use
-                                                namespace = workflow_to_uuid,
-                                                span_type = 'parsl.tracing.workflow',
-                                                description = "Parsl workflow from tracing import")
-
-    tracing_task_to_uuid = {}
+    workflow_span_id = local_key_to_span_id(writer = writer,
+                                            local_key = None, # no run id, but that's not necessary here for internal use
+                                            namespace = workflow_to_span_id,
+                                            span_type = 'parsl.tracing.workflow',
+                                            description = "Parsl workflow from tracing import")
 
     # TODO: this decision should be made in rundir importer, and
     # this importer should take a whole path to the pickle file,
@@ -620,38 +1191,28 @@ def import_parsl_tracing(*, cursor: sqlite3.Cursor, rundir: str) -> ImportedWork
         # either in an event or a bind, so a span cannot exist in
         # isolation with neither events nor binds.
 
-        tracing_span_uuids: Dict[Tuple[str, str], str] = {}
+        tracing_span_ids: Dict[Tuple[str, Any], int] = {}
 
         for e in parsl_tracing['events']:
             event_time = e[0]
             event_name = e[1]
             span_type = e[2]
-            span_id = e[3]
+            tracing_span_id = e[3]
+
+            if sample is not None and not _tracing_span_sampled(sample, run_id, span_type, tracing_span_id):
+                continue
 
-            k = (span_type, span_id)
+            k = (span_type, tracing_span_id)
 
-            span_uuid = local_key_to_span_uuid(
-                cursor = cursor,
+            span_id = local_key_to_span_id(
+                writer = writer,
                 local_key = k,
-                namespace = tracing_span_uuids,
+                namespace = tracing_span_ids,
                 span_type = "parsl.tracing." + span_type,
                 description = "imported from parsl_tracing")
 
-            # TODO: can this be inferred later on in a binding stage
-            # because the keys of tracing_span_uuids already
-            # contain this information? it would split more nicely along
-            # the importer A / importer B / binder A<->B modularisation
-            # idea?
-            if span_type == "TASK":
-                # TODO: if we're putting in an implicit workflow span
-                # (which I'm unsure about)
-                # then this task should be bound into the workflow span.
-                tracing_task_id = span_id
-                # print(f"Found tracing TASK with ID {tracing_task_id}")
-                tracing_task_to_uuid[tracing_task_id] = span_uuid
-
-            store_event(cursor=cursor,
-                        span_uuid=span_uuid,
+            store_event(writer=writer,
+                        span_id=span_id,
                         event_time=event_time,
                         event_type=event_name,
                         description='imported from parsl_tracing')
@@ -662,28 +1223,60 @@ def import_parsl_tracing(*, cursor: sqlite3.Cursor, rundir: str) -> ImportedWork
             sub_type = b[2]
             sub_id = b[3]
 
+            if sample is not None and not (_tracing_span_sampled(sample, run_id, super_type, super_id) and
+                                           _tracing_span_sampled(sample, run_id, sub_type, sub_id)):
+                continue
+
             super_k = (super_type, super_id)
 
-            super_uuid = local_key_to_span_uuid(
-                cursor = cursor,
+            super_span_id = local_key_to_span_id(
+                writer = writer,
                 local_key = super_k,
-                namespace = tracing_span_uuids,
+                namespace = tracing_span_ids,
                 span_type = "parsl.tracing." + super_type,
                 description = "imported from parsl_tracing")
 
             sub_k = (sub_type, sub_id)
 
-            sub_uuid = local_key_to_span_uuid(
-                cursor = cursor,
+            sub_span_id = local_key_to_span_id(
+                writer = writer,
                 local_key = sub_k,
-                namespace = tracing_span_uuids,
+                namespace = tracing_span_ids,
                 span_type = "parsl.tracing." + sub_type,
                 description = "imported from parsl_tracing")
 
-            cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)", (super_uuid, sub_uuid, str((sub_type, sub_id))))
-
-    # TODO: implement task_try_to_uuid
-    return ImportedWorkflow(run_id = None, workflow_span_uuid = workflow_span_uuid, task_to_uuid = tracing_task_to_uuid, task_try_to_uuid = {})
+            store_subspan(writer=writer,
+                          superspan_id=super_span_id,
+                          subspan_id=sub_span_id,
+                          key=str((sub_type, sub_id)))
+
+        # TASK spans are keyed by parsl task id and TRY spans by (task id,
+        # try id), so they are recorded for binding to the tasks and tries
+        # of other sources - which is left to a binding stage, rather than
+        # done here, along the importer A / importer B / binder A<->B
+        # modularisation idea.
+        # TODO: if we're putting in an implicit workflow span
+        # (which I'm unsure about)
+        # then tasks should be bound into the workflow span.
+        if run_id is not None:
+            store_task_keys(writer=writer,
+                            source=TRACING_SOURCE,
+                            run_id=run_id,
+                            task_to_span_id={k: v for ((t, k), v) in tracing_span_ids.items() if t == "TASK"},
+                            task_try_to_span_id={k: v for ((t, k), v) in tracing_span_ids.items() if t == "TRY"})
+
+    return ImportedWorkflow(run_id = run_id, workflow_span_id = workflow_span_id)
+
+def _tracing_span_sampled(sample: TaskSample, run_id: Optional[str], span_type: str, tracing_span_id) -> bool:
+    # TASK spans are identified by parsl task id, and TRY spans by (task
+    # id, try id); spans of other types do not belong to a single task, so
+    # they are always kept.
+    if span_type == "TASK":
+        return sample.keeps(run_id, tracing_span_id)
+    elif span_type == "TRY":
+        return sample.keeps(run_id, tracing_span_id[0])
+    else:
+        return True
 
 def db_time_to_unix(s: str):
     return datetime.datetime.fromisoformat(s).timestamp()
@@ -1,31 +1,34 @@
+import argparse
 import itertools
 import matplotlib.pyplot as plt
-import sqlite3
-import sys
 import dnpcsql.queries as queries
+from dnpcsql.db import add_db_argument, add_run_id_argument, connect_read_only
+from dnpcsql.derived import has_table
 
 from typing import Dict, List, Tuple
 
 if __name__ == "__main__":
 
-    if len(sys.argv) == 2:
-        root_span_type = sys.argv[1]
-    else:
-        root_span_type = "parsl.monitoring.task"
+    parser = argparse.ArgumentParser()
+    parser.add_argument("root_span_type", nargs="?", default="parsl.monitoring.task",
+                        help="type of the root spans to collect events under")
+    add_db_argument(parser)
+    add_run_id_argument(parser)
+    args = parser.parse_args()
+
+    root_span_type = args.root_span_type
     print(f"Looking for events rooted in span type {root_span_type}")
 
     # make a plot over time of how many tasks are in each state
 
-    query = queries.events_for_root_span_type(root_span_type)
-
-    db_name = "dnpc.sqlite3"
-    db = sqlite3.connect(db_name,
-                         detect_types=sqlite3.PARSE_DECLTYPES |
-                         sqlite3.PARSE_COLNAMES)
+    db = connect_read_only(args.db, args.run_ids)
 
     cursor = db.cursor()
 
-    # select descs.root_span_uuid, event.time, span.type, event.type, event.uuid
+    query = queries.events_for_root_span_type(root_span_type,
+                                              use_closure=has_table(db, "span_closure"))
+
+    # select descs.root_span_id, event.time, span.type, event.type, event.id
     rows = list(cursor.execute(query))
 
     # get each task's flattened event stream, grouped by task span
@@ -35,7 +38,7 @@ if __name__ == "__main__":
 
     # Concretise the two levels of iterators returned by itertools into
     # list objects.
-    groups = [(list(g)) for (_uuid, g) in groups_]
+    groups = [(list(g)) for (_id, g) in groups_]
 
     # check we end up with the same number of events after grouping...
     # because i am seeing weird behaviour:
@@ -55,13 +58,13 @@ if __name__ == "__main__":
     events = []
 
     for g in groups:
-        print(f"==== group with root span uuid {g[0][0]}")
+        print(f"==== group with root span id {g[0][0]}")
         g.sort(key=lambda r: r[1])
         last_event_name = None
 
         started = False
         cut = False
-        for (root_span_uuid, event_time, span_type, event_type, event_uuid) in g:
+        for (root_span_id, event_time, span_type, event_type, event_id) in g:
             event_name = span_type + "/" + event_type
 
             should_start = True
@@ -85,16 +88,16 @@ if __name__ == "__main__":
             if cut or not started:
                 pass
             elif should_cut and last_event_name:  # no more processing
-                events.append((last_event_name, float(event_time), -1))
+                events.append((last_event_name, event_time, -1))
                 cut = True
             elif should_cut:
                 cut = True
             elif last_event_name and last_event_name != event_name:
-                events.append((last_event_name, float(event_time), -1))
-                events.append((event_name, float(event_time), 1))
+                events.append((last_event_name, event_time, -1))
+                events.append((event_name, event_time, 1))
                 last_event_name = event_name
             elif last_event_name is None:
-                events.append((event_name, float(event_time), 1))
+                events.append((event_name, event_time, 1))
                 last_event_name = event_name
             else:  # last_event_name was specified but this is a transition to the same state, so ignore
                 pass
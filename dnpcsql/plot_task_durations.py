@@ -1,13 +1,22 @@
+import argparse
+
 import dnpcsql.twoevents
+from dnpcsql.db import add_db_argument, add_run_id_argument
 
 parsl_task_invoked_to_returned = """
      SELECT event_start.time,
             event_end.time - event_start.time
        FROM event as event_start,
             event as event_end
-      WHERE event_start.span_uuid = event_end.span_uuid
+      WHERE event_start.span_id = event_end.span_id
         and event_start.type = "invoked"
         and event_end.type="returned";
 """
 
-dnpcsql.twoevents.plot(parsl_task_invoked_to_returned, "parsl-task-durations", "parsl app invoked", "parsl app returned")
+parser = argparse.ArgumentParser()
+add_db_argument(parser)
+add_run_id_argument(parser)
+args = parser.parse_args()
+
+dnpcsql.twoevents.plot(parsl_task_invoked_to_returned, "parsl-task-durations", "parsl app invoked", "parsl app returned",
+                       db_path=args.db, run_ids=args.run_ids)
@@ -1,28 +1,122 @@
+def events_for_root_span_type(root_span_type: str, use_closure: bool = False):
+    """Returns a query for every event in every span that is reachable from
+    a span of type root_span_type, by following subspan relations down and
+    facet relations in either direction, ordered by root span and time.
+
+    If use_closure is True, the query reads the reachable spans from the
+    span_closure table (see dnpcsql.derived), which must exist; otherwise
+    it finds them with a recursive query over subspan and facet.
+    """
+    if use_closure:
+        return f"""
+  select span_closure.root_id, event.time, span.type, event.type, event.id
+    from span as root, span_closure, span, event
+   where root.type="{root_span_type}"
+     and span_closure.root_id = root.id
+     and span.id = span_closure.descendant_id
+     and event.span_id = span.id
+order by span_closure.root_id, event.time;
+    """
 
-def events_for_root_span_type(root_span_type: str):
     return f"""
 with recursive
 
-  descs(root_span_uuid, span_uuid) as (
-    select span.uuid, span.uuid from span where span.type="{root_span_type}"
+  descs(root_span_id, span_id) as (
+    select span.id, span.id from span where span.type="{root_span_type}"
     union
-    select descs.root_span_uuid, subspan.subspan_uuid
+    select descs.root_span_id, subspan.subspan_id
       from subspan, descs
-     where subspan.superspan_uuid = descs.span_uuid
+     where subspan.superspan_id = descs.span_id
     union
-    select descs.root_span_uuid, facet.right_uuid
+    select descs.root_span_id, facet.right_id
      from facet, descs
-     where facet.left_uuid = descs.span_uuid
+     where facet.left_id = descs.span_id
     union
-    select descs.root_span_uuid, facet.left_uuid
+    select descs.root_span_id, facet.left_id
      from facet, descs
-     where facet.right_uuid = descs.span_uuid
+     where facet.right_id = descs.span_id
   )
 
-  select descs.root_span_uuid, event.time, span.type, event.type, event.uuid
+  select descs.root_span_id, event.time, span.type, event.type, event.id
     from descs, span, event
-   where span.uuid = descs.span_uuid
-     and event.span_uuid = span.uuid
-order by root_span_uuid, event.time;
+   where span.id = descs.span_id
+     and event.span_id = span.id
+order by root_span_id, event.time;
+    """
+
+
+def slowest_spans(span_type: str, limit: int):
+    """Returns a query for the limit longest spans of type span_type, from
+    the span_summary table, with their first and last event types.
+    """
+    return f"""
+  select span_summary.span_id, span_summary.first_time, span_summary.duration,
+         span_summary.event_count, first_event_type.name, last_event_type.name
+    from span_type, span_summary
+         left join event_type as first_event_type on first_event_type.id = span_summary.first_event_type_id
+         left join event_type as last_event_type on last_event_type.id = span_summary.last_event_type_id
+   where span_type.name = "{span_type}"
+     and span_summary.type_id = span_type.id
+     and span_summary.duration is not null
+order by span_summary.duration desc
+   limit {int(limit)};
+    """
+
+
+def events_for_entities_of_span_type(span_type: str):
+    """Returns a query for every event of every entity (see span_entity in
+    dnpcsql.derived) which has a span of type span_type, ordered by entity
+    and time. This follows facet relations only, not subspan relations.
     """
+    return f"""
+  select span_entity.entity_id, event.time, span.type, event.type, event.id
+    from span_entity, span, event
+   where span_entity.entity_id in (select root_entity.entity_id
+                                     from span as root, span_entity as root_entity
+                                    where root.type = "{span_type}"
+                                      and root_entity.span_id = root.id)
+     and span.id = span_entity.span_id
+     and event.span_id = span.id
+order by span_entity.entity_id, event.time;
+    """
+
 
+def wq_transfers():
+    """Returns a query for every Work Queue file transfer (the TRANSFER_INPUT
+    and TRANSFER_OUTPUT events of workqueue.task spans), ordered by time,
+    with its direction, size in MB, walltime in seconds, cache flag and
+    file name (from event_attribute), and the address of the worker that
+    the transfer was to or from.
+
+    The transaction log does not name the worker in a transfer record, so
+    it is taken from a RUNNING event of the task: inputs are sent before a
+    task runs, so from the first RUNNING event after an input transfer, and
+    outputs are fetched after it has run, so from the last RUNNING event
+    before an output transfer.
+    """
+    worker = """
+         (select worker.value
+            from event as running, event_attribute as worker
+           where running.span_id = transfer.span_id
+             and running.type = "RUNNING"
+             and worker.event_id = running.id
+             and worker.name = "worker"
+             and running.time {} transfer.time
+        order by running.time {}
+           limit 1)"""
+    return f"""
+  select transfer.time, transfer.type, size.value, walltime.value, cached.value, filename.value,
+         case when transfer.type = "TRANSFER_INPUT"
+              then {worker.format(">=", "asc")}
+              else {worker.format("<=", "desc")}
+         end
+    from span, event as transfer
+         left join event_attribute as size on size.event_id = transfer.id and size.name = "size_mb"
+         left join event_attribute as walltime on walltime.event_id = transfer.id and walltime.name = "walltime"
+         left join event_attribute as cached on cached.event_id = transfer.id and cached.name = "cached"
+         left join event_attribute as filename on filename.event_id = transfer.id and filename.name = "filename"
+   where span.type = "workqueue.task"
+     and transfer.span_id = span.id
+     and transfer.type in ("TRANSFER_INPUT", "TRANSFER_OUTPUT")
+order by transfer.time;
+    """
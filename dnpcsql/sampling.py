@@ -0,0 +1,66 @@
+"""Sampled imports: importing only a fraction of the tasks of a workflow.
+
+Whether a task is kept is decided by a hash of its run id and parsl task
+id, so every importer - monitoring.db, parsl.log, htex, Work Queue and
+parsl tracing - makes the same decision about the same task without
+needing to know about the others, and the spans which they import for a
+kept task can still be bound together. Importing the same runs again at
+the same rate keeps the same tasks.
+
+Spans which are not tasks (workflows, htex managers and workers, Work
+Queue workers) are always imported.
+
+The rate is recorded in the import_metadata table of the database, so that
+analyses can scale counts of tasks back up by 1 / rate.
+"""
+
+import hashlib
+import sqlite3
+
+from dataclasses import dataclass
+from typing import Optional
+
+from dnpcsql.shards import has_object
+
+
+@dataclass
+class TaskSample:
+    """Keeps about rate (between 0 and 1) of all tasks."""
+    rate: float
+
+    def keeps(self, run_id: Optional[str], task_id: int) -> bool:
+        # Parsl task ids count up from 0 in every run, so the run id is
+        # hashed too: otherwise every run would keep the same task ids.
+        digest = hashlib.sha256(f"{run_id} {int(task_id)}".encode()).digest()
+        return int.from_bytes(digest[:8], "big") < self.rate * 2**64
+
+
+def create_metadata_table(db: sqlite3.Connection) -> None:
+    db.execute("CREATE TABLE IF NOT EXISTS import_metadata ("
+               "name TEXT PRIMARY KEY,"
+               "value"
+               ")")
+    db.commit()
+
+
+def read_sample_rate(db: sqlite3.Connection) -> float:
+    """Returns the rate at which the tasks in db were sampled, which is 1
+    for a database that was not imported with sampling."""
+    if not has_object(db, "import_metadata"):
+        return 1.0
+    row = db.execute("SELECT value FROM import_metadata WHERE name = 'sample_rate'").fetchone()
+    return 1.0 if row is None else float(row[0])
+
+
+def record_sample_rate(db: sqlite3.Connection, rate: float) -> None:
+    """Records the sample rate of an import into db. Counts could not be
+    scaled up from a mix of tasks sampled at different rates, so this
+    fails if the database already holds an import at another rate."""
+    create_metadata_table(db)
+    previous = read_sample_rate(db)
+    has_spans = has_object(db, "span_data") and db.execute("SELECT 1 FROM span_data LIMIT 1").fetchone() is not None
+    if previous != rate and has_spans:
+        raise RuntimeError(f"Database was imported with a sample rate of {previous}, "
+                           f"so it cannot be imported into with a sample rate of {rate}")
+    db.execute("INSERT OR REPLACE INTO import_metadata (name, value) VALUES ('sample_rate', ?)", (rate,))
+    db.commit()
@@ -1,19 +1,57 @@
+import argparse
+import contextlib
 import sqlite3
+import sys
+
+from typing import Iterator, Optional
+
+from dnpcsql.db import add_db_argument, connect
+
+# The schema version is stored in the sqlite user_version pragma, so that
+# databases written by older versions of dnpcsql can be upgraded in place
+# by upgrade_schema.
+#
+# version 0: the original schema, with event.time stored as TEXT
+# version 1: event.time stored as REAL (unix time in seconds), with
+#            composite indexes on event (span_uuid, time) and (type, time)
+# version 2: spans and events are keyed by INTEGER rowids, and subspan,
+#            facet and event refer to spans by those integer ids. UUIDs are
+#            kept only as an optional external identity for spans and
+#            events.
+# version 3: span types, event types and the source descriptions held in
+#            span and event notes are interned into lookup tables. Spans and
+#            events are stored in span_data and event_data with integer
+#            foreign keys into those tables, and span and event become views
+#            which present the same columns as version 2.
+# version 4: subspan and facet relations are unique, so that importers can
+#            insert them with INSERT OR IGNORE and re-running an import does
+#            not duplicate them.
+# version 5: events can have named attributes, in event_attribute, whose
+#            values are stored with their own types (integer, real or
+#            text) rather than as strings.
+# version 6: the spans that each source imports for parsl tasks and tries
+#            are recorded in task_key and try_key, by run id, task id and
+#            try id, so that they can be bound together by joins.
+# version 7: the local key that an importer named each span by is
+#            recorded in local_key, so that sources imported later can
+#            find the spans which earlier imports made.
+SCHEMA_VERSION = 7
 
 def main() -> None:
     print("dnpcsql schema creator")
 
-    connection = init_sql()
+    parser = argparse.ArgumentParser()
+    add_db_argument(parser)
+    args = parser.parse_args()
+
+    connection = init_sql(args.db)
 
     connection.commit()
     connection.close()
 
 
-def init_sql() -> sqlite3.Connection:
-    db_name = "dnpc.sqlite3"
-    db = sqlite3.connect(db_name,
-                         detect_types=sqlite3.PARSE_DECLTYPES |
-                         sqlite3.PARSE_COLNAMES)
+def init_sql(path: Optional[str] = None) -> sqlite3.Connection:
+    db = connect(path)
 
     create_tables(db)
 
@@ -21,25 +59,65 @@ def init_sql() -> sqlite3.Connection:
 
 
 def create_tables(db: sqlite3.Connection) -> None:
-
-    # All spans have a UUID that identifies them without
-    # a containing superspan to name them.
+    """Creates the dnpcsql tables in a new database, or upgrades the tables
+    of an existing database to the current schema version."""
 
     cursor = db.cursor()
-    cursor.execute("CREATE TABLE IF NOT EXISTS span ("
-                   "uuid TEXT PRIMARY KEY,"
-                   "type TEXT NOT NULL,"  # domain style
-                   "note TEXT"
+
+    existing = list(cursor.execute("SELECT name FROM sqlite_master WHERE name = 'span'"))
+    if existing:
+        upgrade_schema(db)
+        return
+
+    _create_tables(cursor)
+    _create_indexes(cursor)
+
+    set_schema_version(db, SCHEMA_VERSION)
+
+
+def _create_tables(cursor: sqlite3.Cursor) -> None:
+
+    # Span types, event types and import source descriptions are repeated
+    # on many rows, so they are each stored once in a lookup table and
+    # referred to by integer id.
+
+    cursor.execute("CREATE TABLE IF NOT EXISTS span_type ("
+                   "id INTEGER PRIMARY KEY,"
+                   "name TEXT NOT NULL UNIQUE"
                    ")")
 
-    # each event exists within exactly one span
-    # it is identified by a UUID
-    cursor.execute("CREATE TABLE IF NOT EXISTS event ("
-                   "uuid TEXT PRIMARY KEY,"
-                   "span_uuid TEXT REFERENCES span (uuid),"
-                   "time TEXT NOT NULL,"
-                   "type TEXT NOT NULL,"  # meaning comes from span.type
-                   "note TEXT"
+    cursor.execute("CREATE TABLE IF NOT EXISTS event_type ("
+                   "id INTEGER PRIMARY KEY,"
+                   "name TEXT NOT NULL UNIQUE"
+                   ")")
+
+    cursor.execute("CREATE TABLE IF NOT EXISTS source ("
+                   "id INTEGER PRIMARY KEY,"
+                   "description TEXT NOT NULL UNIQUE"
+                   ")")
+
+    # All spans have an integer id that identifies them without
+    # a containing superspan to name them. An importer may also give
+    # a span a UUID, as an identity that makes sense outside of this
+    # database.
+
+    cursor.execute("CREATE TABLE IF NOT EXISTS span_data ("
+                   "id INTEGER PRIMARY KEY,"
+                   "uuid TEXT,"
+                   "type_id INTEGER NOT NULL REFERENCES span_type (id),"  # domain style
+                   "source_id INTEGER REFERENCES source (id)"
+                   ")")
+
+    # each event exists within exactly one span.
+    # event times are unix times in seconds, stored as REAL so that
+    # they sort and compare numerically.
+    cursor.execute("CREATE TABLE IF NOT EXISTS event_data ("
+                   "id INTEGER PRIMARY KEY,"
+                   "uuid TEXT,"
+                   "span_id INTEGER REFERENCES span_data (id),"
+                   "time REAL NOT NULL,"
+                   "type_id INTEGER NOT NULL REFERENCES event_type (id),"  # meaning comes from span type
+                   "source_id INTEGER REFERENCES source (id)"
                    ")")
 
     # spans can be contained, DAG-style, within other spans.
@@ -49,22 +127,442 @@ def create_tables(db: sqlite3.Connection) -> None:
     # superspan it is being viewed from.
 
     cursor.execute("CREATE TABLE IF NOT EXISTS subspan ("
-                   "superspan_uuid TEXT REFERENCES span(uuid),"
-                   "subspan_uuid TEXT REFERENCES span (uuid),"
+                   "superspan_id INTEGER REFERENCES span_data (id),"
+                   "subspan_id INTEGER REFERENCES span_data (id),"
                    "key TEXT NOT NULL,"
                    "note TEXT"
                    ")")
 
-    cursor.execute("create index span_uuids on event (span_uuid)")
-    cursor.execute("create index subspan_uuids_super on subspan (superspan_uuid)")
-    cursor.execute("create index subspan_uuids_sub on subspan (subspan_uuid)")
-
     cursor.execute("CREATE TABLE IF NOT EXISTS facet ("
-                   "left_uuid TEXT REFERENCES span(uuid),"
-                   "right_uuid TEXT REFERENCES span (uuid),"
+                   "left_id INTEGER REFERENCES span_data (id),"
+                   "right_id INTEGER REFERENCES span_data (id),"
                    "note TEXT"
                    ")")
 
+    # an event can have any number of named attributes: for example, the
+    # resources that a Work Queue task was allocated. value has no declared
+    # type, so that numbers are stored as numbers, and can be summed and
+    # compared, and everything else as text.
+    cursor.execute("CREATE TABLE IF NOT EXISTS event_attribute ("
+                   "event_id INTEGER NOT NULL REFERENCES event_data (id),"
+                   "name TEXT NOT NULL,"
+                   "value,"
+                   "PRIMARY KEY (event_id, name)"
+                   ") WITHOUT ROWID")
+
+    # parsl tasks and tries are imported from several sources (such as
+    # monitoring.db, parsl.log and parsl_tracing.pickle), each into spans of
+    # its own. Each source records the span that it imported for each task
+    # and try here, keyed by the ids which parsl gives them, so that the
+    # spans of the same task or try can be bound together with facets by
+    # joining on those keys, rather than by holding them all in memory.
+    cursor.execute("CREATE TABLE IF NOT EXISTS task_key ("
+                   "run_id TEXT NOT NULL,"
+                   "task_id INTEGER NOT NULL,"
+                   "source TEXT NOT NULL,"
+                   "span_id INTEGER NOT NULL REFERENCES span_data (id),"
+                   "PRIMARY KEY (run_id, task_id, source)"
+                   ") WITHOUT ROWID")
+
+    cursor.execute("CREATE TABLE IF NOT EXISTS try_key ("
+                   "run_id TEXT NOT NULL,"
+                   "task_id INTEGER NOT NULL,"
+                   "try_id INTEGER NOT NULL,"
+                   "source TEXT NOT NULL,"
+                   "span_id INTEGER NOT NULL REFERENCES span_data (id),"
+                   "PRIMARY KEY (run_id, task_id, try_id, source)"
+                   ") WITHOUT ROWID")
+
+    # Importers name spans by local keys in namespaces which only last for
+    # one import (see importerlib.local_key_to_span_id). Each keyed span's
+    # key is recorded here, under the scope it was imported in (such as a
+    # workflow run id) and its span type, which is what the key is unique
+    # within, so that a source imported into the database later can bind
+    # to those spans by looking up the same keys (see
+    # BatchWriter.bind_existing). Keys are stored as their Python repr.
+    cursor.execute("CREATE TABLE IF NOT EXISTS local_key ("
+                   "scope TEXT NOT NULL,"
+                   "namespace TEXT NOT NULL,"
+                   "key TEXT NOT NULL,"
+                   "span_id INTEGER NOT NULL REFERENCES span_data (id),"
+                   "PRIMARY KEY (scope, namespace, key)"
+                   ") WITHOUT ROWID")
+
+    # These act as constraints rather than as indexes for queries, so they
+    # are not in _indexes, and are kept during a bulk load.
+    cursor.execute("create unique index if not exists subspan_unique on subspan (superspan_id, subspan_id, key)")
+    cursor.execute("create unique index if not exists facet_unique on facet (left_id, right_id)")
+
+    _create_views(cursor)
+
+
+def _create_views(cursor: sqlite3.Cursor) -> None:
+    # Queries are written against these views, which resolve the interned
+    # strings. The lookups are LEFT JOINs on primary keys, so sqlite leaves
+    # out the joins for columns that a query does not use, and a filter
+    # such as span.type = '...' becomes a single lookup in span_type
+    # followed by an integer comparison on span_data.
+
+    cursor.execute("CREATE VIEW IF NOT EXISTS span AS "
+                   "SELECT span_data.id AS id, span_data.uuid AS uuid, "
+                   "span_type.name AS type, source.description AS note "
+                   "FROM span_data "
+                   "LEFT JOIN span_type ON span_type.id = span_data.type_id "
+                   "LEFT JOIN source ON source.id = span_data.source_id")
+
+    cursor.execute("CREATE VIEW IF NOT EXISTS event AS "
+                   "SELECT event_data.id AS id, event_data.uuid AS uuid, "
+                   "event_data.span_id AS span_id, event_data.time AS time, "
+                   "event_type.name AS type, source.description AS note "
+                   "FROM event_data "
+                   "LEFT JOIN event_type ON event_type.id = event_data.type_id "
+                   "LEFT JOIN source ON source.id = event_data.source_id")
+
+
+# The secondary indexes of the current schema, as (name, definition) pairs.
+_indexes = [
+    # UUIDs are optional, so these indexes only cover spans and events
+    # which have one.
+    ("span_uuid", "create unique index if not exists span_uuid on span_data (uuid) where uuid is not null"),
+    ("event_uuid", "create unique index if not exists event_uuid on event_data (uuid) where uuid is not null"),
+
+    ("span_type_id", "create index if not exists span_type_id on span_data (type_id)"),
+
+    # (span_id, time) serves both lookups of a span's events and
+    # time-ordered scans within a span; (type_id, time) serves range scans
+    # over a single event type.
+    ("event_span_time", "create index if not exists event_span_time on event_data (span_id, time)"),
+    ("event_type_time", "create index if not exists event_type_time on event_data (type_id, time)"),
+
+    ("subspan_super", "create index if not exists subspan_super on subspan (superspan_id)"),
+    ("subspan_sub", "create index if not exists subspan_sub on subspan (subspan_id)"),
+]
+
+
+def _create_indexes(cursor: sqlite3.Cursor) -> None:
+    for (_, definition) in _indexes:
+        cursor.execute(definition)
+
+
+def _drop_indexes(cursor: sqlite3.Cursor) -> None:
+    for (name, _) in _indexes:
+        cursor.execute(f"drop index if exists {name}")
+
+
+# Pragma settings for bulk_load. The journal is kept in memory rather than
+# turned off, so that a failed import can still be rolled back, but the
+# database may be corrupted by a crash or power failure during the load.
+_bulk_load_pragmas = {"journal_mode": "MEMORY",
+                      "synchronous": "OFF",
+                      "cache_size": -262144,  # negative means KiB: 256MiB
+                      "temp_store": "MEMORY"}
+
+
+@contextlib.contextmanager
+def bulk_load(db: sqlite3.Connection) -> Iterator[None]:
+    """A context for importing a large amount of data into a database
+    quickly, at the expense of durability while the import runs.
+
+    On entry, the secondary indexes are dropped, so that inserts do not
+    have to maintain them, and sqlite is configured for throughput. On
+    exit, the indexes are built once over all of the imported data, the
+    previous settings are restored, and, if the import succeeded, ANALYZE
+    collects statistics for the query planner. If the import failed, what
+    it wrote since it last committed is rolled back rather than saved,
+    though the indexes are still rebuilt.
+
+    This is intended for building a new database, or for adding a large
+    import to an existing one: while the context is open, anything else
+    reading the database will find it without indexes.
+    """
+    db.commit()
+    cursor = db.cursor()
+
+    previous = {pragma: cursor.execute(f"PRAGMA {pragma}").fetchone()[0]
+                for pragma in _bulk_load_pragmas}
+    for (pragma, value) in _bulk_load_pragmas.items():
+        cursor.execute(f"PRAGMA {pragma} = {value}")
+
+    _drop_indexes(cursor)
+    db.commit()
+
+    succeeded = False
+    try:
+        yield
+        succeeded = True
+    finally:
+        if succeeded:
+            db.commit()
+        else:
+            db.rollback()
+        # with no transaction open, each CREATE INDEX is committed as it
+        # runs, so a failed import still gets its indexes back
+        print("Building indexes", file=sys.stderr)
+        _create_indexes(cursor)
+        if succeeded:
+            print("Analyzing database", file=sys.stderr)
+            cursor.execute("ANALYZE")
+            db.commit()
+        for (pragma, value) in previous.items():
+            cursor.execute(f"PRAGMA {pragma} = {value}")
+
+
+def get_schema_version(db: sqlite3.Connection) -> int:
+    return db.execute("PRAGMA user_version").fetchone()[0]
+
+
+def set_schema_version(db: sqlite3.Connection, version: int) -> None:
+    # PRAGMA does not accept bound parameters
+    db.execute(f"PRAGMA user_version = {int(version)}")
+
+
+def upgrade_schema(db: sqlite3.Connection) -> None:
+    """Upgrades an existing database, one version at a time, to
+    SCHEMA_VERSION."""
+    version = get_schema_version(db)
+    if version > SCHEMA_VERSION:
+        raise RuntimeError(f"Database schema version {version} is newer than this version of dnpcsql supports ({SCHEMA_VERSION})")
+
+    while version < SCHEMA_VERSION:
+        print(f"Upgrading database schema from version {version} to {version + 1}")
+        _upgrades[version](db)
+        version += 1
+        set_schema_version(db, version)
+        db.commit()
+
+
+# Each upgrade step spells out the DDL of the version it produces, rather
+# than using _create_tables, so that old steps keep producing the same
+# result as the current schema moves on.
+
+def _upgrade_0_to_1(db: sqlite3.Connection) -> None:
+    # Times are converted with Python's float rather than sqlite's CAST,
+    # because sqlite's text to real conversion is not always correctly
+    # rounded, and the stored strings came from str(float).
+    db.create_function("dnpc_text_to_time", 1, float, deterministic=True)
+
+    # sqlite cannot change the type of a column, so the event table
+    # is rebuilt with numeric times.
+    cursor = db.cursor()
+    cursor.execute("ALTER TABLE event RENAME TO event_version_0")
+    cursor.execute("CREATE TABLE event ("
+                   "uuid TEXT PRIMARY KEY,"
+                   "span_uuid TEXT REFERENCES span (uuid),"
+                   "time REAL NOT NULL,"
+                   "type TEXT NOT NULL,"
+                   "note TEXT"
+                   ")")
+    cursor.execute("INSERT INTO event (uuid, span_uuid, time, type, note) "
+                   "SELECT uuid, span_uuid, dnpc_text_to_time(time), type, note FROM event_version_0")
+    cursor.execute("DROP TABLE event_version_0")
+    cursor.execute("create index if not exists event_span_time on event (span_uuid, time)")
+    cursor.execute("create index if not exists event_type_time on event (type, time)")
+    cursor.execute("create index if not exists subspan_uuids_super on subspan (superspan_uuid)")
+    cursor.execute("create index if not exists subspan_uuids_sub on subspan (subspan_uuid)")
+
+
+def _upgrade_1_to_2(db: sqlite3.Connection) -> None:
+    # Every table is rebuilt: spans are given integer ids in their
+    # existing rowid order, and references to span UUIDs are rewritten
+    # to refer to those ids. Existing UUIDs are kept.
+    cursor = db.cursor()
+    for table in ["span", "event", "subspan", "facet"]:
+        cursor.execute(f"ALTER TABLE {table} RENAME TO {table}_version_1")
+
+    cursor.execute("CREATE TABLE span ("
+                   "id INTEGER PRIMARY KEY,"
+                   "uuid TEXT,"
+                   "type TEXT NOT NULL,"
+                   "note TEXT"
+                   ")")
+    cursor.execute("CREATE TABLE event ("
+                   "id INTEGER PRIMARY KEY,"
+                   "uuid TEXT,"
+                   "span_id INTEGER REFERENCES span (id),"
+                   "time REAL NOT NULL,"
+                   "type TEXT NOT NULL,"
+                   "note TEXT"
+                   ")")
+    cursor.execute("CREATE TABLE subspan ("
+                   "superspan_id INTEGER REFERENCES span (id),"
+                   "subspan_id INTEGER REFERENCES span (id),"
+                   "key TEXT NOT NULL,"
+                   "note TEXT"
+                   ")")
+    cursor.execute("CREATE TABLE facet ("
+                   "left_id INTEGER REFERENCES span (id),"
+                   "right_id INTEGER REFERENCES span (id),"
+                   "note TEXT"
+                   ")")
+
+    cursor.execute("INSERT INTO span (uuid, type, note) "
+                   "SELECT uuid, type, note FROM span_version_1 ORDER BY rowid")
+    cursor.execute("create unique index span_uuid on span (uuid) where uuid is not null")
+
+    cursor.execute("INSERT INTO event (uuid, span_id, time, type, note) "
+                   "SELECT e.uuid, s.id, e.time, e.type, e.note "
+                   "FROM event_version_1 AS e LEFT JOIN span AS s ON s.uuid = e.span_uuid "
+                   "ORDER BY e.rowid")
+    cursor.execute("INSERT INTO subspan (superspan_id, subspan_id, key, note) "
+                   "SELECT a.id, b.id, ss.key, ss.note "
+                   "FROM subspan_version_1 AS ss "
+                   "LEFT JOIN span AS a ON a.uuid = ss.superspan_uuid "
+                   "LEFT JOIN span AS b ON b.uuid = ss.subspan_uuid "
+                   "ORDER BY ss.rowid")
+    cursor.execute("INSERT INTO facet (left_id, right_id, note) "
+                   "SELECT a.id, b.id, f.note "
+                   "FROM facet_version_1 AS f "
+                   "LEFT JOIN span AS a ON a.uuid = f.left_uuid "
+                   "LEFT JOIN span AS b ON b.uuid = f.right_uuid "
+                   "ORDER BY f.rowid")
+
+    # dropping the old tables also drops their indexes, which frees up
+    # the index names for the new tables.
+    for table in ["span", "event", "subspan", "facet"]:
+        cursor.execute(f"DROP TABLE {table}_version_1")
+
+    cursor.execute("create unique index event_uuid on event (uuid) where uuid is not null")
+    cursor.execute("create index event_span_time on event (span_id, time)")
+    cursor.execute("create index event_type_time on event (type, time)")
+    cursor.execute("create index subspan_super on subspan (superspan_id)")
+    cursor.execute("create index subspan_sub on subspan (subspan_id)")
+
+
+def _upgrade_2_to_3(db: sqlite3.Connection) -> None:
+    cursor = db.cursor()
+
+    cursor.execute("CREATE TABLE span_type ("
+                   "id INTEGER PRIMARY KEY,"
+                   "name TEXT NOT NULL UNIQUE"
+                   ")")
+    cursor.execute("CREATE TABLE event_type ("
+                   "id INTEGER PRIMARY KEY,"
+                   "name TEXT NOT NULL UNIQUE"
+                   ")")
+    cursor.execute("CREATE TABLE source ("
+                   "id INTEGER PRIMARY KEY,"
+                   "description TEXT NOT NULL UNIQUE"
+                   ")")
+    cursor.execute("CREATE TABLE span_data ("
+                   "id INTEGER PRIMARY KEY,"
+                   "uuid TEXT,"
+                   "type_id INTEGER NOT NULL REFERENCES span_type (id),"
+                   "source_id INTEGER REFERENCES source (id)"
+                   ")")
+    cursor.execute("CREATE TABLE event_data ("
+                   "id INTEGER PRIMARY KEY,"
+                   "uuid TEXT,"
+                   "span_id INTEGER REFERENCES span_data (id),"
+                   "time REAL NOT NULL,"
+                   "type_id INTEGER NOT NULL REFERENCES event_type (id),"
+                   "source_id INTEGER REFERENCES source (id)"
+                   ")")
+
+    cursor.execute("INSERT OR IGNORE INTO span_type (name) SELECT type FROM span ORDER BY rowid")
+    cursor.execute("INSERT OR IGNORE INTO event_type (name) SELECT type FROM event ORDER BY rowid")
+    cursor.execute("INSERT OR IGNORE INTO source (description) SELECT note FROM span WHERE note IS NOT NULL ORDER BY rowid")
+    cursor.execute("INSERT OR IGNORE INTO source (description) SELECT note FROM event WHERE note IS NOT NULL ORDER BY rowid")
+
+    cursor.execute("INSERT INTO span_data (id, uuid, type_id, source_id) "
+                   "SELECT span.id, span.uuid, span_type.id, source.id "
+                   "FROM span JOIN span_type ON span_type.name = span.type "
+                   "LEFT JOIN source ON source.description = span.note")
+    cursor.execute("INSERT INTO event_data (id, uuid, span_id, time, type_id, source_id) "
+                   "SELECT event.id, event.uuid, event.span_id, event.time, event_type.id, source.id "
+                   "FROM event JOIN event_type ON event_type.name = event.type "
+                   "LEFT JOIN source ON source.description = event.note")
+
+    # subspan and facet keep their version 2 shape: their references
+    # to span ids are still valid, because span ids are kept.
+    cursor.execute("DROP TABLE span")
+    cursor.execute("DROP TABLE event")
+
+    cursor.execute("CREATE VIEW span AS "
+                   "SELECT span_data.id AS id, span_data.uuid AS uuid, "
+                   "span_type.name AS type, source.description AS note "
+                   "FROM span_data "
+                   "LEFT JOIN span_type ON span_type.id = span_data.type_id "
+                   "LEFT JOIN source ON source.id = span_data.source_id")
+    cursor.execute("CREATE VIEW event AS "
+                   "SELECT event_data.id AS id, event_data.uuid AS uuid, "
+                   "event_data.span_id AS span_id, event_data.time AS time, "
+                   "event_type.name AS type, source.description AS note "
+                   "FROM event_data "
+                   "LEFT JOIN event_type ON event_type.id = event_data.type_id "
+                   "LEFT JOIN source ON source.id = event_data.source_id")
+
+    cursor.execute("create unique index span_uuid on span_data (uuid) where uuid is not null")
+    cursor.execute("create unique index event_uuid on event_data (uuid) where uuid is not null")
+    cursor.execute("create index span_type_id on span_data (type_id)")
+    cursor.execute("create index event_span_time on event_data (span_id, time)")
+    cursor.execute("create index event_type_time on event_data (type_id, time)")
+
+
+def _upgrade_3_to_4(db: sqlite3.Connection) -> None:
+    # Repeated relations carry no information beyond the first, so only
+    # the first of each is kept.
+    cursor = db.cursor()
+    cursor.execute("DELETE FROM subspan WHERE rowid NOT IN "
+                   "(SELECT min(rowid) FROM subspan GROUP BY superspan_id, subspan_id, key)")
+    cursor.execute("DELETE FROM facet WHERE rowid NOT IN "
+                   "(SELECT min(rowid) FROM facet GROUP BY left_id, right_id)")
+    cursor.execute("create unique index subspan_unique on subspan (superspan_id, subspan_id, key)")
+    cursor.execute("create unique index facet_unique on facet (left_id, right_id)")
+
+
+def _upgrade_4_to_5(db: sqlite3.Connection) -> None:
+    # existing events have no attributes
+    cursor = db.cursor()
+    cursor.execute("CREATE TABLE event_attribute ("
+                   "event_id INTEGER NOT NULL REFERENCES event_data (id),"
+                   "name TEXT NOT NULL,"
+                   "value,"
+                   "PRIMARY KEY (event_id, name)"
+                   ") WITHOUT ROWID")
+
+
+def _upgrade_5_to_6(db: sqlite3.Connection) -> None:
+    # the keys of existing spans are not known, so they can only be bound
+    # by importing them again
+    cursor = db.cursor()
+    cursor.execute("CREATE TABLE task_key ("
+                   "run_id TEXT NOT NULL,"
+                   "task_id INTEGER NOT NULL,"
+                   "source TEXT NOT NULL,"
+                   "span_id INTEGER NOT NULL REFERENCES span_data (id),"
+                   "PRIMARY KEY (run_id, task_id, source)"
+                   ") WITHOUT ROWID")
+    cursor.execute("CREATE TABLE try_key ("
+                   "run_id TEXT NOT NULL,"
+                   "task_id INTEGER NOT NULL,"
+                   "try_id INTEGER NOT NULL,"
+                   "source TEXT NOT NULL,"
+                   "span_id INTEGER NOT NULL REFERENCES span_data (id),"
+                   "PRIMARY KEY (run_id, task_id, try_id, source)"
+                   ") WITHOUT ROWID")
+
+
+def _upgrade_6_to_7(db: sqlite3.Connection) -> None:
+    # the keys of existing spans are not known, so sources imported later
+    # cannot bind to them
+    cursor = db.cursor()
+    cursor.execute("CREATE TABLE local_key ("
+                   "scope TEXT NOT NULL,"
+                   "namespace TEXT NOT NULL,"
+                   "key TEXT NOT NULL,"
+                   "span_id INTEGER NOT NULL REFERENCES span_data (id),"
+                   "PRIMARY KEY (scope, namespace, key)"
+                   ") WITHOUT ROWID")
+
+
+_upgrades = {0: _upgrade_0_to_1,
+             1: _upgrade_1_to_2,
+             2: _upgrade_2_to_3,
+             3: _upgrade_3_to_4,
+             4: _upgrade_4_to_5,
+             5: _upgrade_5_to_6,
+             6: _upgrade_6_to_7}
+
 
 if __name__ == "__main__":
      main()
@@ -0,0 +1,168 @@
+"""Sharded databases: each workflow run is imported into its own shard
+database, and a catalog database lists the shards.
+
+The catalog contains only the shard table. A connection to the catalog
+can ATTACH the shards and present each of their tables - the span and
+event data, the span_type, event_type and source lookup tables, the
+relation and key tables, and the derived span_closure, span_summary and
+span_entity tables - as a UNION ALL view of all of them, so that the
+analysis tools can be used on a catalog in the same way as on a single
+database. A query about one run can instead be run directly against that
+run's shard.
+
+Each shard allocates span and event ids from its own range (see
+shard_first_id), so that ids are unique across all of the shards of a
+catalog, and subspan and facet relations still refer to the right spans
+in the combined views. The lookup tables are numbered from 1 in every
+shard, so their ids are moved into the shard's range in the combined
+views, along with every column that refers to them.
+"""
+
+import os
+import pathlib
+import sqlite3
+import sys
+
+from typing import List, Optional, Set, Tuple
+
+# Shard n allocates ids from n << SHARD_ID_BITS upwards, which leaves room
+# for 2**40 spans and events in each shard, and for 2**23 shards within
+# sqlite's 63 bit integers.
+SHARD_ID_BITS = 40
+
+# sqlite's default limit on the number of attached databases, which is
+# used when the limit cannot be read or raised on the connection. sqlite
+# lets the limit be raised at runtime up to its compile time maximum
+# (125 in standard builds).
+_DEFAULT_ATTACH_LIMIT = 10
+
+# Every table which is combined across shards. The span and event views
+# are combined as well as span_data and event_data, because each shard's
+# views resolve names through that shard's own lookup tables.
+_UNION_TABLES = ["span_type", "event_type", "source", "span_data", "event_data", "span", "event",
+                 "event_attribute", "subspan", "facet", "task_key", "try_key", "local_key",
+                 "span_closure", "span_summary", "span_entity"]
+
+# Columns which hold ids from a shard's span_type, event_type and source
+# tables, by table.
+_LOOKUP_ID_COLUMNS = {"span_type": ["id"],
+                      "event_type": ["id"],
+                      "source": ["id"],
+                      "span_data": ["type_id", "source_id"],
+                      "event_data": ["type_id", "source_id"],
+                      "span_summary": ["type_id", "first_event_type_id", "last_event_type_id"]}
+
+
+def create_catalog(db: sqlite3.Connection) -> None:
+    if has_object(db, "span"):
+        raise RuntimeError("Database contains spans, so it cannot be used as a shard catalog")
+    db.execute("CREATE TABLE IF NOT EXISTS shard ("
+               "id INTEGER PRIMARY KEY,"
+               "run_id TEXT NOT NULL UNIQUE,"
+               "path TEXT NOT NULL"  # relative to the directory containing the catalog
+               ")")
+    db.commit()
+
+
+def has_object(db: sqlite3.Connection, name: str, schema: str = "main") -> bool:
+    rows = list(db.execute(f"SELECT name FROM {schema}.sqlite_master WHERE name = ?", (name,)))
+    return rows != []
+
+
+def is_catalog(db: sqlite3.Connection) -> bool:
+    return has_object(db, "shard") and not has_object(db, "span")
+
+
+def shard_first_id(shard_id: int) -> int:
+    return shard_id << SHARD_ID_BITS
+
+
+def register_shard(catalog: sqlite3.Connection, catalog_path: str, run_id: str) -> Tuple[int, str]:
+    """Adds a shard for run_id to the catalog, if there is not one already,
+    and returns its shard id and the path of its database file."""
+    shard_dir = os.path.basename(catalog_path) + ".shards"
+    catalog.execute("INSERT OR IGNORE INTO shard (run_id, path) VALUES (?, ?)",
+                    (run_id, f"{shard_dir}/{run_id}.sqlite3"))
+    catalog.commit()
+    (shard_id, path) = catalog.execute("SELECT id, path FROM shard WHERE run_id = ?", (run_id,)).fetchone()
+
+    full_path = os.path.join(os.path.dirname(os.path.abspath(catalog_path)), path)
+    os.makedirs(os.path.dirname(full_path), exist_ok=True)
+    return (shard_id, full_path)
+
+
+def attach_shards(db: sqlite3.Connection, catalog_path: str, run_ids: Optional[Set[str]] = None, read_only: bool = True) -> List[str]:
+    """ATTACHes the shards of the catalog open as db (or only those for
+    run_ids), and creates a TEMP view for each table in _UNION_TABLES
+    which combines the attached shards. Returns the schema names of the
+    attached shards.
+
+    If a table is missing from some of the shards - usually a derived
+    table which has only been built in some of them - its view is created
+    over a table that does not exist, so that a query which uses it fails
+    with a "no such table" error, rather than sqlite resolving the name to
+    the copy in the first shard which has it, and the query silently
+    describing only that shard.
+
+    If read_only is True, the shards are attached with read-only URIs, which
+    needs db to have been opened with uri=True.
+
+    sqlite limits the number of databases that can be attached to one
+    connection. The limit is raised as far as sqlite allows, and a catalog
+    with more shards than that can only be queried a subset of runs at a
+    time.
+    """
+    catalog_dir = os.path.dirname(os.path.abspath(catalog_path))
+    shards = [(shard_id, run_id, path)
+              for (shard_id, run_id, path) in db.execute("SELECT id, run_id, path FROM shard ORDER BY id")
+              if run_ids is None or run_id in run_ids]
+
+    if shards == []:
+        raise RuntimeError(f"No shards to attach in catalog {catalog_path}")
+
+    # Connection.setlimit and getlimit are only available from Python 3.11
+    setlimit = getattr(db, "setlimit", None)
+    if setlimit:
+        setlimit(sqlite3.SQLITE_LIMIT_ATTACHED, len(shards))
+    getlimit = getattr(db, "getlimit", None)
+    attach_limit = getlimit(sqlite3.SQLITE_LIMIT_ATTACHED) if getlimit else _DEFAULT_ATTACH_LIMIT
+    if len(shards) > attach_limit:
+        raise RuntimeError(f"Catalog {catalog_path} has {len(shards)} shards, but only {attach_limit} databases "
+                           "can be attached at once: choose fewer runs with --run-id")
+
+    schemas = []
+    for (shard_id, run_id, path) in shards:
+        schema = f"shard_{shard_id}"
+        full_path = os.path.join(catalog_dir, path)
+        if read_only:
+            db.execute("ATTACH DATABASE ? AS " + schema, (pathlib.Path(full_path).resolve().as_uri() + "?mode=ro",))
+        else:
+            db.execute("ATTACH DATABASE ? AS " + schema, (full_path,))
+        schemas.append((shard_id, schema))
+
+    for table in _UNION_TABLES:
+        missing = [schema for (_, schema) in schemas if not has_object(db, table, schema)]
+        if missing == []:
+            union = " UNION ALL ".join(_shard_select(db, table, shard_id, schema) for (shard_id, schema) in schemas)
+        elif len(missing) == len(schemas):
+            continue
+        else:
+            print(f"Warning: {table} is missing from shards {', '.join(missing)}, so it cannot be used on this catalog",
+                  file=sys.stderr)
+            union = f"SELECT * FROM {table}_missing_from_{missing[0]}"
+        db.execute(f"CREATE TEMP VIEW {table} AS {union}")
+
+    return [schema for (_, schema) in schemas]
+
+
+def _shard_select(db: sqlite3.Connection, table: str, shard_id: int, schema: str) -> str:
+    """Returns a SELECT of the rows of table in one shard, with the columns
+    listed in _LOOKUP_ID_COLUMNS moved into the shard's id range."""
+    offset_columns = _LOOKUP_ID_COLUMNS.get(table, [])
+    if offset_columns == []:
+        return f"SELECT * FROM {schema}.{table}"
+    offset = shard_first_id(shard_id)
+    columns = [row[1] for row in db.execute(f"PRAGMA {schema}.table_info({table})")]
+    select = ", ".join(f"{column} + {offset} AS {column}" if column in offset_columns else column
+                       for column in columns)
+    return f"SELECT {select} FROM {schema}.{table}"
@@ -2,23 +2,21 @@ import matplotlib.pyplot as plt
 import numpy as np
 import scipy.stats
 import sqlalchemy
-import sqlite3
 
-def plot(query, output_filename, start_name, end_name):
+from dnpcsql.db import connect_read_only
+
+def plot(query, output_filename, start_name, end_name, db_path=None, run_ids=None):
     """Given an SQL query that returns two columns: a start time, and a
     duration, of something (for example the start time and duration of a
     task, plot various graphs about those periods.
     """
-    xdata, ydata = get_data(query)
+    xdata, ydata = get_data(query, db_path, run_ids)
     plot_by_time(xdata, ydata, output_filename, start_name, end_name)
     plot_kde(xdata, ydata, "kde-"+output_filename, start_name, end_name)
     plot_histo(ydata, "histo-"+output_filename, start_name, end_name)
 
-def get_data(query):
-    db_name = "./dnpc.sqlite3"
-    db = sqlite3.connect(db_name,
-                     detect_types=sqlite3.PARSE_DECLTYPES |
-                     sqlite3.PARSE_COLNAMES)
+def get_data(query, db_path=None, run_ids=None):
+    db = connect_read_only(db_path, run_ids)
 
     cursor = db.cursor()
 
@@ -26,7 +24,11 @@ def get_data(query):
 
     print(f"there are {len(rows)} relevant status transitions in the db")
 
-    xdata = np.array([float(x) for (x,y) in rows])
+    # event times are stored as REAL, so the rows can be converted
+    # directly without parsing each value.
+    data = np.array(rows, dtype=float).reshape(-1, 2)
+
+    xdata = data[:, 0]
 
     # only normalise against minimum if the minimum actually exists:
     # if there is no data, there won't be a minimum, because the
@@ -34,7 +36,7 @@ def get_data(query):
     if len(rows) > 0:
         xdata = xdata - xdata.min()
 
-    ydata = np.array([float(y) for (x,y) in rows])
+    ydata = data[:, 1]
 
     return xdata, ydata
 
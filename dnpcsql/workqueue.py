@@ -1,103 +1,329 @@
+import json
 import re
 import sqlite3
-import uuid
+import sys
 
-from typing import Dict
+from typing import Any, Dict, List, Optional, Set, Tuple, Union
 
-from dnpcsql.importerlib import local_key_to_span_uuid, store_event
+from dnpcsql.importerlib import BatchWriter, local_key_to_span_id, store_event, store_subspan
+from dnpcsql.logscan import LogOffsets, LogPattern, TimeWindow, microsecond_time_prefix, scan_log
 
-def import_all(db: sqlite3.Connection, transaction_log_path) -> Dict[str, str]:
-    """Imports tasks from transaction_log and returns a dict that maps
-    from work queue task numbers to the relevant task spans, with the
-    intention that this be used by integrating pieces to tie wq tasks
-    into containing spans.
+# The records of a Work Queue transaction_log, as documented in the comment
+# lines at the top of each log:
+#
+# time manager_pid MANAGER START|END
+# time manager_pid WORKER worker_id host:port CONNECTION
+# time manager_pid WORKER worker_id host:port DISCONNECTION (UNKNOWN|IDLE_OUT|FAST_ABORT|FAILURE|STATUS_WORKER|EXPLICIT)
+# time manager_pid WORKER worker_id RESOURCES {resources}
+# time manager_pid CATEGORY name MAX {resources_max_per_task}
+# time manager_pid CATEGORY name MIN {resources_min_per_task_per_worker}
+# time manager_pid CATEGORY name FIRST (FIXED|MAX|MIN_WASTE|MAX_THROUGHPUT) {resources_requested}
+# time manager_pid TASK taskid WAITING category_name (FIRST_RESOURCES|MAX_RESOURCES) [attempt_number] {resources_requested}
+# time manager_pid TASK taskid RUNNING worker_address (FIRST_RESOURCES|MAX_RESOURCES) {resources_allocated}
+# time manager_pid TASK taskid WAITING_RETRIEVAL worker_address
+# time manager_pid TASK taskid (RETRIEVED|DONE) (SUCCESS|SIGNAL|...) exit_code {limits_exceeded} {resources_measured}
+# time manager_pid TRANSFER (INPUT|OUTPUT) taskid cache_flag sizeinmb walltime filename
+#
+# Each regex matches the fixed fields of a record, and leaves the rest of
+# the line (which varies with the kind of record) to be split up in
+# Python, which is cheaper than a regex with optional parts. Fields can be
+# separated by more than one space.
+_patterns = [
+    LogPattern("manager", " MANAGER ", [re.compile('([0-9]+) +([0-9]+) +MANAGER +([A-Z]+)')]),
+    LogPattern("worker", " WORKER ", [re.compile('([0-9]+) +([0-9]+) +WORKER +([^ ]+) +(.*)$')]),
+    LogPattern("category", " CATEGORY ", [re.compile('([0-9]+) +([0-9]+) +CATEGORY +([^ ]+) +([A-Z]+) *(.*)$')]),
+    LogPattern("task", " TASK ", [re.compile('([0-9]+) +([0-9]+) +TASK +([0-9]+) +([A-Z_]+) *(.*)$')]),
+    LogPattern("transfer", " TRANSFER ", [re.compile('([0-9]+) +([0-9]+) +TRANSFER +([A-Z]+) +([0-9]+) +(.*)$')]),
+]
+
+_json_decoder = json.JSONDecoder()
+
+
+def _resources(text: str, prefix: str = "") -> Dict[str, Any]:
+    """Returns the resources in a resource summary like
+    {"memory":[15721,"MB"],"cores":[8,"cores"]} as attributes, without
+    their units: {"memory": 15721, "cores": 8}."""
+    resources: Dict[str, Any] = {}
+    for (name, value) in json.loads(text).items():
+        if isinstance(value, list):
+            value = value[0] if value else None
+        if isinstance(value, (int, float, str)):
+            resources[prefix + name] = value
+    return resources
+
+
+def _fields(text: str, n: int, record: str) -> List[str]:
+    """Splits the first n - 1 fields off text, and returns them and the
+    rest of text, or raises ValueError if there are fewer than n fields,
+    for example because the record was cut short while it was being
+    written."""
+    fields = text.split(None, n - 1)
+    if len(fields) < n:
+        raise ValueError(f"{record} record has {len(fields)} fields rather than at least {n}")
+    return fields
+
+
+def _split_json(text: str) -> Tuple[str, str]:
+    """Splits text, which starts with a JSON object, into that object and
+    the rest of the text."""
+    (_, end) = _json_decoder.raw_decode(text)
+    return (text[:end], text[end:].strip())
+
+
+def import_all(writer: Union[BatchWriter, sqlite3.Connection], transaction_log_path, jobs: int = 1,
+               time_window: Optional[TimeWindow] = None, task_ids: Optional[Set[str]] = None,
+               offsets: Optional[LogOffsets] = None) -> Dict[str, int]:
+    """Imports the managers, workers, categories and tasks in
+    transaction_log and returns a dict that maps from work queue task
+    numbers to the relevant task spans, with the intention that this be
+    used by integrating pieces to tie wq tasks into containing spans. If
+    jobs is more than 1, the log is scanned by that many processes (see
+    dnpcsql.logscan). If time_window is given, only the lines of the log in
+    it are imported. If task_ids is given, only the tasks with those ids are
+    imported, though every manager, worker and category is. If offsets is
+    given, only the lines appended since the log was last read are
+    imported (see dnpcsql.logscan.LogOffsets), and the spans that they name
+    are found by their local keys if the writer binds to existing spans.
+
+    Each record becomes an event, and the other fields of the record
+    (resources, exit codes, transfer sizes and times, and so on) become
+    attributes of the event, stored as numbers where they are numbers. A
+    record which cannot be parsed, such as the last line of a log which is
+    still being written, is skipped with a warning.
+
+    writer can also be a database connection, as it was before importers
+    wrote through a BatchWriter, in which case one is made for it.
     """
     print("importing from work queue")
 
+    if isinstance(writer, sqlite3.Connection):
+        writer = BatchWriter(writer)
+
     # TODO: how should we discover these paths?
     # Some outside entity (eg the parsl monitoring DB code) knows where this
     # file lives and how it relates to parsl - so probably this should be
     # driven by the parsl importer in that case. While also being suitable for
     # importing work queue abstracted from parsl.
 
-    # Each task becomes a span (without being a subspan of anything at the
-    # moment, but this will need to happen somehow to eg tie into the
-    # relevant parsl-level task spans)
-
-    task_re = re.compile('([0-9]+) [0-9]+ TASK ([0-9]+) ([^ ]+) ([^ ]+).*')
-
-    # time manager_pid TRANSFER (INPUT|OUTPUT) taskid cache_flag sizeinmb walltime filename
-    transfer_re = re.compile('([0-9]+) [0-9]+ TRANSFER ([^ ]+) ([0-9]+) ([^ ]+) .*')
-
-    task_to_span_map: Dict[str, str] = {}
-
-    cursor = db.cursor()
-
-    worker_address_to_span_map: Dict[str, str] = {}
-
-    with open(transaction_log_path, "r") as logfile:
-        for line in logfile:
-            print(line)
-            m = task_re.match(line)
-            if m:
-                print(m)
-                print(m[1])
-                print(m[2])
-                print(m[3])
-
-                wq_task_id = m[2]
-
-                task_span_uuid = local_key_to_span_uuid(
-                    cursor = cursor,
-                    local_key = wq_task_id,
-                    namespace = task_to_span_map,
-                    span_type = 'workqueue.task',
-                    description = 'Work Queue TASK from transaction_log')
- 
-                unix_time = float(m[1]) / 1000000.0
-
-                store_event(cursor=cursor,
-                            span_uuid=task_span_uuid,
-                            event_time=unix_time,
-                            event_type=m[3],
-                            description='Event from transaction_log'
-                           )
-
-                if m[3] in ["RUNNING", "WAITING_RETRIEVAL"]:  # we can capture worker ID
-                    worker_address = m[4]
-                    worker_span_uuid = local_key_to_span_uuid(
-                        cursor = cursor,
-                        local_key = worker_address,
-                        namespace = worker_address_to_span_map,
-                        span_type = 'workqueue.worker',
-                        description = 'Work Queue WORKER from transaction_log')
-
-                    # TODO: don't need to do this on both RUNNING and WAITING_RETRIEVAL...
-                    cursor.execute("INSERT INTO subspan (superspan_uuid, subspan_uuid, key) VALUES (?, ?, ?)", (worker_span_uuid, task_span_uuid, wq_task_id))
-
-            m = transfer_re.match(line)
-            if m:
-                wq_task_id = m[3]
-
-                span_id = local_key_to_span_uuid(
-                    cursor = cursor,
-                    local_key = wq_task_id,
-                    namespace = task_to_span_map,
-                    span_type = 'workqueue.task',
-                    description = 'Work Queue TASK from transaction_log')
- 
-                unix_time = float(m[1]) / 1000000.0
-
-                store_event(cursor=cursor,
-                            span_uuid=span_id,
-                            event_time=unix_time,
-                            event_type="TRANSFER_"+m[2],
-                            description='Event from transaction_log'
-                           )
-
-
-
-
-    db.commit() 
+    # Each manager, worker, category and task becomes a span. Workers and
+    # categories are subspans of their manager, and each task is a subspan
+    # of its category and of the workers that it runs on (and still needs
+    # to be tied into the relevant parsl-level task spans by the caller)
+
+    task_to_span_map: Dict[str, int] = {}
+
+    worker_address_to_span_map: Dict[str, int] = {}
+
+    manager_to_span_map: Dict[str, int] = {}
+
+    category_to_span_map: Dict[str, int] = {}
+
+    # RESOURCES records name a worker by its worker id, but tasks name it by
+    # its address, which is what worker spans are keyed by. The address is
+    # learned from the worker's CONNECTION record, just before.
+    worker_id_to_address: Dict[str, str] = {}
+
+    description = 'Event from transaction_log'
+
+    skipped_records = 0
+
+    # workers and categories are made subspans of their manager when they
+    # are first seen, rather than on every record that names them.
+    def worker_span(worker_address: str, manager_span_id: int) -> int:
+        new = worker_address not in worker_address_to_span_map
+        worker_span_id = local_key_to_span_id(
+            writer = writer,
+            local_key = worker_address,
+            namespace = worker_address_to_span_map,
+            span_type = 'workqueue.worker',
+            description = 'Work Queue WORKER from transaction_log')
+        if new:
+            store_subspan(writer=writer,
+                          superspan_id=manager_span_id,
+                          subspan_id=worker_span_id,
+                          key=worker_address)
+        return worker_span_id
+
+    def category_span(category: str, manager_span_id: int) -> int:
+        new = category not in category_to_span_map
+        category_span_id = local_key_to_span_id(
+            writer = writer,
+            local_key = category,
+            namespace = category_to_span_map,
+            span_type = 'workqueue.category',
+            description = 'Work Queue CATEGORY from transaction_log')
+        if new:
+            store_subspan(writer=writer,
+                          superspan_id=manager_span_id,
+                          subspan_id=category_span_id,
+                          key=category)
+        return category_span_id
+
+    def import_record(kind: str, m: Tuple[str, ...]) -> None:
+        unix_time = float(m[0]) / 1000000.0
+
+        manager_span_id = local_key_to_span_id(
+            writer = writer,
+            local_key = m[1],
+            namespace = manager_to_span_map,
+            span_type = 'workqueue.manager',
+            description = 'Work Queue MANAGER from transaction_log')
+
+        if kind == "task":
+            wq_task_id = m[2]
+            if task_ids is not None and wq_task_id not in task_ids:
+                return
+            state = m[3]
+            fields = m[4]
+
+            # the record is parsed before any spans are made for it, so
+            # that a malformed one leaves nothing behind
+            attributes: Dict[str, Any] = {}
+            if state == "WAITING":
+                (category, allocation, rest) = _fields(fields, 3, state)
+                attributes = {"category": category, "allocation": allocation}
+                if not rest.startswith("{"):
+                    (attempt, rest) = _fields(rest, 2, state)
+                    attributes["attempt"] = int(attempt)
+                attributes.update(_resources(rest))
+
+            elif state in ["RUNNING", "WAITING_RETRIEVAL"]:  # we can capture worker ID
+                if state == "RUNNING":
+                    (worker_address, allocation, rest) = _fields(fields, 3, state)
+                    attributes = {"worker": worker_address, "allocation": allocation}
+                    attributes.update(_resources(rest))
+                else:
+                    # the address is the only field, and the record can
+                    # end with a space
+                    (worker_address,) = _fields(fields.strip(), 1, state)
+                    attributes = {"worker": worker_address}
+
+            elif state in ["RETRIEVED", "DONE"]:
+                (result, exit_code, rest) = _fields(fields, 3, state)
+                (limits_exceeded, measured) = _split_json(rest)
+                attributes = {"result": result, "exit_code": int(exit_code)}
+                attributes.update(_resources(limits_exceeded, prefix="exceeded."))
+                attributes.update(_resources(measured))
+
+            task_span_id = local_key_to_span_id(
+                writer = writer,
+                local_key = wq_task_id,
+                namespace = task_to_span_map,
+                span_type = 'workqueue.task',
+                description = 'Work Queue TASK from transaction_log')
+
+            if state == "WAITING":
+                category_span_id = category_span(category, manager_span_id)
+                store_subspan(writer=writer,
+                              superspan_id=category_span_id,
+                              subspan_id=task_span_id,
+                              key=wq_task_id)
+
+            elif state in ["RUNNING", "WAITING_RETRIEVAL"]:
+                worker_span_id = worker_span(worker_address, manager_span_id)
+
+                # TODO: don't need to do this on both RUNNING and WAITING_RETRIEVAL...
+                store_subspan(writer=writer,
+                              superspan_id=worker_span_id,
+                              subspan_id=task_span_id,
+                              key=wq_task_id)
+
+            store_event(writer=writer,
+                        span_id=task_span_id,
+                        event_time=unix_time,
+                        event_type=state,
+                        description=description,
+                        attributes=attributes)
+
+        elif kind == "transfer":
+            wq_task_id = m[3]
+            if task_ids is not None and wq_task_id not in task_ids:
+                return
+
+            # the file name is last, and can contain spaces
+            (cache_flag, size_mb, walltime, filename) = _fields(m[4], 4, "TRANSFER")
+            attributes = {"cached": int(cache_flag),
+                          "size_mb": float(size_mb),
+                          "walltime": float(walltime),
+                          "filename": filename}
+
+            span_id = local_key_to_span_id(
+                writer = writer,
+                local_key = wq_task_id,
+                namespace = task_to_span_map,
+                span_type = 'workqueue.task',
+                description = 'Work Queue TASK from transaction_log')
+
+            store_event(writer=writer,
+                        span_id=span_id,
+                        event_time=unix_time,
+                        event_type="TRANSFER_"+m[2],
+                        description=description,
+                        attributes=attributes)
+
+        elif kind == "worker":
+            worker_id = m[2]
+            worker_fields = _fields(m[3], 2, "WORKER")
+
+            if worker_fields[0] == "RESOURCES":
+                event_type = "RESOURCES"
+                worker_address = worker_id_to_address.get(worker_id, worker_id)
+                attributes = _resources(worker_fields[1])
+            else:
+                worker_address = worker_fields[0]
+                worker_id_to_address[worker_id] = worker_address
+                (event_type, *reason) = worker_fields[1].split()
+                attributes = {"worker_id": worker_id}
+                if reason:
+                    attributes["reason"] = reason[0]
+
+            worker_span_id = worker_span(worker_address, manager_span_id)
+
+            store_event(writer=writer,
+                        span_id=worker_span_id,
+                        event_time=unix_time,
+                        event_type=event_type,
+                        description=description,
+                        attributes=attributes)
+
+        elif kind == "category":
+            category = m[2]
+            event_type = m[3]
+            rest = m[4]
+
+            attributes = {}
+            if event_type == "FIRST":
+                (mode, rest) = _fields(rest, 2, "CATEGORY FIRST")
+                attributes["mode"] = mode
+            attributes.update(_resources(rest))
+
+            category_span_id = category_span(category, manager_span_id)
+
+            store_event(writer=writer,
+                        span_id=category_span_id,
+                        event_time=unix_time,
+                        event_type=event_type,
+                        description=description,
+                        attributes=attributes)
+
+        elif kind == "manager":
+            store_event(writer=writer,
+                        span_id=manager_span_id,
+                        event_time=unix_time,
+                        event_type=m[2],
+                        description=description)
+
+    for (kind, m) in scan_log(transaction_log_path, _patterns, jobs=jobs,
+                              time_window=time_window, line_time=microsecond_time_prefix, offsets=offsets):
+        try:
+            import_record(kind, m)
+        except ValueError as e:
+            skipped_records += 1
+            print(f"Skipping a malformed transaction_log record: {e}", file=sys.stderr)
+
+    if skipped_records:
+        print(f"Skipped {skipped_records} malformed transaction_log records", file=sys.stderr)
+
+    writer.commit()
     print("done importing from work_queue")
     return task_to_span_map
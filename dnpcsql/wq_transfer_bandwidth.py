@@ -0,0 +1,106 @@
+# Reports the throughput of Work Queue file transfers, from the TRANSFER
+# records of the transaction_log: in total, over time, and for each worker,
+# with the share of transfers of cached files, and the slowest transfers -
+# to help tell whether staging files to and from workers is a bottleneck.
+#
+# Throughput is MB transferred divided by the walltime that the transfers
+# took. Over time, it is the MB transferred in each interval divided by the
+# length of the interval.
+#
+# Work Queue does not log a transfer for a cached file that a worker
+# already has, so the cached share is of the transfers that did happen:
+# a high share of cached files being transferred means that workers are
+# being sent files that they could have kept.
+
+import argparse
+import numpy as np
+
+import dnpcsql.queries as queries
+from dnpcsql.db import add_db_argument, add_run_id_argument, connect_read_only
+
+
+def throughput(size_mb: np.ndarray, walltime: np.ndarray) -> float:
+    total_walltime = walltime.sum()
+    return size_mb.sum() / total_walltime if total_walltime > 0 else float("nan")
+
+
+def print_summary(label: str, size_mb: np.ndarray, walltime: np.ndarray, cached: np.ndarray) -> None:
+    if len(size_mb) == 0:
+        print(f"{label}: no transfers")
+        return
+    rates = np.divide(size_mb, walltime, out=np.full(len(size_mb), np.nan), where=walltime > 0)
+    print(f"{label}: {len(size_mb)} transfers, {size_mb.sum():.3f} MB in {walltime.sum():.3f}s, "
+          f"{throughput(size_mb, walltime):.3f} MB/s overall, "
+          f"median {np.nanmedian(rates) if np.any(walltime > 0) else float('nan'):.3f} MB/s per transfer, "
+          f"{100 * cached.mean():.1f}% cached")
+
+
+if __name__ == "__main__":
+
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--interval", type=float, default=10,
+                        help="length in seconds of the intervals to report throughput over time in (default 10)")
+    parser.add_argument("--slowest", type=int, default=10,
+                        help="number of slowest transfers to list (default 10)")
+    add_db_argument(parser)
+    add_run_id_argument(parser)
+    args = parser.parse_args()
+
+    db = connect_read_only(args.db, args.run_ids)
+
+    cursor = db.cursor()
+
+    rows = list(cursor.execute(queries.wq_transfers()))
+
+    if rows == []:
+        print("There are no Work Queue transfers in the database")
+        raise SystemExit(0)
+
+    print(f"There are {len(rows)} Work Queue transfers in the database")
+
+    # One array per column. Transfers imported before transfer attributes
+    # were recorded have no size or walltime, which become nan and 0.
+    columns = list(zip(*rows))
+    time = np.array(columns[0], dtype=float)
+    is_input = np.array(columns[1]) == "TRANSFER_INPUT"
+    size_mb = np.array(columns[2], dtype=float)
+    walltime = np.nan_to_num(np.array(columns[3], dtype=float))
+    cached = np.array([c == 1 for c in columns[4]])
+    filename = np.array(columns[5], dtype=object)
+    (workers, worker_index) = np.unique(np.array([w or "unknown" for w in columns[6]]), return_inverse=True)
+
+    directions = [("input", is_input), ("output", ~is_input)]
+
+    print()
+    print("Aggregate throughput")
+    for (direction, selected) in directions:
+        print_summary(direction, size_mb[selected], walltime[selected], cached[selected])
+
+    print()
+    print(f"Throughput over time, in MB/s over {args.interval}s intervals from the first transfer")
+    interval = ((time - time.min()) // args.interval).astype(int)
+    intervals = interval.max() + 1
+    mb_per_interval = {direction: np.bincount(interval[selected], weights=np.nan_to_num(size_mb[selected]),
+                                              minlength=intervals)
+                       for (direction, selected) in directions}
+    transfers_per_interval = np.bincount(interval, minlength=intervals)
+    print(f"{'start':>10} {'input':>12} {'output':>12}")
+    for i in np.flatnonzero(transfers_per_interval):
+        print(f"{i * args.interval:10.1f} "
+              f"{mb_per_interval['input'][i] / args.interval:12.6f} "
+              f"{mb_per_interval['output'][i] / args.interval:12.6f}")
+
+    print()
+    print("Throughput for each worker")
+    for (n, worker) in enumerate(workers):
+        for (direction, selected) in directions:
+            selected = selected & (worker_index == n)
+            print_summary(f"{worker} {direction}", size_mb[selected], walltime[selected], cached[selected])
+
+    print()
+    print(f"The {args.slowest} slowest transfers")
+    for t in np.argsort(-walltime, kind="stable")[:args.slowest]:
+        rate = size_mb[t] / walltime[t] if walltime[t] > 0 else float("nan")
+        direction = "input" if is_input[t] else "output"
+        print(f"{time[t]:.6f} {direction:6} {workers[worker_index[t]]} {filename[t]}: "
+              f"{size_mb[t]:.6f} MB in {walltime[t]:.6f}s, {rate:.3f} MB/s{' (cached)' if cached[t] else ''}")
@@ -1,30 +1,26 @@
-import sqlite3
+import argparse
 import numpy as np
 
+from dnpcsql.db import add_db_argument, add_run_id_argument, connect_read_only
+
 # for a single event type, plot a histogram at 1 second resolution
 # of how often that event happens.
 # (so, the height of the bin should be the number of events per second, and
 # each bin represents one second)
 
-# TODO: this appears in multiple places: refactor into a db module
-def init_sql() -> sqlite3.Connection:
-    db_name = "dnpc.sqlite3"
-    db = sqlite3.connect(db_name,
-                         detect_types=sqlite3.PARSE_DECLTYPES |
-                         sqlite3.PARSE_COLNAMES)
-
-    return db
-
-
+parser = argparse.ArgumentParser()
+add_db_argument(parser)
+add_run_id_argument(parser)
+args = parser.parse_args()
 
-db = init_sql()
+db = connect_read_only(args.db, args.run_ids)
 cursor = db.cursor()
 
 parsl_running_completed = """
     SELECT event.time
       FROM event, span
      WHERE event.type = "RUNNING"
-       AND event.span_uuid = span.uuid
+       AND event.span_id = span.id
        AND span.type = "workqueue.task"
     """
 
@@ -32,15 +28,15 @@ parsl_WAITING_completed = """
     SELECT event.time
       FROM event, span
      WHERE event.type = "WAITING"
-       AND event.span_uuid = span.uuid
+       AND event.span_id = span.id
        AND span.type = "workqueue.task"
     """
 
 
 running_rows = list(cursor.execute(parsl_running_completed))
-running_data = np.array([float(row[0]) for row in running_rows])
+running_data = np.array([row[0] for row in running_rows])
 waiting_rows = list(cursor.execute(parsl_WAITING_completed))
-waiting_data = np.array([float(row[0]) for row in waiting_rows])
+waiting_data = np.array([row[0] for row in waiting_rows])
 
 # print(f"there are {len(rows)} relevant events in the db")
 
@@ -0,0 +1,35 @@
+import sqlite3
+
+from dnpcsql.schema import bulk_load, init_sql
+
+
+def report(db: sqlite3.Connection) -> None:
+    span_types = [name for (name,) in db.execute("SELECT name FROM span_type ORDER BY name")]
+    indexes = [name for (name,) in db.execute("SELECT name FROM sqlite_master WHERE type = 'index' "
+                                              "AND name NOT LIKE 'sqlite_autoindex_%' ORDER BY name")]
+    journal_mode = db.execute("PRAGMA journal_mode").fetchone()[0]
+    print(f"span types: {span_types}")
+    print(f"indexes: {indexes}")
+    print(f"journal mode: {journal_mode}")
+
+
+db = init_sql("dnpc.sqlite3")
+db.execute("INSERT INTO span_type (name) VALUES ('before')")
+db.commit()
+
+print("An import which succeeds is kept")
+with bulk_load(db):
+    db.execute("INSERT INTO span_type (name) VALUES ('succeeded')")
+report(db)
+
+print("An import which fails is rolled back, but the indexes are rebuilt")
+try:
+    with bulk_load(db):
+        db.execute("INSERT INTO span_type (name) VALUES ('failed')")
+        raise RuntimeError("import failed")
+except RuntimeError as e:
+    print(f"raised: {e}")
+db.close()
+
+# read the database again, to see what was committed
+report(sqlite3.connect("dnpc.sqlite3"))
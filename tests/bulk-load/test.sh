@@ -0,0 +1,10 @@
+#!/bin/bash -ex
+
+rm -f dnpc.sqlite3 *.out
+
+# there's no CLI for this - bulk_load is used by the importers through
+# the Python API
+python3 ./bulk_load.py > bulk_load.out
+diff bulk_load.out bulk_load.out.expected
+
+echo Test completed successfully
@@ -0,0 +1,27 @@
+import os
+import sqlite3
+
+from dnpcsql.db import connect_read_only, db_path
+
+# this runs with DNPCSQL_DB set, which --db (the path argument) overrides
+print(f"default path: {db_path()}")
+print(f"path given with --db: {db_path('other.sqlite3')}")
+
+db = connect_read_only()
+print(f"span types: {db.execute('SELECT count(*) FROM span_type').fetchone()[0]}")
+
+try:
+    db.execute("INSERT INTO span_type (name) VALUES ('written')")
+except sqlite3.OperationalError as e:
+    print(f"writing failed: {e}")
+
+try:
+    connect_read_only(run_ids=["a-run-id"])
+except RuntimeError as e:
+    print(f"choosing a run failed: {e}")
+
+try:
+    connect_read_only("missing.sqlite3")
+except sqlite3.OperationalError as e:
+    print(f"opening a missing database failed: {e}")
+print(f"missing database was created: {os.path.exists('missing.sqlite3')}")
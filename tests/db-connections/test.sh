@@ -0,0 +1,22 @@
+#!/bin/bash -ex
+
+rm -f dnpc.sqlite3 env.sqlite3 missing.sqlite3 *.out
+
+# DNPCSQL_DB chooses the database for the importer and the analysis tools
+DNPCSQL_DB=env.sqlite3 python3 -m dnpcsql.import_parsl_runinfo ../monitoring-db-clis/runinfo
+[ -f env.sqlite3 ]
+[ ! -f dnpc.sqlite3 ]
+
+DNPCSQL_DB=env.sqlite3 python3 -m dnpcsql.list_span_types > list_span_types.out
+diff list_span_types.out list_span_types.out.expected
+
+# and --db overrides it
+DNPCSQL_DB=missing.sqlite3 python3 -m dnpcsql.list_span_types --db env.sqlite3 > list_span_types_db.out
+diff list_span_types_db.out list_span_types.out.expected
+
+# the analysis tools open the database read-only, and do not create it if
+# it is missing
+DNPCSQL_DB=env.sqlite3 python3 ./connections.py > connections.out
+diff connections.out connections.out.expected
+
+echo Test completed successfully
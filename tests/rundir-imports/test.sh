@@ -0,0 +1,197 @@
+#!/bin/bash -ex
+
+# runinfo/ has two rundirs: 000 is a Work Queue run, with a tracing pickle
+# and some executor-side function_data logs, and it is the run recorded in
+# monitoring.db (shared with ../monitoring-db-clis); 001 is a separate
+# htex run, with an interchange log and the logs of two managers.
+
+# the htex logs have local times
+export TZ=UTC
+
+rm -rf dnpc.sqlite3* *.out scratch
+
+WQ_RUN_ID=0aeb31ac-cf4a-42c5-8086-1ae3d0f53842
+HTEX_RUN_ID=11111111-2222-3333-4444-555555555555
+
+# Check the importer runs, and that the command line tools produce
+# expected output from what it imported.
+python3 -m dnpcsql.import_parsl_runinfo ./runinfo
+
+python3 -m dnpcsql.list_span_types > list_span_types.out
+diff list_span_types.out list_span_types.out.expected
+
+python3 -m dnpcsql.list_event_sequences > list_event_sequences.out
+diff list_event_sequences.out list_event_sequences.out.expected
+
+python3 -m dnpcsql.list_event_sequences parsl.executor.htex.interchange.task > list_event_sequences_htex.out
+diff list_event_sequences_htex.out list_event_sequences_htex.out.expected
+
+python3 -m dnpcsql.list_slowest_spans > list_slowest_spans.out
+diff list_slowest_spans.out list_slowest_spans.out.expected
+
+python3 -m dnpcsql.list_event_sequences --by-entity parsl.monitoring.try > list_event_sequences_by_entity.out
+diff list_event_sequences_by_entity.out list_event_sequences_by_entity.out.expected
+
+python3 -m dnpcsql.wq_transfer_bandwidth > wq_transfer_bandwidth.out
+diff wq_transfer_bandwidth.out wq_transfer_bandwidth.out.expected
+
+# Reading the rundirs in parallel imports the same spans and events.
+rm -f dnpc.sqlite3
+python3 -m dnpcsql.import_parsl_runinfo --jobs 2 ./runinfo
+python3 -m dnpcsql.list_event_sequences > jobs.out
+diff jobs.out list_event_sequences.out.expected
+python3 -m dnpcsql.list_event_sequences parsl.executor.htex.interchange.task > jobs_htex.out
+diff jobs_htex.out list_event_sequences_htex.out.expected
+
+# A deterministic import can be repeated into the same database without
+# duplicating anything.
+rm -f dnpc.sqlite3
+python3 -m dnpcsql.import_parsl_runinfo --deterministic ./runinfo
+python3 -m dnpcsql.import_parsl_runinfo --deterministic ./runinfo
+python3 -m dnpcsql.list_event_sequences > deterministic.out
+diff deterministic.out list_event_sequences.out.expected
+python3 -m dnpcsql.list_event_sequences parsl.executor.htex.interchange.task > deterministic_htex.out
+diff deterministic_htex.out list_event_sequences_htex.out.expected
+
+# Each run in its own shard: the catalog presents the same data as a
+# single database, and --run-id queries only one shard.
+rm -f dnpc.sqlite3
+python3 -m dnpcsql.import_parsl_runinfo --shard ./runinfo
+python3 -m dnpcsql.list_event_sequences > shard.out
+diff shard.out list_event_sequences.out.expected
+python3 -m dnpcsql.list_event_sequences parsl.executor.htex.interchange.task > shard_htex.out
+diff shard_htex.out list_event_sequences_htex.out.expected
+python3 -m dnpcsql.list_slowest_spans --run-id $WQ_RUN_ID > shard_list_slowest_spans.out
+diff shard_list_slowest_spans.out shard_list_slowest_spans.out.expected
+python3 -m dnpcsql.list_event_sequences --run-id $HTEX_RUN_ID parsl.executor.htex.interchange.task > shard_run_id_htex.out
+diff shard_run_id_htex.out list_event_sequences_htex.out.expected
+
+# Importing one run into its shard leaves the other shard alone.
+python3 -m dnpcsql.import_parsl_runinfo --shard --run-id $HTEX_RUN_ID ./runinfo
+python3 -m dnpcsql.list_event_sequences > shard_reimport.out
+diff shard_reimport.out list_event_sequences.out.expected
+rm -rf dnpc.sqlite3 dnpc.sqlite3.shards
+
+# Only the log lines in a time window.
+rm -f dnpc.sqlite3
+python3 -m dnpcsql.import_parsl_runinfo --since 1680774978 --until 1680774990 ./runinfo
+python3 -m dnpcsql.list_event_sequences > time_window.out
+diff time_window.out time_window.out.expected
+python3 -m dnpcsql.list_event_sequences parsl.executor.htex.interchange.task > time_window_htex.out
+diff time_window_htex.out time_window_htex.out.expected
+
+# A hash-chosen sample of the tasks.
+rm -f dnpc.sqlite3
+python3 -m dnpcsql.import_parsl_runinfo --sample-rate 0.5 ./runinfo
+python3 -m dnpcsql.list_event_sequences > sample_rate.out
+diff sample_rate.out sample_rate.out.expected
+
+# The following change the rundirs, so work on a copy.
+rm -rf scratch
+mkdir scratch
+cp -rL runinfo scratch/runinfo
+
+# An incremental import re-imports only a run whose sources have changed:
+# here, the tracing pickle of the Work Queue run appears after the first
+# import.
+rm -f dnpc.sqlite3
+mv scratch/runinfo/000/parsl_tracing.pickle scratch/
+python3 -m dnpcsql.import_parsl_runinfo --incremental scratch/runinfo
+python3 -m dnpcsql.import_parsl_runinfo --incremental scratch/runinfo > incremental_unchanged.out
+grep "No new or changed workflow runs to import" incremental_unchanged.out
+mv scratch/parsl_tracing.pickle scratch/runinfo/000/
+python3 -m dnpcsql.import_parsl_runinfo --incremental scratch/runinfo
+python3 -m dnpcsql.list_event_sequences > incremental.out
+diff incremental.out list_event_sequences.out.expected
+
+# A source which was not there at first can be added later, and binds to
+# the spans which were imported from the rest of its workflow.
+rm -f dnpc.sqlite3
+mv scratch/runinfo/000/parsl_tracing.pickle scratch/
+python3 -m dnpcsql.import_parsl_runinfo --deterministic scratch/runinfo
+mv scratch/parsl_tracing.pickle scratch/runinfo/000/
+python3 -m dnpcsql.import_parsl_runinfo --deterministic --add-source tracing scratch/runinfo
+python3 -m dnpcsql.list_event_sequences > add_source.out
+diff add_source.out list_event_sequences.out.expected
+
+rm -rf scratch
+
+# In an htex run with no other source of its tries, the htex tasks are
+# bound to the tries that parsl.log says they were launched for, whether
+# the htex logs are imported with the rest of the rundir or added later.
+rm -rf dnpc.sqlite3 scratch
+mkdir scratch scratch/runinfo
+cp -rL runinfo/001 scratch/runinfo/
+python3 -m dnpcsql.import_parsl_runinfo scratch/runinfo
+python3 -m dnpcsql.list_event_sequences parsl.rundir.try > htex_bind.out
+diff htex_bind.out htex_bind.out.expected
+
+rm -f dnpc.sqlite3
+mv scratch/runinfo/001/htex_Local scratch/
+python3 -m dnpcsql.import_parsl_runinfo --deterministic scratch/runinfo
+mv scratch/htex_Local scratch/runinfo/001/
+python3 -m dnpcsql.import_parsl_runinfo --deterministic --add-source htex scratch/runinfo
+python3 -m dnpcsql.list_event_sequences parsl.rundir.try > htex_bind_add_source.out
+diff htex_bind_add_source.out htex_bind.out.expected
+
+rm -rf scratch
+
+# Follow mode imports only what has been appended to each log since the
+# last pass. The logs are cut to their first third to begin with, and the
+# tracing pickle is only written at the end of the workflow.
+rm -rf dnpc.sqlite3 scratch
+mkdir scratch scratch/full
+cp -rL runinfo scratch/runinfo
+mv scratch/runinfo/000/parsl_tracing.pickle scratch/full/
+LOGS="000/parsl.log 000/WorkQueueExecutor/transaction_log 001/htex_Local/interchange.log"
+for log in $LOGS; do
+  cp runinfo/$log scratch/full/$(basename $log)
+  head -n $(( $(wc -l < runinfo/$log) / 3 )) runinfo/$log > scratch/runinfo/$log
+done
+python3 -m dnpcsql.import_parsl_runinfo --follow --passes 1 scratch/runinfo
+
+# Lines are appended to each log, and the next pass resumes from where the
+# last one stopped.
+for log in $LOGS; do
+  lines=$(wc -l < runinfo/$log)
+  sed -n "$(( lines / 3 + 1 )),$(( lines * 2 / 3 ))p" runinfo/$log >> scratch/runinfo/$log
+done
+python3 -m dnpcsql.import_parsl_runinfo --follow --passes 1 scratch/runinfo
+
+# The Work Queue transaction_log is rotated: the rest of it goes into a new
+# file, which is read from its start. The interchange log is truncated
+# and the rest of it written into the same file, which is shorter than
+# the offset of the last pass, so it is read from its start too.
+lines=$(wc -l < runinfo/000/WorkQueueExecutor/transaction_log)
+mv scratch/runinfo/000/WorkQueueExecutor/transaction_log scratch/runinfo/000/WorkQueueExecutor/transaction_log.1
+tail -n +$(( lines * 2 / 3 + 1 )) runinfo/000/WorkQueueExecutor/transaction_log > scratch/runinfo/000/WorkQueueExecutor/transaction_log
+lines=$(wc -l < runinfo/001/htex_Local/interchange.log)
+tail -n +$(( lines * 2 / 3 + 1 )) runinfo/001/htex_Local/interchange.log > scratch/runinfo/001/htex_Local/interchange.log
+lines=$(wc -l < runinfo/000/parsl.log)
+tail -n +$(( lines * 2 / 3 + 1 )) runinfo/000/parsl.log >> scratch/runinfo/000/parsl.log
+mv scratch/full/parsl_tracing.pickle scratch/runinfo/000/
+python3 -m dnpcsql.import_parsl_runinfo --follow --passes 1 scratch/runinfo
+
+python3 -m dnpcsql.import_parsl_runinfo --follow --passes 1 scratch/runinfo > follow_unchanged.out
+grep "No new or changed workflow runs to import" follow_unchanged.out
+
+# the passes together import the same spans and events as one import of
+# the whole logs
+python3 -m dnpcsql.list_event_sequences > follow.out
+diff follow.out list_event_sequences.out.expected
+python3 -m dnpcsql.list_event_sequences parsl.executor.htex.interchange.task > follow_htex.out
+diff follow_htex.out list_event_sequences_htex.out.expected
+
+rm -rf scratch
+
+# A follow pass is retried after an error only if the error can be
+# expected from a file or database caught in the middle of being written.
+python3 -c "
+import sqlite3
+from dnpcsql.import_parsl_runinfo import is_transient_error
+assert is_transient_error(sqlite3.OperationalError('database is locked'))
+assert not is_transient_error(sqlite3.OperationalError('no such table: span'))
+assert not is_transient_error(ValueError())
+"
+
+echo Test completed successfully
@@ -0,0 +1,35 @@
+#!/bin/bash -ex
+
+rm -f dnpc.sqlite3 *.out
+
+# version_0.sql is a dump of a version 0 database, made by importing
+# ../monitoring-db-clis/runinfo with the original schema, where event
+# times are TEXT and spans are keyed by UUID.
+python3 -c "import sqlite3; sqlite3.connect('dnpc.sqlite3').executescript(open('version_0.sql').read())"
+
+# check every upgrade step runs, in order
+python3 -m dnpcsql.schema > schema.out
+diff schema.out schema.out.expected
+
+# check the upgraded database presents the same spans and events as a new
+# import of the same monitoring.db
+python3 -m dnpcsql.list_span_types > list_span_types.out
+diff list_span_types.out list_span_types.out.expected
+
+python3 -m dnpcsql.list_event_sequences > list_event_sequences.out
+diff list_event_sequences.out list_event_sequences.out.expected
+
+# the upgrade does not build the derived tables, so list_slowest_spans
+# cannot run until they have been built
+! python3 -m dnpcsql.list_slowest_spans 2> list_slowest_spans_no_summary.out
+grep "run python3 -m dnpcsql.derived" list_slowest_spans_no_summary.out
+python3 -m dnpcsql.derived
+python3 -m dnpcsql.list_slowest_spans > list_slowest_spans.out
+diff list_slowest_spans.out list_slowest_spans.out.expected
+
+rm -f dnpc.sqlite3
+python3 -m dnpcsql.import_parsl_runinfo ../monitoring-db-clis/runinfo
+python3 -m dnpcsql.list_event_sequences > new_import.out
+diff new_import.out list_event_sequences.out.expected
+
+echo Test completed successfully
@@ -0,0 +1,562 @@
+BEGIN TRANSACTION;
+CREATE TABLE event (uuid TEXT PRIMARY KEY,span_uuid TEXT REFERENCES span (uuid),time TEXT NOT NULL,type TEXT NOT NULL,note TEXT);
+INSERT INTO "event" VALUES('2f7439e9-907a-4205-bdae-0e85989f80fb','4daa50f1-2ca6-4953-9f17-8fa9da291770','1680774958.425735','began','Start of workflow from parsl monitoring.db');
+INSERT INTO "event" VALUES('7a4515ae-eb9c-43eb-9739-88b448c63fa3','4daa50f1-2ca6-4953-9f17-8fa9da291770','1680774988.753103','completed','End of workflow from parsl monitoring.db');
+INSERT INTO "event" VALUES('a7b76f48-9296-4458-bb34-d33e734657e1','91f49fe2-a670-46e6-9243-fb63d13a8af3','1680774973.474712','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('c6d0aa34-14c3-46f9-862d-66d1c8e1f2a0','91f49fe2-a670-46e6-9243-fb63d13a8af3','1680774987.750592','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('82a96496-7ebe-441f-b8f0-38002458f75e','631e2f6e-5846-4001-83cb-8d27c21f2613','1680774987.75069','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('5ff9f959-63f1-49f3-b68c-9dc3565c87e7','631e2f6e-5846-4001-83cb-8d27c21f2613','1680774973.481955','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('d45108e2-9955-468d-b954-ffbf17fe244b','631e2f6e-5846-4001-83cb-8d27c21f2613','1680774973.47524','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('8f9b7ec0-7f15-4162-b122-4548f6477fb2','631e2f6e-5846-4001-83cb-8d27c21f2613','1680774986.685164','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('afb4ed3a-536f-4e96-af0a-1ad117c73e1e','631e2f6e-5846-4001-83cb-8d27c21f2613','1680774986.706369','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f1475573-d58f-46f5-80eb-32d3c0332de9','8043ba33-e6ba-402a-be9b-b7b39377850f','1680774973.482674','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('32767e39-4569-4ddc-ad76-8baea69d1bce','8043ba33-e6ba-402a-be9b-b7b39377850f','1680774986.748634','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('76371d85-bddd-4603-a2ed-49d178ca1147','28569b18-f586-4b16-be73-7fa846ff1a0d','1680774986.748662','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a12f3385-6543-41c2-b86f-802c73337b14','28569b18-f586-4b16-be73-7fa846ff1a0d','1680774973.484543','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('419bcc9d-9fae-4e25-959a-b48d1a26fc4b','28569b18-f586-4b16-be73-7fa846ff1a0d','1680774973.483776','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('0af60889-d214-49aa-85e4-1647390cfa63','28569b18-f586-4b16-be73-7fa846ff1a0d','1680774986.438319','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('4315552a-12ef-4088-bb5c-f516fe0ced20','28569b18-f586-4b16-be73-7fa846ff1a0d','1680774986.458679','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a837a862-1cf9-4e0e-ba40-808f3b21fcf0','1aa39661-0bad-4996-9b3a-7415765eba42','1680774973.484823','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('41650d18-98bc-4e03-b032-03b363f4613c','1aa39661-0bad-4996-9b3a-7415765eba42','1680774986.501895','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('30af3256-1a02-4eb9-9a43-cac02e63a9dd','ae2c6fed-3c4d-4bee-ad93-2512a1b02f93','1680774986.501923','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('068947f3-0170-4c26-92a5-d1a2909b73d7','ae2c6fed-3c4d-4bee-ad93-2512a1b02f93','1680774973.485801','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('4018a460-395d-446f-ac82-a1132385d693','ae2c6fed-3c4d-4bee-ad93-2512a1b02f93','1680774973.484982','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('9ace4172-de6b-4c9d-8230-5bd375c21c39','ae2c6fed-3c4d-4bee-ad93-2512a1b02f93','1680774986.193691','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('ad789b91-ac8e-42ce-9749-b1156d6dc8e2','ae2c6fed-3c4d-4bee-ad93-2512a1b02f93','1680774986.213828','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('2a087b56-6ba3-4e0f-92ad-8c3767a7cff7','8bbd185d-f471-412d-a3e0-a40251cc7ba2','1680774973.486173','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('66e8fcde-49ac-438b-b9ef-75af71ff6780','8bbd185d-f471-412d-a3e0-a40251cc7ba2','1680774986.255841','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('6b14b264-0d75-40ca-8a59-ccb3eb774c3a','a13dd61b-e7b6-4cf0-95c1-2ec5b2e57325','1680774986.255881','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('3d460593-4262-4f87-9b27-c8acffd2c363','a13dd61b-e7b6-4cf0-95c1-2ec5b2e57325','1680774973.486963','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('0e57abf3-4043-4ac3-8803-cb6cae1acfd0','a13dd61b-e7b6-4cf0-95c1-2ec5b2e57325','1680774973.486283','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('616c0a93-6438-4403-aa24-59fadd61af9b','a13dd61b-e7b6-4cf0-95c1-2ec5b2e57325','1680774985.954561','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('c54fe154-0f00-45c4-9f9f-f1badfe95424','a13dd61b-e7b6-4cf0-95c1-2ec5b2e57325','1680774985.974536','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('ec30498d-c99e-4761-9a2e-8aeaf6cfaed9','b409da93-fb4e-49a1-b88c-dc35d002de91','1680774973.487241','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('560c7019-1c99-453f-9f3d-04781f51b0ef','b409da93-fb4e-49a1-b88c-dc35d002de91','1680774986.017337','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('61aad700-bedd-49b1-9714-8cda63e3f631','36dea544-1790-4b35-8fb0-b052769e1f4d','1680774986.017363','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('d7a67038-08ee-410d-96eb-9bf65d5d2bb4','36dea544-1790-4b35-8fb0-b052769e1f4d','1680774973.487955','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('cdf81b49-f22e-4dad-9443-fe4cd9b2eca1','36dea544-1790-4b35-8fb0-b052769e1f4d','1680774973.487344','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('2374c25a-fd4e-471d-88c0-e744d140b41f','36dea544-1790-4b35-8fb0-b052769e1f4d','1680774985.707494','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('3f91f808-4a29-4643-aba0-96d8987e8542','36dea544-1790-4b35-8fb0-b052769e1f4d','1680774985.728269','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('130f99e2-e021-41de-91f2-89d2fc4297a1','24b66cae-1232-435c-9457-c0b159782ede','1680774973.488203','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('ce4c085c-caee-4c82-82f0-b06f9810aa1c','24b66cae-1232-435c-9457-c0b159782ede','1680774985.771141','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('d684cec4-9dfe-414e-96fd-e413c5b56b65','468fa780-5730-484c-887f-f4ba19bec3f5','1680774985.771195','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('632ab590-9b56-4372-bc64-11836b381444','468fa780-5730-484c-887f-f4ba19bec3f5','1680774973.488912','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('6a9d12e6-dcf5-4633-9147-faf58db59dc9','468fa780-5730-484c-887f-f4ba19bec3f5','1680774973.488307','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('2eaa88c0-eb8c-4142-9afc-9478d1a0f74c','468fa780-5730-484c-887f-f4ba19bec3f5','1680774985.463512','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f8d997e9-6b57-47e8-ad23-7508d0b3d047','468fa780-5730-484c-887f-f4ba19bec3f5','1680774985.483748','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('1529209b-3017-49f1-8647-6ea167823aa9','9ea56f72-9906-44ac-a0ab-1687e2166c7b','1680774973.489126','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('60c21036-20a9-414f-b0c2-fb0ac933b90c','9ea56f72-9906-44ac-a0ab-1687e2166c7b','1680774985.527009','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('c6a55262-0a11-4307-837b-321f9ccf0fc2','6769f31c-bffc-407e-985f-87012acc26a6','1680774985.527036','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('2d688154-4ede-49c9-b642-a55330197d6f','6769f31c-bffc-407e-985f-87012acc26a6','1680774973.489992','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('061f6694-abd4-4462-85aa-77f0901d3632','6769f31c-bffc-407e-985f-87012acc26a6','1680774973.489254','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('eedf5b6e-3806-4ed9-b647-15ccc4af1c74','6769f31c-bffc-407e-985f-87012acc26a6','1680774985.21973','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('9638e548-2bc1-4dec-bd30-dd0beb7afbc1','6769f31c-bffc-407e-985f-87012acc26a6','1680774985.239875','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('8d7230b2-8003-4e4e-84ab-13033fe84dc4','bac81e4c-b211-492f-b065-b5f230f47cc6','1680774973.490248','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('c113daf5-3dfc-4250-9173-482a38243bdd','bac81e4c-b211-492f-b065-b5f230f47cc6','1680774985.283137','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('25557559-a3b7-44a5-93ed-4f711af80932','319c4939-f262-4b16-befe-c1610695fa26','1680774985.283185','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('c7785bb9-013c-486d-ae54-fc94a79733e9','319c4939-f262-4b16-befe-c1610695fa26','1680774973.49102','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('cb5639e5-68fb-45c3-826d-bee89407185b','319c4939-f262-4b16-befe-c1610695fa26','1680774973.490372','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('95ae8b07-8173-41f5-912e-08c2d2c94c81','319c4939-f262-4b16-befe-c1610695fa26','1680774984.972173','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a763b051-f12c-4e37-af8c-3ae5d7f439e5','319c4939-f262-4b16-befe-c1610695fa26','1680774984.992745','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('22455efd-7675-43b7-b318-fc9416a6ebaa','e3bc84ee-8334-4963-9964-96e290c55def','1680774973.491287','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('f46dd9c0-bfc3-44cb-b62a-15b84859869d','e3bc84ee-8334-4963-9964-96e290c55def','1680774985.036121','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('5370ea0e-adab-4426-aa0c-2d9e491270cc','335ee18e-bd2b-4d94-aef4-1789df6becf8','1680774985.036157','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('959e9f99-2868-48de-a5b2-d8df4b6e4530','335ee18e-bd2b-4d94-aef4-1789df6becf8','1680774973.491987','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('92fc1a62-4324-4440-80ab-bc1e5a59bcff','335ee18e-bd2b-4d94-aef4-1789df6becf8','1680774973.49139','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('fbfa690a-02c7-4519-a172-c973a2c85488','335ee18e-bd2b-4d94-aef4-1789df6becf8','1680774984.727827','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a49c11b5-30fd-40dc-84b4-c1eb4772014f','335ee18e-bd2b-4d94-aef4-1789df6becf8','1680774984.748343','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f28bb250-1862-44df-bdca-ce3687cc1a4d','6aa4c939-60a0-4bc5-a080-363c2ee1b673','1680774973.492261','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('d3a90357-10a5-49aa-bf44-4d6d5c00ec3d','6aa4c939-60a0-4bc5-a080-363c2ee1b673','1680774984.7913','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('dec3455f-afd4-4af1-bad0-cb8677aa578f','c1b55ed1-9597-4388-9a69-be4d36fd60a8','1680774984.791327','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('ae397937-28fb-41be-826d-233fba445ddf','c1b55ed1-9597-4388-9a69-be4d36fd60a8','1680774973.49297','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('dbd79171-3c2a-47f6-aef2-5c7d2cb3e638','c1b55ed1-9597-4388-9a69-be4d36fd60a8','1680774973.492363','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f5bbc87d-e8c3-464e-b383-d6bc17c64653','c1b55ed1-9597-4388-9a69-be4d36fd60a8','1680774984.48116','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('8e604810-7a23-4f38-b13a-ebbb57a2d4b9','c1b55ed1-9597-4388-9a69-be4d36fd60a8','1680774984.501972','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('6f5706f1-fd78-4c08-b311-e89868b8be4d','7c27eb82-28e2-46ad-89f3-b85250f54a6e','1680774973.493235','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('f55f9894-b466-4650-b259-ac24f2959652','7c27eb82-28e2-46ad-89f3-b85250f54a6e','1680774984.545538','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('fbadec2b-9c51-475e-a5f1-6146c7da0ab3','ca930cc1-4849-4f9e-9f27-228e3efd45c3','1680774984.545587','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('5ca9a12a-ba09-481f-8726-9e54a3c3ae9d','ca930cc1-4849-4f9e-9f27-228e3efd45c3','1680774973.493929','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('47e432c8-a798-46e2-a37e-8edcb0fa307c','ca930cc1-4849-4f9e-9f27-228e3efd45c3','1680774973.493334','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f982fbcc-a4df-4546-8989-f11129fd3a2d','ca930cc1-4849-4f9e-9f27-228e3efd45c3','1680774984.236942','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('b8910325-ff4e-4c88-b9e7-40cc9b1aa0b6','ca930cc1-4849-4f9e-9f27-228e3efd45c3','1680774984.256646','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('fb4ed0a4-7762-40d0-bce2-4d19fe52e07f','9b3f68c5-dd00-4f2e-abde-4dd21ccdd20c','1680774973.494173','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('4e8a22ca-2d4e-45bc-b754-966711a772de','9b3f68c5-dd00-4f2e-abde-4dd21ccdd20c','1680774984.299186','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('dfc4d38f-9b04-4a44-90e9-9103c3d365cb','8f744caf-4e74-44bc-8a0e-daf63e782317','1680774984.299213','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('43652ccf-4d74-44d4-b000-93a66e5e04cf','8f744caf-4e74-44bc-8a0e-daf63e782317','1680774973.494858','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('3f79bfe9-1304-4fe1-ac08-6b0f0792fb7d','8f744caf-4e74-44bc-8a0e-daf63e782317','1680774973.494275','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a701978d-62a6-42f5-8269-6fa3ca44ac59','8f744caf-4e74-44bc-8a0e-daf63e782317','1680774983.996037','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f9a32206-9fd1-4235-a527-284634be095c','8f744caf-4e74-44bc-8a0e-daf63e782317','1680774984.016237','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('10a89c79-8b1f-471b-a430-5219d3247a57','2d20e657-b7ea-46b2-872e-35fbdf492515','1680774973.495113','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('8352aa4b-bcec-46b5-aab5-80bb5c585831','2d20e657-b7ea-46b2-872e-35fbdf492515','1680774984.059745','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('f7a91827-2fef-4c7e-af14-aacf1399b831','9924e057-e4e5-4b85-ac2d-6ac7470c4eea','1680774984.059789','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('889a221c-bdbf-4b85-9431-d478503425f3','9924e057-e4e5-4b85-ac2d-6ac7470c4eea','1680774973.495795','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('9dd2b897-370c-4db3-b4a7-cd8989e6595e','9924e057-e4e5-4b85-ac2d-6ac7470c4eea','1680774973.495213','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('dee3837b-2366-4ab1-95e5-cae2a77313a1','9924e057-e4e5-4b85-ac2d-6ac7470c4eea','1680774983.752248','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('3b9c6ceb-54d5-462b-83c6-db47c4357745','9924e057-e4e5-4b85-ac2d-6ac7470c4eea','1680774983.772673','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('b791be83-e3c6-455d-871b-cfc1c1a1132a','8b561ee7-1714-490c-867f-ddc73640f519','1680774973.49604','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('161f6021-18c1-4865-b1d2-de87e019e449','8b561ee7-1714-490c-867f-ddc73640f519','1680774983.81572','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('0a0ab9ba-0ceb-4900-887d-d2ed05fc0a81','21a3c145-a77a-4c47-9ac8-5ae479c27f25','1680774983.815755','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('08c40c70-5286-403c-aedd-d0b7713ad746','21a3c145-a77a-4c47-9ac8-5ae479c27f25','1680774973.496809','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('56d40b8b-8c19-479f-bb43-575d3cb2c9ae','21a3c145-a77a-4c47-9ac8-5ae479c27f25','1680774973.496138','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('937577d0-d5ca-4293-a53b-25d6cbf4ef56','21a3c145-a77a-4c47-9ac8-5ae479c27f25','1680774983.500147','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('fc5f0897-1ed6-4ab3-bc51-beb535a827da','21a3c145-a77a-4c47-9ac8-5ae479c27f25','1680774983.520236','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('1a5fe6b8-92b8-4eb7-a9b7-05cc7f66b235','27e53605-12b1-4654-bd8c-692c51df390a','1680774973.497062','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('96eb3ef2-2c71-4f19-9e62-22b36945e20e','27e53605-12b1-4654-bd8c-692c51df390a','1680774983.563336','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('6239bc5d-94f1-4eb0-87b9-cf4d9fb3357f','53f05eeb-7a95-4474-8616-1c72215c08b3','1680774983.563375','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('eadd23ae-8063-4f0d-b04c-d0c9ede3e1e7','53f05eeb-7a95-4474-8616-1c72215c08b3','1680774973.497752','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a3ee0903-8555-42fa-9b9a-fe5bd6864e31','53f05eeb-7a95-4474-8616-1c72215c08b3','1680774973.49717','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('1561efa6-23e9-4af0-873a-9d8b9d47ddc0','53f05eeb-7a95-4474-8616-1c72215c08b3','1680774983.256607','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('d4c29719-93eb-4138-b517-20b902e433d3','53f05eeb-7a95-4474-8616-1c72215c08b3','1680774983.276554','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('859c2de8-f746-4273-9413-e88888f275cd','6376f681-3b07-4437-9e7f-5f491341afba','1680774973.497994','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('631956a8-321d-447a-ae23-7c7622ce0288','6376f681-3b07-4437-9e7f-5f491341afba','1680774983.319452','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('ffb3299b-e819-486a-8225-484805f962cd','54b91219-b3af-4734-999f-3cd925e883e8','1680774983.319487','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a3ac3a0d-ee25-4271-b7aa-fc12b06ec1c7','54b91219-b3af-4734-999f-3cd925e883e8','1680774973.498671','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('855832fe-a6c9-4d13-87c2-beccb88f4e32','54b91219-b3af-4734-999f-3cd925e883e8','1680774973.498095','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('c4b20f80-a676-45bf-98e4-fe12e688cbc3','54b91219-b3af-4734-999f-3cd925e883e8','1680774983.010989','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('00e66bd7-0de7-44aa-9346-5f76fa8ff894','54b91219-b3af-4734-999f-3cd925e883e8','1680774983.03143','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('0a15a187-e289-4b61-a074-d0633dcbcf44','c265b263-bd55-4b4e-a46e-8a6a41d3a863','1680774973.498905','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('685bae9c-5b1e-4b6a-b895-d20ef3971c23','c265b263-bd55-4b4e-a46e-8a6a41d3a863','1680774983.074564','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('d29e7ee0-f969-4ae3-b557-4ea810e828ec','d240c073-84eb-4dcb-84ff-0bb19db247fd','1680774983.074599','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f4591408-dd18-4a6b-9977-bf95f08d50e7','d240c073-84eb-4dcb-84ff-0bb19db247fd','1680774973.49958','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('6c3ca8dd-e1d3-4a51-8236-84476f0d0cae','d240c073-84eb-4dcb-84ff-0bb19db247fd','1680774973.499004','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('3a7ff426-0de8-4b10-b0f8-b1c6e7a20bc5','d240c073-84eb-4dcb-84ff-0bb19db247fd','1680774982.769269','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('93c010b4-0333-412a-813d-03bee7dfc00a','d240c073-84eb-4dcb-84ff-0bb19db247fd','1680774982.790078','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('9e18add6-b83a-472b-ae1c-8b9f4e87a4a3','7da9ece7-2da1-4969-afbe-7af81a52d35b','1680774973.499819','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('e8b3b24d-a023-4f6e-9dc5-e956d3376cf4','7da9ece7-2da1-4969-afbe-7af81a52d35b','1680774982.832463','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('59133e12-72c6-4639-a99c-1471f0588c0f','3c9aa2aa-968c-45cf-ba86-c093929d2bec','1680774982.832498','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('80f5d510-a947-4124-821d-b2e24f792bd7','3c9aa2aa-968c-45cf-ba86-c093929d2bec','1680774973.500528','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('0e357e17-5801-4ff8-a908-6f5b23ac4df7','3c9aa2aa-968c-45cf-ba86-c093929d2bec','1680774973.499919','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('5f64dcd3-a6df-441e-b396-7ca7e0fae513','3c9aa2aa-968c-45cf-ba86-c093929d2bec','1680774982.525078','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('bd7c2ebf-62a0-4fdd-93ca-f0b43474134c','3c9aa2aa-968c-45cf-ba86-c093929d2bec','1680774982.545505','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('8e48bf92-9ecf-489a-bb2a-ba701b40b114','fa5133d6-77c1-4865-97cc-3568eac07e0f','1680774973.500775','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('74bb1658-9038-466c-a2b2-cfec91f881e4','fa5133d6-77c1-4865-97cc-3568eac07e0f','1680774982.588173','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('992118d7-0bde-4feb-af3f-f2278091582e','830032d9-4236-4301-9f2f-ebef277a13d0','1680774982.588208','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('07af29ec-6043-47d2-bca2-ef967d42fb43','830032d9-4236-4301-9f2f-ebef277a13d0','1680774973.501446','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('fffea606-a219-410c-a14d-cc2c5352b139','830032d9-4236-4301-9f2f-ebef277a13d0','1680774973.500872','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('17b31376-cab5-4593-b894-477e01011097','830032d9-4236-4301-9f2f-ebef277a13d0','1680774982.27594','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('163685ce-213d-475a-82c4-dd157b966dbe','830032d9-4236-4301-9f2f-ebef277a13d0','1680774982.29633','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('1b712e6a-dcaf-41fe-8e1c-abc949d7cb78','ecfd3daa-dc65-4f6a-936c-bd2b39cdd270','1680774973.501682','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('7d837453-c5d8-4d9b-856b-2d5579b6ae59','ecfd3daa-dc65-4f6a-936c-bd2b39cdd270','1680774982.338235','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('cd3581c8-5c26-43d0-9510-0a26d1447b1f','a6aa15dc-3bae-4cc9-bb9c-f57e20c12925','1680774982.33827','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('b8d806c4-5336-45c5-b7d8-928b88a50e4b','a6aa15dc-3bae-4cc9-bb9c-f57e20c12925','1680774973.502356','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('64a8cd8c-aa33-41fa-9791-19fbde388049','a6aa15dc-3bae-4cc9-bb9c-f57e20c12925','1680774973.501778','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('d95f0958-c589-4c11-b64f-c43965e4e3c4','a6aa15dc-3bae-4cc9-bb9c-f57e20c12925','1680774982.033314','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('827e75c3-41d7-4d8b-8159-4df78c17188b','a6aa15dc-3bae-4cc9-bb9c-f57e20c12925','1680774982.053364','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('2d39cf11-aea8-4ece-8cc4-4a3edcbe5cb8','5ac80f6c-9c8c-42a5-8112-27be03633e1a','1680774973.502593','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('1ab619a5-d454-4306-86cd-014191ad59df','5ac80f6c-9c8c-42a5-8112-27be03633e1a','1680774982.095891','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('8bc9740e-d7ba-433f-ba3d-67d080737a19','63336b4a-61d0-4388-89e1-aa4dc63f6973','1680774982.095927','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('c0f443c7-1506-4395-92e2-3edfd1909774','63336b4a-61d0-4388-89e1-aa4dc63f6973','1680774973.503267','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('31d6709f-d552-4562-aa6d-a1d617e33846','63336b4a-61d0-4388-89e1-aa4dc63f6973','1680774973.502698','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('22e21a17-cb72-4206-86af-d4eea0cc6544','63336b4a-61d0-4388-89e1-aa4dc63f6973','1680774981.793319','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('292041d5-4b7e-444d-a95b-22c89f93bbba','63336b4a-61d0-4388-89e1-aa4dc63f6973','1680774981.813569','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('32271d95-fb98-45cc-b34e-26faa79dca62','484ee455-5b29-4ea6-a757-7d0201cc12d5','1680774973.503498','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('d65c4bb3-027c-4615-a588-6e71c18a0ad9','484ee455-5b29-4ea6-a757-7d0201cc12d5','1680774981.855705','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('e6a2b9f4-dffa-4ba5-8238-56fe231d5729','8fdd4fd6-c62e-4255-b409-36c0af855af1','1680774981.855743','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('68037f87-ecf2-411a-8f73-d72d24f6d60f','8fdd4fd6-c62e-4255-b409-36c0af855af1','1680774973.504169','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('41c261a0-c63e-4d88-8b8a-e93b0a27eab6','8fdd4fd6-c62e-4255-b409-36c0af855af1','1680774973.503594','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('4d5a89a6-342f-4c84-995e-a2198a97150f','8fdd4fd6-c62e-4255-b409-36c0af855af1','1680774981.51206','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('7ec21998-eb51-4ed9-8de8-b74786986b08','8fdd4fd6-c62e-4255-b409-36c0af855af1','1680774981.537147','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('23679186-1c15-496d-92a3-a9ad577ed7e9','18859ae7-79f9-4b98-a1b3-b08266e829ac','1680774973.504442','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('df8b3c74-ece0-42c9-9e71-fb4ed25c2cd2','18859ae7-79f9-4b98-a1b3-b08266e829ac','1680774981.608667','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('1dd92877-7b86-4e89-a418-279da3ebb6f0','5c1d4981-e321-4c81-81b0-f1636ad9e1f1','1680774981.608705','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('6c9a11f0-1428-4e3f-b2ec-a4daa3864836','5c1d4981-e321-4c81-81b0-f1636ad9e1f1','1680774973.505151','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('7fd614c5-7fdf-4227-a5f3-39f76e0a111c','5c1d4981-e321-4c81-81b0-f1636ad9e1f1','1680774973.504558','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a418faea-a5e7-4063-9521-2064178d936e','5c1d4981-e321-4c81-81b0-f1636ad9e1f1','1680774981.255536','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('e2b90192-1d18-4115-a691-5f0a77d49718','5c1d4981-e321-4c81-81b0-f1636ad9e1f1','1680774981.276123','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('d2c7cf27-8fa4-4942-bebc-abb52e4d0b55','c4376650-dece-4714-a0fc-bc068bcf58e7','1680774973.505387','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('02080541-88ec-41cb-8424-3c01f771ce9c','c4376650-dece-4714-a0fc-bc068bcf58e7','1680774981.317944','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('e99e6074-585c-43e5-bd28-db702edaeb6d','1c907fdc-138a-443a-b36c-dc7e6596ee3a','1680774981.317991','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('3082f401-e2fc-42be-babc-e2569b8c6fb9','1c907fdc-138a-443a-b36c-dc7e6596ee3a','1680774973.506066','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('df1b03bd-4f01-489e-a631-5de9075dd408','1c907fdc-138a-443a-b36c-dc7e6596ee3a','1680774973.505484','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('b9487cec-5141-4a48-aa46-e6d38541fe67','1c907fdc-138a-443a-b36c-dc7e6596ee3a','1680774981.01504','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('b912d330-3afc-486e-a5dc-5486a8c8a80d','1c907fdc-138a-443a-b36c-dc7e6596ee3a','1680774981.035144','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('6c2eeb01-941c-42bb-abf1-f4016d8c6fd0','8f7fd8d4-5488-421f-9d5d-f86aa9770c92','1680774973.506316','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('c7a0704e-dd71-480c-9fa6-4befa916b4fd','8f7fd8d4-5488-421f-9d5d-f86aa9770c92','1680774981.077891','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('4b5228cc-b88c-4013-b69c-c78c2d368215','1e023fbf-5020-4bb5-9ea9-da89aec96d13','1680774981.077917','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('265c7c9f-b7fb-46f9-9d0e-a616e880ffba','1e023fbf-5020-4bb5-9ea9-da89aec96d13','1680774973.50701','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('ad0b8566-58f5-4336-b707-13fc85cc2a4d','1e023fbf-5020-4bb5-9ea9-da89aec96d13','1680774973.506416','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('913a273f-707e-4fb7-ac10-155f8076f126','1e023fbf-5020-4bb5-9ea9-da89aec96d13','1680774980.773175','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('dfac710a-15e3-43a9-b78a-5bae84d8bc56','1e023fbf-5020-4bb5-9ea9-da89aec96d13','1680774980.793158','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('bb12c742-9cc3-4be7-a0f2-419e751e1613','3547c2ac-848d-4773-b366-53dde5acdaab','1680774973.507247','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('2fc2b7ca-a3fa-4964-ab88-54f65fd30145','3547c2ac-848d-4773-b366-53dde5acdaab','1680774980.836005','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('031c67ca-0743-4c99-897d-36fcc91425bb','d6449581-9aa4-433c-a962-19f25df1bd8e','1680774980.836045','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('d83f2039-f160-4238-bc23-da207515b090','d6449581-9aa4-433c-a962-19f25df1bd8e','1680774973.507921','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('057434f8-8cbd-49f8-97d1-3339986ce6af','d6449581-9aa4-433c-a962-19f25df1bd8e','1680774973.507345','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a9ab7055-25e4-418a-8418-21a13caed00d','d6449581-9aa4-433c-a962-19f25df1bd8e','1680774980.533495','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('e6dde643-7f31-4ca8-b7f6-c78e62c65773','d6449581-9aa4-433c-a962-19f25df1bd8e','1680774980.553277','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('13343931-efdf-4cb9-952b-4be941dfc164','b78d50a9-c7f4-478c-b3c9-b42569a5342b','1680774973.508164','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('9ef1cb87-7f9e-4b71-81e9-4707018d76e8','b78d50a9-c7f4-478c-b3c9-b42569a5342b','1680774980.595833','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('571f21e7-6986-475f-9328-750beb63db62','e787aabd-73bd-4be7-89b1-16dea87c4af5','1680774980.59586','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('d08a7a27-7a0e-478f-9168-f6c974d2d316','e787aabd-73bd-4be7-89b1-16dea87c4af5','1680774973.509799','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('2608d190-4bb3-499a-8ed7-00c2e3678bbb','e787aabd-73bd-4be7-89b1-16dea87c4af5','1680774973.508267','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f57e737d-b272-47d2-8484-fee9727e3cdb','e787aabd-73bd-4be7-89b1-16dea87c4af5','1680774980.285762','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('666552c0-9756-4650-9b27-3d7230fda926','e787aabd-73bd-4be7-89b1-16dea87c4af5','1680774980.305593','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('8bbbf3e8-5401-4597-a13d-576de4269c9e','3d9b8c0f-e7a3-4839-8161-6e5cd214578c','1680774973.51007','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('53eeaf35-b6bd-4c34-82c9-2d7954c262f7','3d9b8c0f-e7a3-4839-8161-6e5cd214578c','1680774980.348557','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('92808dce-cd34-4ecf-a396-432e32dd4eee','2f2be627-a4fa-4e56-9c67-7fb7299599d9','1680774980.348585','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('1837583d-acbc-468a-90a2-aeb005827085','2f2be627-a4fa-4e56-9c67-7fb7299599d9','1680774973.510843','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('84c9ba4a-e86c-457a-a28d-82ae5c6e26c5','2f2be627-a4fa-4e56-9c67-7fb7299599d9','1680774973.510177','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('570862cd-bca9-4dc6-a1bb-538b6dc1c5fb','2f2be627-a4fa-4e56-9c67-7fb7299599d9','1680774980.042072','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('cdd4882c-f11b-4662-9d39-42adfb467262','2f2be627-a4fa-4e56-9c67-7fb7299599d9','1680774980.062613','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('1a520d6d-1c14-47e1-920f-476f7ff60a4d','cfb04a34-62ef-40c3-87ae-85165b995c8b','1680774973.511127','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('57f2e94c-7be0-4709-81eb-29c7f220ad8b','cfb04a34-62ef-40c3-87ae-85165b995c8b','1680774980.105304','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('6ffb69bc-9cb2-4c83-b5b4-45b29ac6d634','97df5711-6599-4e20-8eb0-629d656f725a','1680774980.105333','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f20df511-f257-4ea3-8ed3-58c085088f5a','97df5711-6599-4e20-8eb0-629d656f725a','1680774973.51188','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('84cb1c39-5a2a-4ac5-9a16-81f399dc3bca','97df5711-6599-4e20-8eb0-629d656f725a','1680774973.511249','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('be86bfe5-4dca-4e17-8ae0-d8794ab2cd90','97df5711-6599-4e20-8eb0-629d656f725a','1680774979.799443','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('27364399-8403-4eff-ad3e-41e9fe9b011f','97df5711-6599-4e20-8eb0-629d656f725a','1680774979.819837','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('70438074-a52f-47ba-adb8-aeec5751d8b2','c47d0fb0-2927-4a68-8fae-d776a020f4e1','1680774973.512167','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('5dc563f3-a6f6-4e93-a31d-0ba0595c71fd','c47d0fb0-2927-4a68-8fae-d776a020f4e1','1680774979.863358','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('ff4079fe-3f82-46f2-87e7-9ebc744c1ad2','f70a80f3-b665-4533-b7a8-cd49fe7f0464','1680774979.863384','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('d95f56d6-128a-4b5e-953f-d3bc3cf6c374','f70a80f3-b665-4533-b7a8-cd49fe7f0464','1680774973.512904','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('dcb8ebee-7c82-4e4a-adbd-9bae569e34b1','f70a80f3-b665-4533-b7a8-cd49fe7f0464','1680774973.51227','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('6aefee12-04f1-42ef-aa39-81f40b9a2f7b','f70a80f3-b665-4533-b7a8-cd49fe7f0464','1680774979.553576','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f6281f53-7263-4ccd-8c15-6c7c1acdd97b','f70a80f3-b665-4533-b7a8-cd49fe7f0464','1680774979.574043','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('bc51ffda-28a9-432e-88a9-1cc709cfad7c','20e77d26-ba42-4cb0-9ee5-90e1e6a4d14b','1680774973.513177','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('18cfeb9a-a61d-4a2b-8cc7-1bd16076e035','20e77d26-ba42-4cb0-9ee5-90e1e6a4d14b','1680774979.616978','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('4ab4c36b-c701-40da-913d-0df6bf0dd0eb','b8580280-d0bd-4527-a143-482cd11dfdbc','1680774979.617025','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('ab92993d-a23a-4c33-8326-40de9a7d5c53','b8580280-d0bd-4527-a143-482cd11dfdbc','1680774973.513868','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('c70d3e93-7e22-4d49-9093-0620cb88a658','b8580280-d0bd-4527-a143-482cd11dfdbc','1680774973.513283','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('feda9644-a3c9-4b4e-bfd5-af1741696bfc','b8580280-d0bd-4527-a143-482cd11dfdbc','1680774979.308586','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('90ac422e-4dff-459b-bdaf-221f13a1a6a3','b8580280-d0bd-4527-a143-482cd11dfdbc','1680774979.328406','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('efdfc22d-86e2-425a-bbf0-60e00bcaa5a6','53f7bcf5-d4da-4357-813d-68a0ea427897','1680774973.514122','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('86b42c70-ae84-453e-bcaf-0415e074dc69','53f7bcf5-d4da-4357-813d-68a0ea427897','1680774979.371036','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('29146ddc-2bb1-4d3c-9a85-84acc03984f5','da90b8f6-abf1-4da7-b6e8-7537eea5ac8b','1680774979.371063','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('d665009e-ce24-490c-bd69-13e5dd461e26','da90b8f6-abf1-4da7-b6e8-7537eea5ac8b','1680774973.5148','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('da2df87b-4d87-469e-92e9-7d036baaf991','da90b8f6-abf1-4da7-b6e8-7537eea5ac8b','1680774973.514223','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f9cef5a9-53ab-45db-9cfb-e3d8daacf04a','da90b8f6-abf1-4da7-b6e8-7537eea5ac8b','1680774979.067976','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('aa335772-8922-4d3a-8af8-00da569c7cb2','da90b8f6-abf1-4da7-b6e8-7537eea5ac8b','1680774979.088093','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('b5669a46-0e3f-42fc-931e-4cc258f622d5','6e8d7433-bd4a-4045-97af-2d849ad75b2a','1680774973.515047','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('a0f4be81-63ff-4d08-8dc4-d2de9e31a4df','6e8d7433-bd4a-4045-97af-2d849ad75b2a','1680774979.130205','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('9e859c09-3777-4789-a03f-f7b7d3eb2e99','2bde9dbd-c688-4b8d-8bba-1efcfc607d29','1680774979.130255','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a16ef351-9adc-4b69-ab5b-7f9c897df245','2bde9dbd-c688-4b8d-8bba-1efcfc607d29','1680774973.515735','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('8015bcd1-b323-4e0f-834f-b708ab4cffba','2bde9dbd-c688-4b8d-8bba-1efcfc607d29','1680774973.515149','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f15cdad9-542d-4fc9-a43a-73e9f06affbd','2bde9dbd-c688-4b8d-8bba-1efcfc607d29','1680774978.827278','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('1c1f4201-65e7-48df-b653-cf3dd4dc3d88','2bde9dbd-c688-4b8d-8bba-1efcfc607d29','1680774978.847809','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a5e0c197-2a4e-4aa7-84cf-28e48fabb48d','e2339107-b615-4ce2-9aaf-ffd5c960dcc5','1680774973.515981','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('455dac52-7d51-4171-ade6-3f26ede47c71','e2339107-b615-4ce2-9aaf-ffd5c960dcc5','1680774978.889815','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('a15e97ba-3637-4d00-aaf7-ce20157ccb38','29d1d52c-2b57-441b-9cc6-8733f90ba2d8','1680774978.889841','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('3c303444-986e-492c-9771-6ec56e71ca79','29d1d52c-2b57-441b-9cc6-8733f90ba2d8','1680774973.516664','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('65cdc084-7461-41e3-bb40-2e3a0662d703','29d1d52c-2b57-441b-9cc6-8733f90ba2d8','1680774973.516078','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('e920392f-050f-45e6-bf35-2c0171800a4f','29d1d52c-2b57-441b-9cc6-8733f90ba2d8','1680774978.585441','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('481ba1c2-5faf-47e9-84e2-6595bf61d164','29d1d52c-2b57-441b-9cc6-8733f90ba2d8','1680774978.605122','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a1762102-c862-40d9-b10f-9b219db97b4a','3827d94b-3b94-41a1-8437-1633ba42e473','1680774973.516908','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('9f561613-8902-4d09-8cea-6ecaafbab08d','3827d94b-3b94-41a1-8437-1633ba42e473','1680774978.647983','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('3f474f04-68ca-4b08-a7c9-21996ed1e575','165937b0-0ee8-401b-ac81-b2eb57151481','1680774978.648025','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f740ee08-1d8b-4aa2-8b8b-0434e1056ab9','165937b0-0ee8-401b-ac81-b2eb57151481','1680774973.517619','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('5821ad78-3792-4e1e-a1b5-78038152b6e6','165937b0-0ee8-401b-ac81-b2eb57151481','1680774973.517024','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('dd2424a6-6ed8-401a-89ff-959275cc3631','165937b0-0ee8-401b-ac81-b2eb57151481','1680774978.343793','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('7ad2b020-3d60-4eb2-9230-029b71f635fa','165937b0-0ee8-401b-ac81-b2eb57151481','1680774978.363812','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('4ebff016-dd4e-457c-b7d0-fd7850392730','fb0801bf-acd9-4481-ac98-cbb259e5e4d7','1680774973.517859','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('4e63709c-52bd-44b4-a0c5-dcf61f85c979','fb0801bf-acd9-4481-ac98-cbb259e5e4d7','1680774978.406558','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('c0e37a19-1f15-4aa0-a815-6f208065b5dc','2b7295a4-2cc1-4d10-b56e-36286d775d81','1680774978.406588','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f57eb5d8-fabc-4daf-acac-82c98c8a81f2','2b7295a4-2cc1-4d10-b56e-36286d775d81','1680774973.518553','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('771c7f7f-7327-4904-ac86-d404707abdab','2b7295a4-2cc1-4d10-b56e-36286d775d81','1680774973.517973','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('dda92ad5-5e11-4027-926f-ba9993eefa3b','2b7295a4-2cc1-4d10-b56e-36286d775d81','1680774978.10311','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('cccba955-d6d9-44cc-94af-42543738e745','2b7295a4-2cc1-4d10-b56e-36286d775d81','1680774978.12328','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('4b8cdadb-4fb9-4cdf-9791-f53de64bd2a6','07593bc7-c4e0-42e5-b9f1-5abad71d268e','1680774973.518772','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('83ba5bbd-78e0-4918-9a5a-17c1112b7ace','07593bc7-c4e0-42e5-b9f1-5abad71d268e','1680774978.166175','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('81a71ace-9cd6-4166-a4bf-0bd4783e9cb1','0bc5b4f8-ffdd-42f3-a1f6-f8dbfeecfdfc','1680774978.166201','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a8bb3081-7e33-44f5-9cd8-be1e953c353b','0bc5b4f8-ffdd-42f3-a1f6-f8dbfeecfdfc','1680774973.51948','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('c9ed9af6-7340-40eb-9074-85f525572f70','0bc5b4f8-ffdd-42f3-a1f6-f8dbfeecfdfc','1680774973.518894','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('512c0399-9f65-4063-88f4-fca1ab922a42','0bc5b4f8-ffdd-42f3-a1f6-f8dbfeecfdfc','1680774977.860174','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a1bd1d35-9a93-49d7-836a-be03161d3982','0bc5b4f8-ffdd-42f3-a1f6-f8dbfeecfdfc','1680774977.879994','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('f95fde68-e3f0-4b91-9a30-b3f443170168','7d847f5c-96b9-4f83-bf1e-060f43df8663','1680774973.519705','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('62ae98e9-12f4-4167-afde-9dca7153148c','7d847f5c-96b9-4f83-bf1e-060f43df8663','1680774977.923538','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('8c0fd538-4a11-4e55-83c8-613f30197872','763464de-8784-43ce-a43f-1d6527ad93cd','1680774977.923579','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('0d59095d-7c89-42e2-8dd8-8664bf811008','763464de-8784-43ce-a43f-1d6527ad93cd','1680774973.52043','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('657b2908-b9c5-4017-9e1d-430f703f080d','763464de-8784-43ce-a43f-1d6527ad93cd','1680774973.519822','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('cb482b4c-00e6-42f5-bf7c-3fe3be46a5c5','763464de-8784-43ce-a43f-1d6527ad93cd','1680774977.601084','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('e492a145-6a8a-4bac-b299-91096251c907','763464de-8784-43ce-a43f-1d6527ad93cd','1680774977.622316','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('c27b9546-3e12-4b61-bb41-c4ebf1ea2362','e2e88c87-6988-4a79-ab20-7c33b16f17cd','1680774973.52067','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('15724871-391e-4d8d-8c91-d4e14d45782c','e2e88c87-6988-4a79-ab20-7c33b16f17cd','1680774977.669843','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('c2b2cd39-2ea2-4558-b704-5677d1738e94','eab33f8b-54da-4875-91eb-a235d280ed65','1680774977.669873','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('ad4eaa4a-8ac3-4e2d-aedc-78e47828e85d','eab33f8b-54da-4875-91eb-a235d280ed65','1680774973.521447','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('95945724-2c16-4e2d-ae61-cefa0ad6a88f','eab33f8b-54da-4875-91eb-a235d280ed65','1680774973.520772','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('c2c44ff6-5f37-4a46-a63f-21cdaedfb891','eab33f8b-54da-4875-91eb-a235d280ed65','1680774977.341774','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('53533774-b166-4704-bd2e-3ea4c88f53da','eab33f8b-54da-4875-91eb-a235d280ed65','1680774977.362833','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('75c2d377-7c3e-4957-9a1c-7d70eec43215','20ec444f-58be-47cd-aa7a-a051181d69ee','1680774973.521674','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('190b9f61-edc7-4159-9771-e9ade6f72f72','20ec444f-58be-47cd-aa7a-a051181d69ee','1680774977.410183','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('076a5110-973b-429e-8d41-ec042c77e307','ecd11ce5-0623-409b-bc6b-6629afcbab3d','1680774977.410224','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('2d0134e6-dad4-498b-97cf-7c8474689a59','ecd11ce5-0623-409b-bc6b-6629afcbab3d','1680774973.522385','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('0bea45ca-7d60-45fc-8d01-819b6d6fb419','ecd11ce5-0623-409b-bc6b-6629afcbab3d','1680774973.521799','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('534d0814-ab2f-4d8d-9a5c-82d782e1102a','ecd11ce5-0623-409b-bc6b-6629afcbab3d','1680774977.100736','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('87c47c02-9076-4a0e-95f5-526fd6680baf','ecd11ce5-0623-409b-bc6b-6629afcbab3d','1680774977.120327','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('d7b0eb1b-96bf-4c0b-9bab-cff53e0b0060','e51cd9a1-211a-4699-9215-fb66fecc9b00','1680774973.522606','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('e55132ec-5a60-4fe4-839e-931f61e0f759','e51cd9a1-211a-4699-9215-fb66fecc9b00','1680774977.16346','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('488f12fb-3bdf-440f-b2ac-9afca1adb6aa','51989e42-aa72-45ce-bd09-86e441f67fce','1680774977.163503','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('6ab3e377-e273-4f98-9aa0-39230a582f77','51989e42-aa72-45ce-bd09-86e441f67fce','1680774973.523299','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('5f9a7de3-d0f1-4e33-b261-35e06de5ba49','51989e42-aa72-45ce-bd09-86e441f67fce','1680774973.522721','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('0e79d9b7-e3b7-4621-b1cb-579abb9a52a8','51989e42-aa72-45ce-bd09-86e441f67fce','1680774976.859395','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('d0eb1599-ae53-4b0d-972d-d8bb052dc357','51989e42-aa72-45ce-bd09-86e441f67fce','1680774976.879526','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('afaec46b-68e8-423a-9106-3e70afcc341a','e58bbb72-6435-47ae-b91c-ea7a42edb8d3','1680774973.52352','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('0ba0b9c5-a807-4a1b-9d39-8b87ea522097','e58bbb72-6435-47ae-b91c-ea7a42edb8d3','1680774976.922054','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('17ef9a29-1b0b-4b9c-af5b-b25b7987b2e6','412f910f-a341-45de-8091-fdd624ca1232','1680774976.922089','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('73a00f7f-da2d-48c0-8a55-52b7de87d91e','412f910f-a341-45de-8091-fdd624ca1232','1680774973.52423','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('6e999ce4-c027-428a-9063-b3c6cb79504c','412f910f-a341-45de-8091-fdd624ca1232','1680774973.523638','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('88ace4ca-d857-4aa4-b1b3-10a6c72bf51d','412f910f-a341-45de-8091-fdd624ca1232','1680774976.619738','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('8d149829-f737-4bb4-98f0-bc5a5b9f980c','412f910f-a341-45de-8091-fdd624ca1232','1680774976.639778','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('c8f0dc4d-705b-42f3-b38b-f205cf6d3186','53c55655-3fc9-4af6-b451-7ae43a7d55a1','1680774973.524475','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('1ca412d0-e0c9-4a01-a774-848d8024ee50','53c55655-3fc9-4af6-b451-7ae43a7d55a1','1680774976.68202','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('527a2650-0e0a-4ac6-a3fd-1d3adfc3b37b','022b8f0d-4dfa-497f-93f9-9827f801e7f8','1680774976.682062','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('70ba180a-6f6d-4cce-8fd6-f30f1a37a4d9','022b8f0d-4dfa-497f-93f9-9827f801e7f8','1680774973.52517','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('7480db13-fcd4-4b58-9ece-9cbf9b27cd6f','022b8f0d-4dfa-497f-93f9-9827f801e7f8','1680774973.524576','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('7e2daafa-6cb4-4dd1-aa76-16491692d37f','022b8f0d-4dfa-497f-93f9-9827f801e7f8','1680774976.379295','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('59d751c5-f8e7-4e03-b9d9-23938dec2f5f','022b8f0d-4dfa-497f-93f9-9827f801e7f8','1680774976.399352','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('2b903067-a2fe-4032-aca1-f10864fd2dad','e0068242-cb74-4e25-98de-48ef8efbb2f4','1680774973.525435','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('f479aeb2-f8b4-4846-9e2b-9c468ae32626','e0068242-cb74-4e25-98de-48ef8efbb2f4','1680774976.441679','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('7790b62e-3127-4dfe-bd25-63c55bcc7209','999c52f3-f161-4ff3-9a96-cdadf8136142','1680774976.441713','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('18fed0bf-b0c9-4ffd-a622-0160b4ade4df','999c52f3-f161-4ff3-9a96-cdadf8136142','1680774973.526106','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('5ed89d73-9a69-4ffb-87ef-6403061ba099','999c52f3-f161-4ff3-9a96-cdadf8136142','1680774973.525535','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('1264ea85-ff16-4cb8-a6c1-a57a3bd95d51','999c52f3-f161-4ff3-9a96-cdadf8136142','1680774976.138522','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('2cffa4c4-d3b3-419a-9244-d06b0d9639cc','999c52f3-f161-4ff3-9a96-cdadf8136142','1680774976.158428','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('ce372aa8-a146-48ce-9f4e-13f0ad658ecb','d391cd32-674b-4478-828a-fe9024b5a165','1680774973.526384','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('022e5876-3f85-474d-8409-27cc9d347818','d391cd32-674b-4478-828a-fe9024b5a165','1680774976.201797','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('137a5fb7-672d-4ba8-8fd6-d6eeef95b8d8','7118f8e3-5f0e-4a6c-8945-cc88311bf1c3','1680774976.201833','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('86e2e0c8-fb0d-40f6-b699-6e55c8530f8d','7118f8e3-5f0e-4a6c-8945-cc88311bf1c3','1680774973.527176','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('444ae7c5-be9b-4e15-b12a-5b8037975047','7118f8e3-5f0e-4a6c-8945-cc88311bf1c3','1680774973.526494','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('8fab2f98-5ab4-49f5-ba38-e615f240d66e','7118f8e3-5f0e-4a6c-8945-cc88311bf1c3','1680774975.898421','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('7c85b6e8-535e-40f8-b546-b365bb8a12ac','7118f8e3-5f0e-4a6c-8945-cc88311bf1c3','1680774975.918912','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a135c4e3-0692-4701-9927-f00c5e08f522','490c1668-5c6c-447b-a0ce-8950290adc46','1680774973.527468','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('aa059160-a7a4-458d-ba9a-85292ef38b2f','490c1668-5c6c-447b-a0ce-8950290adc46','1680774975.960822','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('4673cd95-6704-4ce1-b7ac-4220a432f739','3dcd396b-1703-45ac-84f9-0ebebbee5432','1680774975.960873','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('bda0b562-65b1-4a28-b304-20e118720d85','3dcd396b-1703-45ac-84f9-0ebebbee5432','1680774973.52827','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('67ba3a17-2d96-44c6-ac56-715c2d9e4eaa','3dcd396b-1703-45ac-84f9-0ebebbee5432','1680774973.527619','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('37a79290-c720-4bdb-8ac9-9415622046bc','3dcd396b-1703-45ac-84f9-0ebebbee5432','1680774975.657719','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('4b5cbc3a-81d9-48f1-be13-12fa50a7d631','3dcd396b-1703-45ac-84f9-0ebebbee5432','1680774975.678238','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('3ae87ced-67f0-4139-a2f3-fa022839d350','d01845c6-fe35-4d2a-a180-9fc50a6bb690','1680774973.528556','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('d6265010-98de-4921-90c2-e67b92fea052','d01845c6-fe35-4d2a-a180-9fc50a6bb690','1680774975.720567','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('78d672d5-bf8a-42ad-865f-53513d9277bf','b2b1d75e-a101-4b5a-ab0f-bf8588e9418b','1680774975.720603','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('17139d5b-bf9d-40a7-819c-e1206013c801','b2b1d75e-a101-4b5a-ab0f-bf8588e9418b','1680774973.52926','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('4ab24cbd-b95f-4f07-8f99-d2b02d5d85de','b2b1d75e-a101-4b5a-ab0f-bf8588e9418b','1680774973.528662','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('c58aecd8-a20b-4e56-a2bf-4680fdf61035','b2b1d75e-a101-4b5a-ab0f-bf8588e9418b','1680774975.412866','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('bff1e13b-d699-4428-9d47-14a7e461864a','b2b1d75e-a101-4b5a-ab0f-bf8588e9418b','1680774975.433088','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('96eff822-6866-4d20-9d58-d73ffa1ee3a4','4f99e045-bbac-4c4a-bd6e-4a7f07b998f2','1680774973.52952','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('49572a9f-4731-452b-8091-11eea509ab32','4f99e045-bbac-4c4a-bd6e-4a7f07b998f2','1680774975.475982','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('9c7b341c-cf05-4436-9e1a-691eea4d5547','405e5f01-882e-4265-9625-05cf34e63a07','1680774975.47602','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('6d98e181-1038-4e32-ab76-731e0e95ab17','405e5f01-882e-4265-9625-05cf34e63a07','1680774973.530203','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('bd0385b1-6171-4cdb-90b6-8af7a522127e','405e5f01-882e-4265-9625-05cf34e63a07','1680774973.529626','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('958770b5-3f30-4b0d-8130-b3aec5a7c488','405e5f01-882e-4265-9625-05cf34e63a07','1680774975.170508','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('11342f55-5450-4ce5-be06-ca7cdbc838d7','405e5f01-882e-4265-9625-05cf34e63a07','1680774975.190644','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('e0c11f0e-3a4c-4dc8-ae2d-a26be206f009','01374416-65c5-44e9-8a50-c814f8b8f065','1680774973.530439','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('40047d59-6d4a-4bf7-b2f5-0cb97eebcfa0','01374416-65c5-44e9-8a50-c814f8b8f065','1680774975.234964','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('cfef19d7-256c-4c68-9100-e94badc2135e','9a89938b-2502-4de9-abf1-412a2614250b','1680774975.234997','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a317141c-0514-4b16-9da6-e8498e6b34f7','9a89938b-2502-4de9-abf1-412a2614250b','1680774973.531121','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('57225d10-ffc7-4d95-99a7-92f494ce1f80','9a89938b-2502-4de9-abf1-412a2614250b','1680774973.530536','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('0d6d1a6d-457e-4e91-9353-cb0219882f60','9a89938b-2502-4de9-abf1-412a2614250b','1680774974.927132','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('a5a6548f-b24c-4b07-a5f3-4ad621d3f9cf','9a89938b-2502-4de9-abf1-412a2614250b','1680774974.947354','running_ended','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('5c16f9c1-c333-47a4-b1b7-099f1dd57e95','caabcb64-54c4-41a9-bcf1-5e0e7cc1e5e0','1680774973.531364','invoked','Task invoked in parsl monitoring.db');
+INSERT INTO "event" VALUES('c137750e-3dc1-4ce8-a3aa-9a8b885851cc','caabcb64-54c4-41a9-bcf1-5e0e7cc1e5e0','1680774974.991019','returned','Task returned in parsl monitoring.db');
+INSERT INTO "event" VALUES('70104ba4-45df-4c1b-91d7-e560b65ecc27','9291d57a-3381-4159-a349-14d1f61d1af3','1680774974.991079','exec_done','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('887bf166-556a-4176-a95e-9e7ada1670ca','9291d57a-3381-4159-a349-14d1f61d1af3','1680774973.532055','launched','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('4810a6bb-bad4-4020-974b-4f2f0797ea5b','9291d57a-3381-4159-a349-14d1f61d1af3','1680774973.531465','pending','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('2cce6bd1-89aa-4a24-818c-3ea66fd12c31','9291d57a-3381-4159-a349-14d1f61d1af3','1680774974.687603','running','Status in parsl monitoring.db');
+INSERT INTO "event" VALUES('368abc30-c527-42a2-9de1-7d1f17fa9604','9291d57a-3381-4159-a349-14d1f61d1af3','1680774974.7075','running_ended','Status in parsl monitoring.db');
+CREATE TABLE facet (left_uuid TEXT REFERENCES span(uuid),right_uuid TEXT REFERENCES span (uuid),note TEXT);
+CREATE TABLE span (uuid TEXT PRIMARY KEY,type TEXT NOT NULL,note TEXT);
+INSERT INTO "span" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','parsl.monitoring.workflow','Workflow from parsl monitoring.db');
+INSERT INTO "span" VALUES('91f49fe2-a670-46e6-9243-fb63d13a8af3','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('631e2f6e-5846-4001-83cb-8d27c21f2613','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('8043ba33-e6ba-402a-be9b-b7b39377850f','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('28569b18-f586-4b16-be73-7fa846ff1a0d','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('1aa39661-0bad-4996-9b3a-7415765eba42','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('ae2c6fed-3c4d-4bee-ad93-2512a1b02f93','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('8bbd185d-f471-412d-a3e0-a40251cc7ba2','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('a13dd61b-e7b6-4cf0-95c1-2ec5b2e57325','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('b409da93-fb4e-49a1-b88c-dc35d002de91','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('36dea544-1790-4b35-8fb0-b052769e1f4d','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('24b66cae-1232-435c-9457-c0b159782ede','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('468fa780-5730-484c-887f-f4ba19bec3f5','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('9ea56f72-9906-44ac-a0ab-1687e2166c7b','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('6769f31c-bffc-407e-985f-87012acc26a6','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('bac81e4c-b211-492f-b065-b5f230f47cc6','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('319c4939-f262-4b16-befe-c1610695fa26','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('e3bc84ee-8334-4963-9964-96e290c55def','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('335ee18e-bd2b-4d94-aef4-1789df6becf8','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('6aa4c939-60a0-4bc5-a080-363c2ee1b673','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('c1b55ed1-9597-4388-9a69-be4d36fd60a8','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('7c27eb82-28e2-46ad-89f3-b85250f54a6e','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('ca930cc1-4849-4f9e-9f27-228e3efd45c3','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('9b3f68c5-dd00-4f2e-abde-4dd21ccdd20c','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('8f744caf-4e74-44bc-8a0e-daf63e782317','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('2d20e657-b7ea-46b2-872e-35fbdf492515','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('9924e057-e4e5-4b85-ac2d-6ac7470c4eea','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('8b561ee7-1714-490c-867f-ddc73640f519','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('21a3c145-a77a-4c47-9ac8-5ae479c27f25','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('27e53605-12b1-4654-bd8c-692c51df390a','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('53f05eeb-7a95-4474-8616-1c72215c08b3','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('6376f681-3b07-4437-9e7f-5f491341afba','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('54b91219-b3af-4734-999f-3cd925e883e8','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('c265b263-bd55-4b4e-a46e-8a6a41d3a863','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('d240c073-84eb-4dcb-84ff-0bb19db247fd','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('7da9ece7-2da1-4969-afbe-7af81a52d35b','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('3c9aa2aa-968c-45cf-ba86-c093929d2bec','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('fa5133d6-77c1-4865-97cc-3568eac07e0f','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('830032d9-4236-4301-9f2f-ebef277a13d0','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('ecfd3daa-dc65-4f6a-936c-bd2b39cdd270','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('a6aa15dc-3bae-4cc9-bb9c-f57e20c12925','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('5ac80f6c-9c8c-42a5-8112-27be03633e1a','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('63336b4a-61d0-4388-89e1-aa4dc63f6973','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('484ee455-5b29-4ea6-a757-7d0201cc12d5','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('8fdd4fd6-c62e-4255-b409-36c0af855af1','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('18859ae7-79f9-4b98-a1b3-b08266e829ac','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('5c1d4981-e321-4c81-81b0-f1636ad9e1f1','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('c4376650-dece-4714-a0fc-bc068bcf58e7','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('1c907fdc-138a-443a-b36c-dc7e6596ee3a','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('8f7fd8d4-5488-421f-9d5d-f86aa9770c92','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('1e023fbf-5020-4bb5-9ea9-da89aec96d13','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('3547c2ac-848d-4773-b366-53dde5acdaab','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('d6449581-9aa4-433c-a962-19f25df1bd8e','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('b78d50a9-c7f4-478c-b3c9-b42569a5342b','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('e787aabd-73bd-4be7-89b1-16dea87c4af5','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('3d9b8c0f-e7a3-4839-8161-6e5cd214578c','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('2f2be627-a4fa-4e56-9c67-7fb7299599d9','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('cfb04a34-62ef-40c3-87ae-85165b995c8b','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('97df5711-6599-4e20-8eb0-629d656f725a','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('c47d0fb0-2927-4a68-8fae-d776a020f4e1','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('f70a80f3-b665-4533-b7a8-cd49fe7f0464','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('20e77d26-ba42-4cb0-9ee5-90e1e6a4d14b','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('b8580280-d0bd-4527-a143-482cd11dfdbc','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('53f7bcf5-d4da-4357-813d-68a0ea427897','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('da90b8f6-abf1-4da7-b6e8-7537eea5ac8b','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('6e8d7433-bd4a-4045-97af-2d849ad75b2a','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('2bde9dbd-c688-4b8d-8bba-1efcfc607d29','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('e2339107-b615-4ce2-9aaf-ffd5c960dcc5','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('29d1d52c-2b57-441b-9cc6-8733f90ba2d8','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('3827d94b-3b94-41a1-8437-1633ba42e473','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('165937b0-0ee8-401b-ac81-b2eb57151481','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('fb0801bf-acd9-4481-ac98-cbb259e5e4d7','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('2b7295a4-2cc1-4d10-b56e-36286d775d81','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('07593bc7-c4e0-42e5-b9f1-5abad71d268e','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('0bc5b4f8-ffdd-42f3-a1f6-f8dbfeecfdfc','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('7d847f5c-96b9-4f83-bf1e-060f43df8663','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('763464de-8784-43ce-a43f-1d6527ad93cd','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('e2e88c87-6988-4a79-ab20-7c33b16f17cd','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('eab33f8b-54da-4875-91eb-a235d280ed65','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('20ec444f-58be-47cd-aa7a-a051181d69ee','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('ecd11ce5-0623-409b-bc6b-6629afcbab3d','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('e51cd9a1-211a-4699-9215-fb66fecc9b00','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('51989e42-aa72-45ce-bd09-86e441f67fce','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('e58bbb72-6435-47ae-b91c-ea7a42edb8d3','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('412f910f-a341-45de-8091-fdd624ca1232','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('53c55655-3fc9-4af6-b451-7ae43a7d55a1','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('022b8f0d-4dfa-497f-93f9-9827f801e7f8','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('e0068242-cb74-4e25-98de-48ef8efbb2f4','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('999c52f3-f161-4ff3-9a96-cdadf8136142','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('d391cd32-674b-4478-828a-fe9024b5a165','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('7118f8e3-5f0e-4a6c-8945-cc88311bf1c3','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('490c1668-5c6c-447b-a0ce-8950290adc46','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('3dcd396b-1703-45ac-84f9-0ebebbee5432','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('d01845c6-fe35-4d2a-a180-9fc50a6bb690','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('b2b1d75e-a101-4b5a-ab0f-bf8588e9418b','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('4f99e045-bbac-4c4a-bd6e-4a7f07b998f2','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('405e5f01-882e-4265-9625-05cf34e63a07','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('01374416-65c5-44e9-8a50-c814f8b8f065','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('9a89938b-2502-4de9-abf1-412a2614250b','parsl.monitoring.try','Try from parsl monitoring.db');
+INSERT INTO "span" VALUES('caabcb64-54c4-41a9-bcf1-5e0e7cc1e5e0','parsl.monitoring.task','Task from parsl monitoring.db');
+INSERT INTO "span" VALUES('9291d57a-3381-4159-a349-14d1f61d1af3','parsl.monitoring.try','Try from parsl monitoring.db');
+CREATE TABLE subspan (superspan_uuid TEXT REFERENCES span(uuid),subspan_uuid TEXT REFERENCES span (uuid),key TEXT NOT NULL,note TEXT);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','91f49fe2-a670-46e6-9243-fb63d13a8af3','0',NULL);
+INSERT INTO "subspan" VALUES('91f49fe2-a670-46e6-9243-fb63d13a8af3','631e2f6e-5846-4001-83cb-8d27c21f2613','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','8043ba33-e6ba-402a-be9b-b7b39377850f','1',NULL);
+INSERT INTO "subspan" VALUES('8043ba33-e6ba-402a-be9b-b7b39377850f','28569b18-f586-4b16-be73-7fa846ff1a0d','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','1aa39661-0bad-4996-9b3a-7415765eba42','2',NULL);
+INSERT INTO "subspan" VALUES('1aa39661-0bad-4996-9b3a-7415765eba42','ae2c6fed-3c4d-4bee-ad93-2512a1b02f93','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','8bbd185d-f471-412d-a3e0-a40251cc7ba2','3',NULL);
+INSERT INTO "subspan" VALUES('8bbd185d-f471-412d-a3e0-a40251cc7ba2','a13dd61b-e7b6-4cf0-95c1-2ec5b2e57325','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','b409da93-fb4e-49a1-b88c-dc35d002de91','4',NULL);
+INSERT INTO "subspan" VALUES('b409da93-fb4e-49a1-b88c-dc35d002de91','36dea544-1790-4b35-8fb0-b052769e1f4d','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','24b66cae-1232-435c-9457-c0b159782ede','5',NULL);
+INSERT INTO "subspan" VALUES('24b66cae-1232-435c-9457-c0b159782ede','468fa780-5730-484c-887f-f4ba19bec3f5','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','9ea56f72-9906-44ac-a0ab-1687e2166c7b','6',NULL);
+INSERT INTO "subspan" VALUES('9ea56f72-9906-44ac-a0ab-1687e2166c7b','6769f31c-bffc-407e-985f-87012acc26a6','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','bac81e4c-b211-492f-b065-b5f230f47cc6','7',NULL);
+INSERT INTO "subspan" VALUES('bac81e4c-b211-492f-b065-b5f230f47cc6','319c4939-f262-4b16-befe-c1610695fa26','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','e3bc84ee-8334-4963-9964-96e290c55def','8',NULL);
+INSERT INTO "subspan" VALUES('e3bc84ee-8334-4963-9964-96e290c55def','335ee18e-bd2b-4d94-aef4-1789df6becf8','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','6aa4c939-60a0-4bc5-a080-363c2ee1b673','9',NULL);
+INSERT INTO "subspan" VALUES('6aa4c939-60a0-4bc5-a080-363c2ee1b673','c1b55ed1-9597-4388-9a69-be4d36fd60a8','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','7c27eb82-28e2-46ad-89f3-b85250f54a6e','10',NULL);
+INSERT INTO "subspan" VALUES('7c27eb82-28e2-46ad-89f3-b85250f54a6e','ca930cc1-4849-4f9e-9f27-228e3efd45c3','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','9b3f68c5-dd00-4f2e-abde-4dd21ccdd20c','11',NULL);
+INSERT INTO "subspan" VALUES('9b3f68c5-dd00-4f2e-abde-4dd21ccdd20c','8f744caf-4e74-44bc-8a0e-daf63e782317','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','2d20e657-b7ea-46b2-872e-35fbdf492515','12',NULL);
+INSERT INTO "subspan" VALUES('2d20e657-b7ea-46b2-872e-35fbdf492515','9924e057-e4e5-4b85-ac2d-6ac7470c4eea','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','8b561ee7-1714-490c-867f-ddc73640f519','13',NULL);
+INSERT INTO "subspan" VALUES('8b561ee7-1714-490c-867f-ddc73640f519','21a3c145-a77a-4c47-9ac8-5ae479c27f25','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','27e53605-12b1-4654-bd8c-692c51df390a','14',NULL);
+INSERT INTO "subspan" VALUES('27e53605-12b1-4654-bd8c-692c51df390a','53f05eeb-7a95-4474-8616-1c72215c08b3','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','6376f681-3b07-4437-9e7f-5f491341afba','15',NULL);
+INSERT INTO "subspan" VALUES('6376f681-3b07-4437-9e7f-5f491341afba','54b91219-b3af-4734-999f-3cd925e883e8','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','c265b263-bd55-4b4e-a46e-8a6a41d3a863','16',NULL);
+INSERT INTO "subspan" VALUES('c265b263-bd55-4b4e-a46e-8a6a41d3a863','d240c073-84eb-4dcb-84ff-0bb19db247fd','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','7da9ece7-2da1-4969-afbe-7af81a52d35b','17',NULL);
+INSERT INTO "subspan" VALUES('7da9ece7-2da1-4969-afbe-7af81a52d35b','3c9aa2aa-968c-45cf-ba86-c093929d2bec','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','fa5133d6-77c1-4865-97cc-3568eac07e0f','18',NULL);
+INSERT INTO "subspan" VALUES('fa5133d6-77c1-4865-97cc-3568eac07e0f','830032d9-4236-4301-9f2f-ebef277a13d0','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','ecfd3daa-dc65-4f6a-936c-bd2b39cdd270','19',NULL);
+INSERT INTO "subspan" VALUES('ecfd3daa-dc65-4f6a-936c-bd2b39cdd270','a6aa15dc-3bae-4cc9-bb9c-f57e20c12925','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','5ac80f6c-9c8c-42a5-8112-27be03633e1a','20',NULL);
+INSERT INTO "subspan" VALUES('5ac80f6c-9c8c-42a5-8112-27be03633e1a','63336b4a-61d0-4388-89e1-aa4dc63f6973','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','484ee455-5b29-4ea6-a757-7d0201cc12d5','21',NULL);
+INSERT INTO "subspan" VALUES('484ee455-5b29-4ea6-a757-7d0201cc12d5','8fdd4fd6-c62e-4255-b409-36c0af855af1','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','18859ae7-79f9-4b98-a1b3-b08266e829ac','22',NULL);
+INSERT INTO "subspan" VALUES('18859ae7-79f9-4b98-a1b3-b08266e829ac','5c1d4981-e321-4c81-81b0-f1636ad9e1f1','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','c4376650-dece-4714-a0fc-bc068bcf58e7','23',NULL);
+INSERT INTO "subspan" VALUES('c4376650-dece-4714-a0fc-bc068bcf58e7','1c907fdc-138a-443a-b36c-dc7e6596ee3a','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','8f7fd8d4-5488-421f-9d5d-f86aa9770c92','24',NULL);
+INSERT INTO "subspan" VALUES('8f7fd8d4-5488-421f-9d5d-f86aa9770c92','1e023fbf-5020-4bb5-9ea9-da89aec96d13','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','3547c2ac-848d-4773-b366-53dde5acdaab','25',NULL);
+INSERT INTO "subspan" VALUES('3547c2ac-848d-4773-b366-53dde5acdaab','d6449581-9aa4-433c-a962-19f25df1bd8e','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','b78d50a9-c7f4-478c-b3c9-b42569a5342b','26',NULL);
+INSERT INTO "subspan" VALUES('b78d50a9-c7f4-478c-b3c9-b42569a5342b','e787aabd-73bd-4be7-89b1-16dea87c4af5','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','3d9b8c0f-e7a3-4839-8161-6e5cd214578c','27',NULL);
+INSERT INTO "subspan" VALUES('3d9b8c0f-e7a3-4839-8161-6e5cd214578c','2f2be627-a4fa-4e56-9c67-7fb7299599d9','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','cfb04a34-62ef-40c3-87ae-85165b995c8b','28',NULL);
+INSERT INTO "subspan" VALUES('cfb04a34-62ef-40c3-87ae-85165b995c8b','97df5711-6599-4e20-8eb0-629d656f725a','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','c47d0fb0-2927-4a68-8fae-d776a020f4e1','29',NULL);
+INSERT INTO "subspan" VALUES('c47d0fb0-2927-4a68-8fae-d776a020f4e1','f70a80f3-b665-4533-b7a8-cd49fe7f0464','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','20e77d26-ba42-4cb0-9ee5-90e1e6a4d14b','30',NULL);
+INSERT INTO "subspan" VALUES('20e77d26-ba42-4cb0-9ee5-90e1e6a4d14b','b8580280-d0bd-4527-a143-482cd11dfdbc','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','53f7bcf5-d4da-4357-813d-68a0ea427897','31',NULL);
+INSERT INTO "subspan" VALUES('53f7bcf5-d4da-4357-813d-68a0ea427897','da90b8f6-abf1-4da7-b6e8-7537eea5ac8b','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','6e8d7433-bd4a-4045-97af-2d849ad75b2a','32',NULL);
+INSERT INTO "subspan" VALUES('6e8d7433-bd4a-4045-97af-2d849ad75b2a','2bde9dbd-c688-4b8d-8bba-1efcfc607d29','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','e2339107-b615-4ce2-9aaf-ffd5c960dcc5','33',NULL);
+INSERT INTO "subspan" VALUES('e2339107-b615-4ce2-9aaf-ffd5c960dcc5','29d1d52c-2b57-441b-9cc6-8733f90ba2d8','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','3827d94b-3b94-41a1-8437-1633ba42e473','34',NULL);
+INSERT INTO "subspan" VALUES('3827d94b-3b94-41a1-8437-1633ba42e473','165937b0-0ee8-401b-ac81-b2eb57151481','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','fb0801bf-acd9-4481-ac98-cbb259e5e4d7','35',NULL);
+INSERT INTO "subspan" VALUES('fb0801bf-acd9-4481-ac98-cbb259e5e4d7','2b7295a4-2cc1-4d10-b56e-36286d775d81','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','07593bc7-c4e0-42e5-b9f1-5abad71d268e','36',NULL);
+INSERT INTO "subspan" VALUES('07593bc7-c4e0-42e5-b9f1-5abad71d268e','0bc5b4f8-ffdd-42f3-a1f6-f8dbfeecfdfc','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','7d847f5c-96b9-4f83-bf1e-060f43df8663','37',NULL);
+INSERT INTO "subspan" VALUES('7d847f5c-96b9-4f83-bf1e-060f43df8663','763464de-8784-43ce-a43f-1d6527ad93cd','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','e2e88c87-6988-4a79-ab20-7c33b16f17cd','38',NULL);
+INSERT INTO "subspan" VALUES('e2e88c87-6988-4a79-ab20-7c33b16f17cd','eab33f8b-54da-4875-91eb-a235d280ed65','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','20ec444f-58be-47cd-aa7a-a051181d69ee','39',NULL);
+INSERT INTO "subspan" VALUES('20ec444f-58be-47cd-aa7a-a051181d69ee','ecd11ce5-0623-409b-bc6b-6629afcbab3d','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','e51cd9a1-211a-4699-9215-fb66fecc9b00','40',NULL);
+INSERT INTO "subspan" VALUES('e51cd9a1-211a-4699-9215-fb66fecc9b00','51989e42-aa72-45ce-bd09-86e441f67fce','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','e58bbb72-6435-47ae-b91c-ea7a42edb8d3','41',NULL);
+INSERT INTO "subspan" VALUES('e58bbb72-6435-47ae-b91c-ea7a42edb8d3','412f910f-a341-45de-8091-fdd624ca1232','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','53c55655-3fc9-4af6-b451-7ae43a7d55a1','42',NULL);
+INSERT INTO "subspan" VALUES('53c55655-3fc9-4af6-b451-7ae43a7d55a1','022b8f0d-4dfa-497f-93f9-9827f801e7f8','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','e0068242-cb74-4e25-98de-48ef8efbb2f4','43',NULL);
+INSERT INTO "subspan" VALUES('e0068242-cb74-4e25-98de-48ef8efbb2f4','999c52f3-f161-4ff3-9a96-cdadf8136142','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','d391cd32-674b-4478-828a-fe9024b5a165','44',NULL);
+INSERT INTO "subspan" VALUES('d391cd32-674b-4478-828a-fe9024b5a165','7118f8e3-5f0e-4a6c-8945-cc88311bf1c3','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','490c1668-5c6c-447b-a0ce-8950290adc46','45',NULL);
+INSERT INTO "subspan" VALUES('490c1668-5c6c-447b-a0ce-8950290adc46','3dcd396b-1703-45ac-84f9-0ebebbee5432','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','d01845c6-fe35-4d2a-a180-9fc50a6bb690','46',NULL);
+INSERT INTO "subspan" VALUES('d01845c6-fe35-4d2a-a180-9fc50a6bb690','b2b1d75e-a101-4b5a-ab0f-bf8588e9418b','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','4f99e045-bbac-4c4a-bd6e-4a7f07b998f2','47',NULL);
+INSERT INTO "subspan" VALUES('4f99e045-bbac-4c4a-bd6e-4a7f07b998f2','405e5f01-882e-4265-9625-05cf34e63a07','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','01374416-65c5-44e9-8a50-c814f8b8f065','48',NULL);
+INSERT INTO "subspan" VALUES('01374416-65c5-44e9-8a50-c814f8b8f065','9a89938b-2502-4de9-abf1-412a2614250b','0',NULL);
+INSERT INTO "subspan" VALUES('4daa50f1-2ca6-4953-9f17-8fa9da291770','caabcb64-54c4-41a9-bcf1-5e0e7cc1e5e0','49',NULL);
+INSERT INTO "subspan" VALUES('caabcb64-54c4-41a9-bcf1-5e0e7cc1e5e0','9291d57a-3381-4159-a349-14d1f61d1af3','0',NULL);
+CREATE INDEX span_uuids on event (span_uuid);
+CREATE INDEX subspan_uuids_super on subspan (superspan_uuid);
+CREATE INDEX subspan_uuids_sub on subspan (subspan_uuid);
+COMMIT;
@@ -0,0 +1,43 @@
+# Imports a copy of transaction_log with a record of each kind cut short,
+# as a log which is read while it is being written can be, and checks that
+# the cut records are skipped and everything else is imported.
+
+import sqlite3
+
+from dnpcsql.importerlib import BatchWriter
+from dnpcsql.schema import init_sql
+from dnpcsql.workqueue import import_all
+
+cut_records = ["1680774974485000 372 TASK 2 WAITING f",
+               "1680774974485000 372 TASK 2 RUNNING 172.17.0.2:60778",
+               "1680774974485000 372 TASK 2 DONE SUCCESS 0 {",
+               "1680774974485000 372 TASK 2 RETRIEVED SUCCESS",
+               "1680774974485000 372 TRANSFER INPUT 2 1 0.25",
+               "1680774974485000 372 WORKER worker-1 RESOURCES",
+               "1680774974485000 372 WORKER worker-1 RESOURCES {\"cores\":[8,",
+               "1680774974485000 372 CATEGORY f FIRST",
+               "1680774974485000 372 CATEGORY f MAX"]
+
+with open("./transaction_log") as f:
+    lines = f.readlines()
+
+with open("./malformed_transaction_log", "w") as f:
+    f.writelines(lines[:len(lines) // 2])
+    f.writelines(record + "\n" for record in cut_records)
+    f.writelines(lines[len(lines) // 2:])
+
+
+def import_log(db_path: str, log_path: str) -> sqlite3.Connection:
+    connection = init_sql(db_path)
+    import_all(BatchWriter(connection), log_path)
+    return connection
+
+
+for (db_path, log_path) in [("intact.sqlite3", "./transaction_log"),
+                            ("malformed.sqlite3", "./malformed_transaction_log")]:
+    connection = import_log(db_path, log_path)
+    (spans,) = connection.execute("SELECT count(*) FROM span").fetchone()
+    (events,) = connection.execute("SELECT count(*) FROM event").fetchone()
+    (attributes,) = connection.execute("SELECT count(*) FROM event_attribute").fetchone()
+    print(f"{log_path}: {spans} spans, {events} events, {attributes} event attributes")
+    connection.close()
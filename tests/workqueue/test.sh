@@ -1,6 +1,13 @@
 #!/bin/bash -ex
 
-rm -f dnpc.sqlite3
+rm -f dnpc.sqlite3 intact.sqlite3 malformed.sqlite3 malformed_transaction_log *.out
+
+# records which are cut short are skipped with a warning, rather than
+# stopping the import
+python3 ./import_wq_malformed.py > import_wq_malformed.out 2> import_wq_malformed_warnings.out
+diff import_wq_malformed.out import_wq_malformed.out.expected
+diff import_wq_malformed_warnings.out import_wq_malformed_warnings.out.expected
+rm -f intact.sqlite3 malformed.sqlite3 malformed_transaction_log
 
 # there's no CLI for this - the raw WQ importer is exposed only through the
 # Python API